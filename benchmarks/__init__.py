@@ -0,0 +1 @@
+"""Performance benchmarks driven through the page objects"""
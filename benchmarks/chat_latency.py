@@ -0,0 +1,156 @@
+"""Chat latency benchmark built on send_message_and_get_response
+
+Usage:
+    python -m benchmarks.chat_latency --url stub --device mobile --iterations 20 --concurrency 2
+
+Each worker owns one browser and, for every prompt, starts a fresh chat,
+selects a model and times send_message_and_get_response. Per-request
+metrics are written to CSV and their p50/p95/p99 to JSON.
+
+Metrics (seconds, measured from the moment the response wait starts; the
+names are the response waiter's):
+    time_to_image         /ollama.png reply bubble appears
+    time_to_first_token   first response text is rendered
+    time_to_complete      response text stops changing
+    chars_per_second      response length / time_to_complete
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.driver_factory import DriverFactory
+from utils.stub_server import StubOllamaServer
+from pages.page_factory import PageFactory
+from benchmarks.stats import summarize_records, write_csv, write_json
+
+DEFAULT_CORPUS = [
+    "Say hello",
+    "What is the capital of France?",
+    "Write a haiku about the sea.",
+    "Explain recursion in one paragraph.",
+]
+
+METRIC_FIELDS = ['time_to_image', 'time_to_first_token', 'time_to_complete', 'total', 'chars_per_second']
+
+
+def load_corpus(path):
+    """One prompt per non-empty line; the built-in corpus when no path is given"""
+    if not path:
+        return list(DEFAULT_CORPUS)
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def measure_prompt(chat_page, url, prompt, timeout):
+    """Run one prompt in a fresh chat and return its metrics record"""
+    chat_page.navigate_to(url)
+    chat_page.clear_app_state()
+    chat_page.select_model()
+
+    start = time.monotonic()
+    texts = chat_page.send_message_and_get_response(prompt, timeout)
+    total = time.monotonic() - start
+
+    metrics = chat_page.last_response_metrics or {}
+    chars = sum(len(t) for t in texts)
+    complete = metrics.get('time_to_complete')
+    return {
+        'prompt': prompt,
+        'ok': bool(texts) and not metrics.get('timed_out'),
+        'chars': chars,
+        'time_to_image': metrics.get('time_to_image'),
+        'time_to_first_token': metrics.get('time_to_first_token'),
+        'time_to_complete': complete,
+        'total': total,
+        'chars_per_second': chars / complete if complete else None,
+    }
+
+
+def run_worker(worker_id, prompts, url, browser, device, headless, timeout):
+    """Drive one browser through its share of prompts"""
+    driver = DriverFactory.create_driver_for_device(browser=browser, headless=headless, device_name=device)
+    records = []
+    try:
+        chat_page = PageFactory.create_chat_page(driver)
+        for prompt in prompts:
+            try:
+                record = measure_prompt(chat_page, url, prompt, timeout)
+            except Exception as e:
+                print(f"Worker {worker_id}: prompt failed: {e}")
+                record = {'prompt': prompt, 'ok': False, 'error': str(e)}
+            record.update({'worker': worker_id, 'device': device, 'browser': browser})
+            records.append(record)
+    finally:
+        driver.quit()
+    return records
+
+
+def run_benchmark(url, corpus, iterations=None, concurrency=1, browser='chrome', device='desktop',
+                  headless=True, timeout=60):
+    """Run the corpus (repeated to iterations prompts) across concurrency browsers"""
+    iterations = iterations or len(corpus)
+    prompts = [corpus[i % len(corpus)] for i in range(iterations)]
+    shards = [prompts[i::concurrency] for i in range(concurrency)]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(run_worker, i, shard, url, browser, device, headless, timeout)
+            for i, shard in enumerate(shards) if shard
+        ]
+        records = [r for f in futures for r in f.result()]
+
+    ok = [r for r in records if r.get('ok')]
+    summary = {
+        'config': {
+            'url': url, 'browser': browser, 'device': device,
+            'iterations': iterations, 'concurrency': concurrency,
+        },
+        'requests': len(records),
+        'errors': len(records) - len(ok),
+        'metrics': summarize_records(ok, METRIC_FIELDS),
+    }
+    return records, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=os.getenv('OLLAMA_URL', 'http://localhost:3000/'),
+                        help="UI base URL, or 'stub' to benchmark against the local stub server")
+    parser.add_argument('--corpus', help='File with one prompt per line')
+    parser.add_argument('--iterations', type=int, default=None)
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--browser', default=os.getenv('BROWSER', 'chrome'))
+    parser.add_argument('--device', default=os.getenv('DEVICE', 'desktop'))
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--output-dir', default='benchmark-results')
+    args = parser.parse_args(argv)
+
+    stub = StubOllamaServer().start() if args.url == 'stub' else None
+    url = stub.url if stub else args.url
+    try:
+        records, summary = run_benchmark(
+            url, load_corpus(args.corpus), args.iterations, args.concurrency,
+            args.browser, args.device, not args.headed, args.timeout,
+        )
+    finally:
+        if stub:
+            stub.stop()
+
+    write_csv(os.path.join(args.output_dir, 'chat_latency.csv'), records)
+    write_json(os.path.join(args.output_dir, 'chat_latency.json'), summary)
+    for field, stats in summary['metrics'].items():
+        if stats['count']:
+            print(f"{field:22s} p50={stats['p50']:.3f} p95={stats['p95']:.3f} p99={stats['p99']:.3f}")
+    return 0 if summary['errors'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
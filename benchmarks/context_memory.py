@@ -0,0 +1,110 @@
+"""Peak memory of N isolated sessions: one browser each vs. browser contexts in one Chrome
+
+Usage:
+    python -m benchmarks.context_memory --url stub --sessions 4 8 16
+
+For every session count both modes open that many isolated sessions at the
+same time, load the app in each and record the peak memory of all browser
+process trees (chromedriver and its descendants). Results are written to
+JSON and printed as a table.
+
+    browser   one webdriver.Chrome per session (the per-test baseline)
+    context   one webdriver.Chrome, one CDP browser context per session
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.driver_factory import DriverFactory
+from utils.process_stats import MemorySampler, driver_pid
+from utils.stub_server import StubOllamaServer
+from benchmarks.stats import write_json
+
+
+def _load(driver, url, settle):
+    driver.get(url)
+    time.sleep(settle)
+
+
+def measure_browsers(url, sessions, device, headless, settle=1.0):
+    """Peak memory with one browser per session"""
+    drivers = []
+    sampler = MemorySampler(interval=0.25).start()
+    start = time.monotonic()
+    try:
+        for _ in range(sessions):
+            driver = DriverFactory.create_driver_for_device('chrome', headless, device)
+            drivers.append(driver)
+            sampler.pids.append(driver_pid(driver))
+            _load(driver, url, settle)
+        elapsed = time.monotonic() - start
+    finally:
+        peak = sampler.stop()
+        for driver in drivers:
+            driver.quit()
+    return dict(peak, mode='browser', sessions=sessions, setup_seconds=round(elapsed, 2))
+
+
+def measure_contexts(url, sessions, device, headless, settle=1.0):
+    """Peak memory with every session in its own context of one browser"""
+    driver = DriverFactory.create_driver_for_device('chrome', headless, device)
+    sampler = MemorySampler([driver_pid(driver)], interval=0.25).start()
+    contexts = []
+    start = time.monotonic()
+    try:
+        for _ in range(sessions):
+            context = DriverFactory.open_browser_context(driver)
+            contexts.append(context)
+            _load(driver, url, settle)
+        elapsed = time.monotonic() - start
+    finally:
+        peak = sampler.stop()
+        for context in contexts:
+            context.close()
+        driver.quit()
+    return dict(peak, mode='context', sessions=sessions, setup_seconds=round(elapsed, 2))
+
+
+def run_benchmark(url, session_counts, device='desktop', headless=True, settle=1.0):
+    results = []
+    for sessions in session_counts:
+        results.append(measure_browsers(url, sessions, device, headless, settle))
+        results.append(measure_contexts(url, sessions, device, headless, settle))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=os.getenv('OLLAMA_URL', 'http://localhost:3000/'),
+                        help="UI base URL, or 'stub' to benchmark against the local stub server")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument('--device', default=os.getenv('DEVICE', 'desktop'))
+    parser.add_argument('--settle', type=float, default=1.0, help='Seconds to let each page finish loading')
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--output-dir', default='benchmark-results')
+    args = parser.parse_args(argv)
+
+    stub = StubOllamaServer().start() if args.url == 'stub' else None
+    url = stub.url if stub else args.url
+    try:
+        results = run_benchmark(url, args.sessions, args.device, not args.headed, args.settle)
+    finally:
+        if stub:
+            stub.stop()
+
+    write_json(os.path.join(args.output_dir, 'context_memory.json'), results)
+    print(f"{'mode':8s} {'sessions':>8s} {'procs':>6s} {'peak RSS MB':>12s} {'peak PSS MB':>12s} {'setup s':>8s}")
+    for r in results:
+        print(f"{r['mode']:8s} {r['sessions']:8d} {r['processes']:6d} {r['rss_mb']:12.1f} "
+              f"{r['pss_mb']:12.1f} {r['setup_seconds']:8.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
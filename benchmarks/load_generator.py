@@ -0,0 +1,215 @@
+"""Concurrent multi-session load generator driving real browsers
+
+Usage:
+    python -m benchmarks.load_generator --url stub --stages 1:30,2:30,4:30,8:30 --max-browsers 8
+
+Every session is a headless browser running the normal page-object flow
+(create_chat_page, select_model, enter_prompt, submit_prompt,
+wait_for_response) in a loop with think time between prompts. Stages
+raise the number of concurrent sessions step by step; at most
+--max-browsers browsers run at once. The report gives latency
+percentiles per concurrency level and the first level at which p95
+latency degrades beyond --degrade-factor times the single-session
+baseline.
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.driver_factory import DriverFactory
+from utils.stub_server import StubOllamaServer
+from pages.page_factory import PageFactory
+from benchmarks.chat_latency import DEFAULT_CORPUS, load_corpus
+from benchmarks.stats import summarize, write_csv, write_json
+
+
+def parse_stages(spec):
+    """Parse 'sessions:seconds,...' into [(sessions, seconds), ...]"""
+    stages = []
+    for part in spec.split(','):
+        sessions, seconds = part.split(':')
+        stages.append((int(sessions), float(seconds)))
+    return stages
+
+
+class LoadGenerator:
+    """Runs browser sessions according to a ramp-up schedule"""
+
+    def __init__(self, url, stages, corpus=None, max_browsers=8, think_time=(1.0, 3.0),
+                 browser='chrome', device='desktop', headless=True, timeout=60):
+        self.url = url
+        self.stages = stages
+        self.corpus = corpus or list(DEFAULT_CORPUS)
+        self.max_browsers = max_browsers
+        self.think_time = think_time
+        self.browser = browser
+        self.device = device
+        self.headless = headless
+        self.timeout = timeout
+        self.records = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._active = 0
+
+    def _record(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def _session(self, session_id, target_at_start):
+        """One user: a browser that keeps chatting until the run stops"""
+        driver = DriverFactory.create_driver_for_device(
+            browser=self.browser, headless=self.headless, device_name=self.device
+        )
+        with self._lock:
+            self._active += 1
+        try:
+            chat_page = PageFactory.create_chat_page(driver)
+            rng = random.Random(session_id)
+            while not self._stop.is_set():
+                prompt = rng.choice(self.corpus)
+                with self._lock:
+                    concurrency = self._active
+                start = time.monotonic()
+                step = 'setup'
+                try:
+                    # Fresh chat per prompt so the waiter only sees this reply
+                    chat_page.navigate_to(self.url)
+                    chat_page.clear_app_state()
+                    chat_page.select_model()
+                    chat_page.enter_prompt(prompt)
+                    with self._lock:
+                        concurrency = self._active
+                    step = 'response'
+                    start = time.monotonic()
+                    chat_page.submit_prompt()
+                    texts = chat_page.wait_for_response(self.timeout)
+                    metrics = chat_page.last_response_metrics or {}
+                    ok = bool(texts) and not metrics.get('timed_out')
+                    error = None
+                except Exception as e:
+                    metrics, ok, error = {}, False, f"{step}: {e}"
+                self._record({
+                    'session': session_id,
+                    'started_at': start,
+                    'concurrency': concurrency,
+                    'target_sessions': target_at_start,
+                    'latency': time.monotonic() - start,
+                    'time_to_image': metrics.get('time_to_image'),
+                    'time_to_first_token': metrics.get('time_to_first_token'),
+                    'time_to_complete': metrics.get('time_to_complete'),
+                    'ok': ok,
+                    'error': error,
+                })
+                self._stop.wait(rng.uniform(*self.think_time))
+        finally:
+            with self._lock:
+                self._active -= 1
+            driver.quit()
+
+    def run(self):
+        """Execute every stage and return the collected request records"""
+        session_id = 0
+        futures = {}
+        with ThreadPoolExecutor(max_workers=self.max_browsers) as executor:
+            for sessions, seconds in self.stages:
+                # Sessions beyond max_browsers queue until a browser slot frees up
+                while session_id < sessions:
+                    futures[executor.submit(self._session, session_id, sessions)] = (session_id, sessions)
+                    session_id += 1
+                print(f"Stage: {sessions} session(s) for {seconds:.0f}s")
+                time.sleep(seconds)
+            self._stop.set()
+        # A session that died (e.g. its browser never started) counts as a failed request
+        for future, (failed_id, target) in futures.items():
+            error = future.exception()
+            if error is not None:
+                print(f"Warning: session {failed_id} failed: {error}")
+                self._record({
+                    'session': failed_id, 'started_at': None, 'concurrency': None, 'target_sessions': target,
+                    'latency': None, 'time_to_image': None, 'time_to_first_token': None,
+                    'time_to_complete': None, 'ok': False, 'error': f"session: {error}",
+                })
+        return self.records
+
+    def report(self, degrade_factor=1.5):
+        """Latency percentiles per observed concurrency and the degradation point"""
+        by_level = {}
+        for record in self.records:
+            if record['ok']:
+                by_level.setdefault(record['concurrency'], []).append(record['latency'])
+        levels = {level: summarize(latencies) for level, latencies in sorted(by_level.items())}
+
+        knee = None
+        baseline = levels[min(levels)]['p95'] if levels else None
+        for level, stats in levels.items():
+            if baseline and stats['p95'] > baseline * degrade_factor:
+                knee = level
+                break
+        return {
+            'config': {
+                'url': self.url, 'stages': self.stages, 'max_browsers': self.max_browsers,
+                'think_time': self.think_time, 'device': self.device, 'browser': self.browser,
+            },
+            'requests': len(self.records),
+            'errors': sum(1 for r in self.records if not r['ok']),
+            'failed_sessions': sum(1 for r in self.records if r['concurrency'] is None),
+            'latency_by_concurrency': levels,
+            'baseline_p95': baseline,
+            'degradation_concurrency': knee,
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=os.getenv('OLLAMA_URL', 'http://localhost:3000/'),
+                        help="UI base URL, or 'stub' to run against the local stub server")
+    parser.add_argument('--stages', default='1:30,2:30,4:30,8:30', help="Comma list of sessions:seconds")
+    parser.add_argument('--max-browsers', type=int, default=8)
+    parser.add_argument('--think-min', type=float, default=1.0)
+    parser.add_argument('--think-max', type=float, default=3.0)
+    parser.add_argument('--corpus', help='File with one prompt per line')
+    parser.add_argument('--browser', default=os.getenv('BROWSER', 'chrome'))
+    parser.add_argument('--device', default=os.getenv('DEVICE', 'desktop'))
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--degrade-factor', type=float, default=1.5)
+    parser.add_argument('--output-dir', default='benchmark-results')
+    args = parser.parse_args(argv)
+
+    stub = StubOllamaServer().start() if args.url == 'stub' else None
+    generator = LoadGenerator(
+        url=stub.url if stub else args.url,
+        stages=parse_stages(args.stages),
+        corpus=load_corpus(args.corpus),
+        max_browsers=args.max_browsers,
+        think_time=(args.think_min, args.think_max),
+        browser=args.browser,
+        device=args.device,
+        timeout=args.timeout,
+    )
+    try:
+        generator.run()
+    finally:
+        if stub:
+            stub.stop()
+
+    report = generator.report(args.degrade_factor)
+    write_csv(os.path.join(args.output_dir, 'load_requests.csv'), generator.records)
+    write_json(os.path.join(args.output_dir, 'load_report.json'), report)
+    for level, stats in report['latency_by_concurrency'].items():
+        print(f"concurrency={level:<3d} n={stats['count']:<4d} p50={stats['p50']:.2f}s p95={stats['p95']:.2f}s")
+    print(f"Errors: {report['errors']} of {report['requests']} requests ({report['failed_sessions']} failed sessions)")
+    print(f"Latency degrades at concurrency: {report['degradation_concurrency']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Conversation lookup benchmark over synthetic 1k/10k-conversation sidebars
+
+Usage:
+    python -m benchmarks.sidebar_search --sizes 1000 10000 --iterations 3
+
+For each history size a local stub serves that many synthetic conversations
+("Conversation 1" .. "Conversation N") in its virtualized sidebar. Timings
+per size (seconds):
+
+    legacy_read_rendered  find_elements + .text per row, the old per-element lookup;
+                          'rows_seen' shows how little of a virtualized list it can see
+    find_cold_<position>  find_conversation on a fresh page (first / middle / last row)
+    find_warm_<position>  the same search again, answered from the in-page index
+    list_all              list_conversation_titles() for the whole history
+    list_page_cold        one 100-title page from the middle of the list on a fresh page
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.driver_factory import DriverFactory
+from utils.stub_server import StubConfig, StubOllamaServer
+from pages.page_factory import PageFactory
+from benchmarks.stats import summarize, write_csv, write_json
+
+SCAN_TIMEOUT = 55
+
+
+def _timed(func, *args, **kwargs):
+    start = time.monotonic()
+    result = func(*args, **kwargs)
+    return time.monotonic() - start, result
+
+
+def _fresh_sidebar(driver, url):
+    driver.get(url)
+    sidebar = PageFactory.create_sidebar_page(driver)
+    sidebar.wait_for_load()
+    return sidebar
+
+
+def measure_size(driver, size, iterations):
+    """Run every measurement iterations times against a stub serving size conversations"""
+    records = []
+    server = StubOllamaServer(config=StubConfig(conversations=size)).start()
+    targets = {'first': 1, 'middle': size // 2, 'last': size}
+    try:
+        for iteration in range(iterations):
+            def add(metric, seconds, **extra):
+                records.append(dict({'size': size, 'iteration': iteration, 'metric': metric, 'seconds': seconds}, **extra))
+
+            sidebar = _fresh_sidebar(driver, server.url)
+            seconds, elements = _timed(driver.find_elements, *sidebar.CONVERSATION_ITEM_TITLES)
+            start = time.monotonic()
+            titles = [element.text for element in elements]
+            add('legacy_read_rendered', seconds + time.monotonic() - start, rows_seen=len(titles))
+
+            for position, number in targets.items():
+                sidebar = _fresh_sidebar(driver, server.url)
+                needle = f"Conversation {number}"
+                seconds, element = _timed(sidebar.find_conversation, needle, SCAN_TIMEOUT)
+                add(f'find_cold_{position}', seconds, found=element is not None and element.text == needle)
+                seconds, element = _timed(sidebar.find_conversation, needle, SCAN_TIMEOUT)
+                add(f'find_warm_{position}', seconds, found=element is not None and element.text == needle)
+
+            sidebar = _fresh_sidebar(driver, server.url)
+            seconds, titles = _timed(sidebar.list_conversation_titles, timeout=SCAN_TIMEOUT)
+            add('list_all', seconds, rows_seen=len(titles))
+
+            sidebar = _fresh_sidebar(driver, server.url)
+            seconds, titles = _timed(sidebar.list_conversation_titles, size // 2, 100, SCAN_TIMEOUT)
+            add('list_page_cold', seconds, rows_seen=len(titles))
+    finally:
+        server.stop()
+    return records
+
+
+def run_benchmark(sizes, iterations=3, browser='chrome', device='desktop', headless=True):
+    driver = DriverFactory.create_driver_for_device(browser=browser, headless=headless, device_name=device)
+    # Full scans of large histories can outlast the default 30s script timeout
+    driver.set_script_timeout(SCAN_TIMEOUT + 5)
+    try:
+        records = [r for size in sizes for r in measure_size(driver, size, iterations)]
+    finally:
+        driver.quit()
+    summary = {'config': {'sizes': sizes, 'iterations': iterations, 'browser': browser, 'device': device}, 'results': {}}
+    for size in sizes:
+        by_metric = {}
+        for r in records:
+            if r['size'] == size:
+                by_metric.setdefault(r['metric'], []).append(r)
+        summary['results'][str(size)] = {
+            metric: dict(summarize([r['seconds'] for r in recs]),
+                         rows_seen=recs[-1].get('rows_seen'),
+                         found=all(r.get('found', True) for r in recs))
+            for metric, recs in by_metric.items()
+        }
+    return records, summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000])
+    parser.add_argument('--iterations', type=int, default=3)
+    parser.add_argument('--browser', default=os.getenv('BROWSER', 'chrome'))
+    parser.add_argument('--device', default=os.getenv('DEVICE', 'desktop'))
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--output-dir', default='benchmark-results')
+    args = parser.parse_args(argv)
+
+    records, summary = run_benchmark(args.sizes, args.iterations, args.browser, args.device, not args.headed)
+    write_csv(os.path.join(args.output_dir, 'sidebar_search.csv'), records)
+    write_json(os.path.join(args.output_dir, 'sidebar_search.json'), summary)
+    for size, metrics in summary['results'].items():
+        print(f"{size} conversations")
+        for metric, stats in metrics.items():
+            seen = f" rows={stats['rows_seen']}" if stats['rows_seen'] is not None else ''
+            print(f"  {metric:24s} p50={stats['p50']:.3f}s{seen}{'' if stats['found'] else ' NOT FOUND'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Shared statistics and result writers for benchmarks"""
+
+import csv
+import json
+import os
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of values (pct in 0-100); None for no data"""
+    data = sorted(v for v in values if v is not None)
+    if not data:
+        return None
+    if len(data) == 1:
+        return data[0]
+    rank = (len(data) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(data) - 1)
+    return data[low] + (data[high] - data[low]) * (rank - low)
+
+
+def summarize(values, percentiles=(50, 95, 99)):
+    """Return count/mean/min/max plus the requested percentiles"""
+    data = [v for v in values if v is not None]
+    summary = {'count': len(data)}
+    if data:
+        summary.update({
+            'mean': sum(data) / len(data),
+            'min': min(data),
+            'max': max(data),
+        })
+    for pct in percentiles:
+        summary[f'p{pct}'] = percentile(data, pct)
+    return summary
+
+
+def summarize_records(records, fields, percentiles=(50, 95, 99)):
+    """Summarize each named field across a list of record dicts"""
+    return {field: summarize([r.get(field) for r in records], percentiles) for field in fields}
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def write_csv(path, records):
+    """Write a list of flat dicts to CSV, using the union of keys as header"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    fieldnames = []
+    for record in records:
+        for key in record:
+            if key not in fieldnames:
+                fieldnames.append(key)
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(records)
+    return path
@@ -0,0 +1,174 @@
+"""Image upload benchmark built on upload_image_and_submit
+
+Usage:
+    python -m benchmarks.upload_throughput --url stub --device mobile \\
+        --sizes 256x256 1024x768 2048x1536 --formats PNG JPEG WEBP --counts 1 5
+
+For every size x format x count, one browser starts a fresh chat and uploads
+that many images back to back (waiting for each reply). Images come from the
+shared ImageCache, so generation time is never measured. Timings are taken
+from the page's last_upload_timing, measured from send_keys on the file input:
+
+    send_keys    the file path has been handed to the browser
+    name_field   the image has been read and the name field is shown
+    submit       the message with the image has been submitted (waited for by
+                 the benchmark, so functional uploads never block on it)
+
+Per-upload records go to CSV, per-configuration percentiles to JSON and a
+throughput curve (file size vs. MB/s to the name field) to a second CSV.
+"""
+
+import argparse
+import os
+import sys
+import time
+from selenium.webdriver.support import expected_conditions as EC
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.driver_factory import DriverFactory
+from utils.image_fixtures import ImageCache, ImageSpec
+from utils.stub_server import StubOllamaServer
+from pages.page_factory import PageFactory
+from benchmarks.stats import percentile, summarize_records, write_csv, write_json
+
+METRIC_FIELDS = ['send_keys', 'name_field', 'submit', 'throughput_mb_s']
+
+
+def parse_size(text):
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def measure_uploads(chat_page, url, image_path, count, timeout):
+    """Upload image_path count times in one fresh chat; one record per upload"""
+    chat_page.navigate_to(url)
+    chat_page.clear_app_state()
+    chat_page.select_model()
+    records = []
+    for position in range(1, count + 1):
+        chat_page.upload_image_and_submit(image_path, f"image {position}")
+        timing = dict(chat_page.last_upload_timing)
+        # The name field goes away once the message (and image) has been sent
+        submitted = chat_page.waits.optional(
+            EC.staleness_of(chat_page.last_upload_name_field), label='upload submitted', timeout=timeout
+        )
+        started_at = timing.pop('started_at')
+        timing['submit'] = time.monotonic() - started_at if submitted else None
+        chat_page.wait_for_response(timeout)
+        megabytes = timing['bytes'] / (1024 * 1024)
+        timing.update({
+            'position': position,
+            'throughput_mb_s': megabytes / timing['name_field'] if timing['name_field'] else None,
+        })
+        records.append(timing)
+    return records
+
+
+def run_benchmark(url, sizes, formats, counts, complexity='noise', browser='chrome', device='desktop',
+                  headless=True, timeout=60, cache=None):
+    """Sweep sizes x formats x counts in one browser; return (records, summary)"""
+    cache = cache or ImageCache()
+    records = []
+    driver = DriverFactory.create_driver_for_device(browser=browser, headless=headless, device_name=device)
+    try:
+        chat_page = PageFactory.create_chat_page(driver)
+        for width, height in sizes:
+            for fmt in formats:
+                image_path = cache.get(ImageSpec(width, height, fmt, complexity))
+                for count in counts:
+                    config = {'width': width, 'height': height, 'format': fmt, 'count': count,
+                              'device': device, 'browser': browser}
+                    start = time.monotonic()
+                    try:
+                        uploads = measure_uploads(chat_page, url, image_path, count, timeout)
+                    except Exception as e:
+                        print(f"{width}x{height} {fmt} x{count}: upload failed: {e}")
+                        uploads = [{'ok': False, 'error': str(e)}]
+                    for upload in uploads:
+                        upload.setdefault('ok', True)
+                        records.append(dict(config, **upload))
+                    print(f"{width}x{height} {fmt} x{count}: {time.monotonic() - start:.1f}s")
+    finally:
+        driver.quit()
+
+    ok = [r for r in records if r.get('ok')]
+    groups = {}
+    for r in ok:
+        groups.setdefault((r['width'], r['height'], r['format'], r['count']), []).append(r)
+    summary = {
+        'config': {'url': url, 'browser': browser, 'device': device, 'complexity': complexity},
+        'uploads': len(records),
+        'errors': len(records) - len(ok),
+        'results': [
+            {'width': w, 'height': h, 'format': fmt, 'count': count, 'bytes': recs[0]['bytes'],
+             'metrics': summarize_records(recs, METRIC_FIELDS)}
+            for (w, h, fmt, count), recs in sorted(groups.items())
+        ],
+    }
+    return records, summary
+
+
+def throughput_curve(records):
+    """Median name-field time and throughput per (format, file size), ordered by size"""
+    points = {}
+    for r in records:
+        if r.get('ok'):
+            points.setdefault((r['format'], r['bytes']), []).append(r)
+    return [
+        {
+            'format': fmt,
+            'bytes': size,
+            'uploads': len(recs),
+            'name_field_p50': percentile([r['name_field'] for r in recs], 50),
+            'submit_p50': percentile([r['submit'] for r in recs], 50),
+            'throughput_mb_s_p50': percentile([r['throughput_mb_s'] for r in recs], 50),
+        }
+        for (fmt, size), recs in sorted(points.items())
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=os.getenv('OLLAMA_URL', 'http://localhost:3000/'),
+                        help="UI base URL, or 'stub' to benchmark against the local stub server")
+    parser.add_argument('--sizes', nargs='+', type=parse_size, default=[(256, 256), (1024, 768), (2048, 1536)],
+                        help='Image dimensions as WIDTHxHEIGHT')
+    parser.add_argument('--formats', nargs='+', default=['PNG', 'JPEG', 'WEBP'], type=str.upper)
+    parser.add_argument('--counts', nargs='+', type=int, default=[1, 5],
+                        help='Images uploaded back to back in one chat')
+    parser.add_argument('--complexity', default='noise', choices=['solid', 'gradient', 'noise'])
+    parser.add_argument('--browser', default=os.getenv('BROWSER', 'chrome'))
+    parser.add_argument('--device', default=os.getenv('DEVICE', 'desktop'))
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--output-dir', default='benchmark-results')
+    args = parser.parse_args(argv)
+
+    stub = StubOllamaServer().start() if args.url == 'stub' else None
+    url = stub.url if stub else args.url
+    try:
+        records, summary = run_benchmark(
+            url, args.sizes, args.formats, args.counts, args.complexity,
+            args.browser, args.device, not args.headed, args.timeout,
+        )
+    finally:
+        if stub:
+            stub.stop()
+
+    curve = throughput_curve(records)
+    write_csv(os.path.join(args.output_dir, 'upload_throughput.csv'), records)
+    write_csv(os.path.join(args.output_dir, 'upload_throughput_curve.csv'), curve)
+    write_json(os.path.join(args.output_dir, 'upload_throughput.json'), summary)
+    print(f"{'format':6s} {'bytes':>12s} {'name field s':>13s} {'submit s':>9s} {'MB/s':>8s}")
+    for point in curve:
+        submit = point['submit_p50']
+        print(f"{point['format']:6s} {point['bytes']:12d} {point['name_field_p50']:13.3f} "
+              f"{submit if submit is not None else float('nan'):9.3f} {point['throughput_mb_s_p50'] or 0:8.1f}")
+    return 0 if summary['errors'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
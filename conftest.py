@@ -1,23 +1,184 @@
 import os
 import pytest
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from utils.driver_factory import DriverFactory
+from utils.driver_pool import ContextHost, DriverPool
+from utils.wait_engine import WaitEngine
+from utils.driver_context import DriverContext
+from utils.resource_monitor import ResourceMonitor, quit_driver
+from utils.stub_server import StubOllamaServer
+from utils.startup_metrics import StartupMetrics
+from utils.step_timing import StepTimer
+from utils.command_profiler import CommandProfiler
+
+STARTUP = StartupMetrics()
+STARTUP.mark('conftest_imported')
 
 # Load environment variables from .env file
 load_dotenv()
 
+def pytest_configure(config):
+    # Registered here: pytest does not read the [tool:pytest] section of pytest.ini
+    config.addinivalue_line(
+        'markers', "stub_only: Relies on the local stub app's storage scheme and routes; skipped unless OLLAMA_URL=stub"
+    )
+    config.addinivalue_line(
+        'markers', "api: Uses only the chat page flow, so it also runs under DRIVER_MODE=api; other tests are skipped there"
+    )
+
+def pytest_sessionstart(session):
+    STARTUP.mark('session_start')
+
+def pytest_collection_modifyitems(config, items):
+    skip_stub_only = pytest.mark.skip(reason="Needs the local stub app (OLLAMA_URL=stub)")
+    skip_browser_only = pytest.mark.skip(reason="Needs a browser (DRIVER_MODE=browser)")
+    stub = os.getenv('OLLAMA_URL') == 'stub'
+    api_mode = os.getenv('DRIVER_MODE', 'browser').lower() == 'api'
+    for item in items:
+        if 'stub_only' in item.keywords and not stub:
+            item.add_marker(skip_stub_only)
+        # The ApiDriver only backs the chat page, so the API path is opt-in per test
+        if api_mode and 'api' not in item.keywords:
+            item.add_marker(skip_browser_only)
+
+def pytest_runtest_setup(item):
+    STARTUP.mark('first_test_setup')
+
+def pytest_runtest_call(item):
+    STARTUP.mark('first_test_call')
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Keep each phase's report on the item (rep_setup, rep_call) for fixture teardown"""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+def pytest_sessionfinish(session):
+    stats_path = os.getenv('WAIT_STATS_PATH')
+    if stats_path:
+        WaitEngine.export(stats_path)
+    timings_path = os.getenv('STEP_TIMINGS_PATH')
+    if timings_path:
+        StepTimer.export(timings_path)
+    macro_path = os.getenv('MACRO_TIMINGS_PATH')
+    if macro_path:
+        from pages.navigation_macro import NavigationMacro
+        NavigationMacro.export(macro_path)
+    profile_dir = os.getenv('PROFILE_OUTPUT_DIR')
+    if profile_dir and os.getenv('PROFILE_COMMANDS', 'false').lower() == 'true':
+        os.makedirs(profile_dir, exist_ok=True)
+        profiler = CommandProfiler.merged()
+        profiler.write_collapsed(os.path.join(profile_dir, 'webdriver.folded'))
+        profiler.export_json(os.path.join(profile_dir, 'webdriver_hotspots.json'))
+
+def pytest_terminal_summary(terminalreporter):
+    if STARTUP.time_to_first_test is not None:
+        terminalreporter.write_line(f"Time to first test: {STARTUP.time_to_first_test:.2f}s {STARTUP.marks}")
+    if os.getenv('PROFILE_COMMANDS', 'false').lower() == 'true':
+        terminalreporter.write_sep('-', 'WebDriver command hot spots')
+        terminalreporter.write_line(CommandProfiler.merged().top_table())
+    metrics_path = os.getenv('STARTUP_METRICS_PATH')
+    if metrics_path:
+        STARTUP.export(metrics_path)
+
+@pytest.fixture(scope="session")
+def resource_monitor():
+    """Per-worker resource sampler (RESOURCE_MONITOR=true); None when disabled"""
+    if os.getenv('RESOURCE_MONITOR', 'false').lower() != 'true':
+        yield None
+        return
+    monitor = ResourceMonitor.from_env().start()
+    yield monitor
+    monitor.stop()
+    # Every driver has been quit by now, so any browser still running is an orphan
+    monitor.kill_orphans()
+    if ResourceMonitor.orphans_killed:
+        print(f"Resource monitor: killed {ResourceMonitor.orphans_killed} orphaned browser processes")
+
+@pytest.fixture(autouse=True)
+def resource_budget(request, resource_monitor):
+    """Sample around each test, clean up orphans and enforce TEST_MEMORY_BUDGET_MB"""
+    if resource_monitor is None:
+        yield
+        return
+    if 'driver' in request.fixturenames:
+        # Baseline after the browser exists, so its startup is not charged to the test
+        request.getfixturevalue('driver')
+    resource_monitor.begin_test(request.node.nodeid)
+    yield
+    usage = resource_monitor.end_test()
+    resource_monitor.kill_orphans(DriverContext.drivers())
+    if usage['over_budget']:
+        message = (f"Memory grew {usage['growth_mb']} MB during the test "
+                   f"(budget {resource_monitor.test_budget_mb} MB)")
+        if os.getenv('MEMORY_BUDGET_MODE', 'fail').lower() == 'fail':
+            pytest.fail(message)
+        print(f"Warning: {message}")
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Session-wide pool of warm browsers, reused across tests"""
+    pool = DriverPool.from_env()
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="session")
+def context_host():
+    """Shared Chrome for DRIVER_ISOLATION=context; None in the other isolation modes"""
+    if os.getenv('DRIVER_ISOLATION', 'browser').lower() != 'context':
+        yield None
+        return
+    browser = os.getenv('BROWSER', 'chrome')
+    if browser.lower() != 'chrome':
+        print(f"Warning: DRIVER_ISOLATION=context needs Chrome, using a browser per test for {browser}")
+        yield None
+        return
+    host = ContextHost(
+        browser=browser,
+        headless=os.getenv('HEADLESS', 'true').lower() == 'true',
+        device_name=os.getenv('DEVICE', 'desktop'),
+        width=int(os.getenv('SCREEN_WIDTH', '1920')),
+        height=int(os.getenv('SCREEN_HEIGHT', '1080')),
+    )
+    yield host
+    host.close()
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, driver_pool, context_host):
     """Create WebDriver instance based on environment variables"""
     browser = os.getenv('BROWSER', 'chrome')
     headless = os.getenv('HEADLESS', 'true').lower() == 'true'
     device_name = os.getenv('DEVICE', 'desktop')  # New device parameter
+    screen_width = int(os.getenv('SCREEN_WIDTH', '1920'))
+    screen_height = int(os.getenv('SCREEN_HEIGHT', '1080'))
+    use_pool = os.getenv('DRIVER_POOL', 'true').lower() == 'true'
     
+    # DRIVER_MODE=api swaps the browser for the HTTP fast path (tests marked api only)
+    if os.getenv('DRIVER_MODE', 'browser').lower() == 'api':
+        from utils.api_driver import ApiDriver
+        yield ApiDriver()
+        return
+    
+    # DRIVER_ISOLATION=context runs each test in its own browser context of one shared Chrome
+    if context_host is not None:
+        browser_context = context_host.acquire()
+        DriverContext.for_driver(browser_context.driver)
+        yield browser_context.driver
+        context_host.release(browser_context)
+        return
+    
+    if use_pool:
+        entry = driver_pool.acquire(
+            browser=browser,
+            headless=headless,
+            device_name=device_name,
+            width=screen_width,
+            height=screen_height
+        )
+        driver = entry.driver
     # Use device-specific driver creation if device is specified
-    if device_name and device_name != 'custom':
+    elif device_name and device_name != 'custom':
         driver = DriverFactory.create_driver_for_device(
             browser=browser,
             headless=headless,
@@ -25,8 +186,6 @@ def driver():
         )
     else:
         # Fallback to custom dimensions
-        screen_width = int(os.getenv('SCREEN_WIDTH', '1920'))
-        screen_height = int(os.getenv('SCREEN_HEIGHT', '1080'))
         driver = DriverFactory.create_driver(
             browser=browser,
             headless=headless,
@@ -34,14 +193,63 @@ def driver():
             height=screen_height
         )
     
-    # Set implicit wait from environment variable or default to 10 seconds
-    implicit_wait = int(os.getenv('IMPLICIT_WAIT', '10'))
-    driver.implicitly_wait(implicit_wait)
+    # Explicit waits only: the context's wait engine disables implicit waits and owns all timeouts
+    DriverContext.for_driver(driver)
     
     yield driver
-    driver.quit()
+    if use_pool:
+        # A failed test may have left the browser broken, so it is not reused
+        reports = (getattr(request.node, 'rep_setup', None), getattr(request.node, 'rep_call', None))
+        failed = any(report is not None and report.failed for report in reports)
+        driver_pool.release(entry, failed=failed)
+    else:
+        quit_driver(driver)
+
+@pytest.fixture(scope="session")
+def image_cache():
+    """Shared cache of generated test images (see utils.image_fixtures); IMAGE_CACHE_CLEAR=true empties it afterwards"""
+    from utils.image_fixtures import ImageCache
+    cache = ImageCache()
+    yield cache
+    if os.getenv('IMAGE_CACHE_CLEAR', 'false').lower() == 'true':
+        cache.clear()
+
+@pytest.fixture(scope="session")
+def snapshot_cache():
+    """On-disk cache of pre-warmed app states (see utils.state_snapshot)"""
+    from utils.state_snapshot import SnapshotCache
+    return SnapshotCache()
+
+@pytest.fixture
+def warm_conversations(driver, base_url, snapshot_cache):
+    """App with a model selected and 50 conversations, built through the UI once per app version"""
+    from pages.page_factory import PageFactory
+    # Building needs 50 model round-trips and the stub's chat storage
+    if os.getenv('OLLAMA_URL') != 'stub':
+        pytest.skip("warm_conversations needs the local stub app (OLLAMA_URL=stub)")
+
+    def _build(build_driver):
+        chat_page = PageFactory.create_chat_page(build_driver)
+        chat_page.select_model()
+        for i in range(50):
+            chat_page.navigate_to(base_url)
+            chat_page.send_message_and_get_response(f"Saved chat {i + 1}")
+
+    snapshot = snapshot_cache.get_or_build('conversations-50', driver, base_url, _build)
+    snapshot.restore(driver, base_url)
+    return snapshot
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """Local stand-in Ollama UI; configured through STUB_* environment variables"""
+    server = StubOllamaServer().start()
+    yield server
+    server.stop()
 
 @pytest.fixture(scope="session")
-def base_url():
-    """Get base URL from environment"""
-    return os.getenv('OLLAMA_URL', 'http://52.18.93.49:3000/')
\ No newline at end of file
+def base_url(request):
+    """Get base URL from environment (OLLAMA_URL=stub runs against the local stub)"""
+    url = os.getenv('OLLAMA_URL', 'http://52.18.93.49:3000/')
+    if url == 'stub':
+        return request.getfixturevalue('stub_server').url
+    return url
\ No newline at end of file
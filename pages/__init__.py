@@ -0,0 +1,23 @@
+"""Page objects; modules are imported lazily on first attribute access"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'BasePage': '.base_page',
+    'OllamaChatPage': '.ollama_chat_page',
+    'OllamaChatDesktopPage': '.ollama_chat_desktop',
+    'OllamaChatMobilePage': '.ollama_chat_mobile',
+    'OllamaChatApiPage': '.ollama_chat_api',
+    'PageFactory': '.page_factory',
+    'SettingsPage': '.settings_page',
+    'SidebarPage': '.sidebar_page',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,26 +1,31 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from utils.device_config import DeviceConfig
+from utils.driver_context import DriverContext
+from utils.step_timing import instrument_class, timed_step
+from .locators import AnyOf, Locator, compile_class_locators
 
 class BasePage:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Turn class-level locator tuples into shared Locator objects
+        compile_class_locators(cls)
+        # Page-object methods show up as timed steps when step timing is on
+        instrument_class(cls)
+    
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        self.device_config = self._detect_device_config()
+        # Shared per driver: building a page makes no WebDriver calls
+        self.context = DriverContext.for_driver(driver)
+        self.waits = self.context.waits
+        self.wait = self.waits.wait('default')
+        # Resolved WebElements keyed by Locator; dropped on navigation or staleness
+        self._element_cache = {}
     
-    def _detect_device_config(self):
-        """Detect current device configuration based on window size"""
-        try:
-            size = self.driver.get_window_size()
-            width = size['width']
-            breakpoint = DeviceConfig.get_breakpoint(width)
-            return DeviceConfig.get_device_config(breakpoint)
-        except:
-            return DeviceConfig.DESKTOP
+    @property
+    def device_config(self):
+        """Device for the current window size, detected once per driver"""
+        return self.context.device
     
     def is_mobile(self):
         """Check if current device is mobile"""
@@ -34,29 +39,78 @@ class BasePage:
         """Get appropriate locator based on device type"""
         return mobile_locator if self.is_mobile() else desktop_locator
     
-    def is_element_present(self, locator):
+    def invalidate_element_cache(self, locator=None):
+        """Forget resolved elements (all of them, or only the given locator)"""
+        if locator is None:
+            self._element_cache.clear()
+        else:
+            self._element_cache.pop(Locator.compile(locator), None)
+    
+    def _presence(self, locator):
+        """Presence condition for a Locator or an AnyOf"""
+        if isinstance(locator, AnyOf):
+            return locator.presence()
+        return EC.presence_of_element_located(locator)
+    
+    @timed_step
+    def find_element(self, locator):
+        """Return the element for locator, reusing the one resolved earlier on this page"""
+        locator = Locator.compile(locator)
+        element = self._element_cache.get(locator)
+        if element is None:
+            element = self.waits.until(self._presence(locator), 'presence', label=locator.value)
+            self._element_cache[locator] = element
+        return element
+    
+    def _with_element(self, locator, action):
+        """Run action on the cached element, re-resolving once if it went stale"""
+        try:
+            return action(self.find_element(locator))
+        except StaleElementReferenceException:
+            self.invalidate_element_cache(locator)
+            return action(self.find_element(locator))
+    
+    @timed_step
+    def is_element_present(self, locator, optional=False):
+        """Check presence; optional=True uses the short fast-fail timeout for elements that may be absent"""
+        # Always look the element up fresh so negative checks stay accurate
+        locator = Locator.compile(locator)
         try:
-            self.wait.until(EC.presence_of_element_located(locator))
+            self._element_cache[locator] = self.waits.until(
+                self._presence(locator),
+                'optional' if optional else 'presence',
+                label=locator.value,
+            )
             return True
         except TimeoutException:
+            self._element_cache.pop(locator, None)
             return False
     
+    @timed_step
     def click_element(self, locator):
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        locator = Locator.compile(locator)
+        self._with_element(
+            locator,
+            lambda el: self.waits.until(EC.element_to_be_clickable(el), 'clickable', label=locator.value).click()
+        )
+        # Clicks commonly change the DOM; keep only what the next lookup proves valid
+        self.invalidate_element_cache()
     
+    @timed_step
     def enter_text(self, locator, text):
-        element = self.wait.until(EC.presence_of_element_located(locator))
-        element.clear()
-        element.send_keys(text)
+        def _enter(element):
+            element.clear()
+            element.send_keys(text)
+        self._with_element(locator, _enter)
     
+    @timed_step
     def scroll_to_element(self, locator):
         """Scroll to element - behavior may differ on mobile vs desktop"""
-        element = self.wait.until(EC.presence_of_element_located(locator))
+        element = self.find_element(locator)
         if self.is_mobile():
             # Mobile-specific scrolling
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
         else:
             # Desktop scrolling
             self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", element)
-        return element
\ No newline at end of file
+        return element
@@ -0,0 +1,33 @@
+"""In-page element lookup shared by the single round-trip scripts"""
+
+# In-page equivalent of driver.find_elements for the Selenium By strategies.
+# Defines locateAll(by, value, root) for scripts that prepend it.
+LOCATE_ALL_JS = """
+function locateAll(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'css selector':
+            return Array.from(root.querySelectorAll(value));
+        case 'xpath': {
+            const snap = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+            return nodes;
+        }
+        case 'id':
+            return Array.from(root.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'name':
+            return Array.from(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.from(root.getElementsByClassName(value));
+        case 'tag name':
+            return Array.from(root.getElementsByTagName(value));
+        case 'link text':
+            return Array.from(root.querySelectorAll('a')).filter(a => a.innerText.trim() === value);
+        case 'partial link text':
+            return Array.from(root.querySelectorAll('a')).filter(a => a.innerText.includes(value));
+        default:
+            throw new Error('Unsupported locator strategy: ' + by);
+    }
+}
+"""
@@ -0,0 +1,34 @@
+"""Declarative layout assertions that page objects publish for responsive sweeps
+
+A page lists LayoutCheck objects in its LAYOUT_CHECKS attribute: an element
+and the breakpoints (DeviceConfig.BREAKPOINTS names) where the page expects
+it to be visible. utils.layout_sweep evaluates every check at each width in
+one script, so adding a check costs no extra WebDriver round-trips.
+"""
+
+from utils.device_config import DeviceConfig
+from .locators import AnyOf, Locator
+
+
+class LayoutCheck:
+    """One element whose visibility depends on the breakpoint"""
+    __slots__ = ('name', 'locator', 'visible_on')
+
+    def __init__(self, name, locator, visible_on=None):
+        self.name = name
+        self.locator = locator
+        # None means visible at every width
+        self.visible_on = tuple(visible_on) if visible_on is not None else None
+
+    def candidates(self):
+        """(by, value) pairs; the element counts as visible if any of them is"""
+        if isinstance(self.locator, AnyOf):
+            return [list(c) for c in self.locator.candidates]
+        return [list(Locator.compile(self.locator))]
+
+    def expected(self, width):
+        """Whether the element should be visible at a window width"""
+        return self.visible_on is None or DeviceConfig.get_breakpoint(width) in self.visible_on
+
+    def __repr__(self):
+        return f"LayoutCheck({self.name!r}, visible_on={self.visible_on!r})"
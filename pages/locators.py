@@ -0,0 +1,119 @@
+"""Locator registry: interned, reusable locator objects"""
+
+from selenium.webdriver.common.by import By
+from .element_snapshot import LOCATE_ALL_JS
+
+_STRATEGIES = frozenset(
+    value for name, value in vars(By).items() if not name.startswith('_') and isinstance(value, str)
+)
+
+
+class Locator(tuple):
+    """Immutable (by, value) pair that works anywhere a Selenium locator tuple does.
+
+    Instances are interned through ``Locator.compile`` so equal locators share
+    one object and can be used as cheap dictionary keys.
+    """
+    __slots__ = ()
+    _registry = {}
+
+    def __new__(cls, by, value):
+        if by not in _STRATEGIES:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+        return super().__new__(cls, (by, value))
+
+    @property
+    def by(self):
+        return self[0]
+
+    @property
+    def value(self):
+        return self[1]
+
+    @classmethod
+    def is_locator(cls, candidate):
+        """Return True if candidate looks like a (By, value) tuple"""
+        return (
+            isinstance(candidate, tuple)
+            and len(candidate) == 2
+            and candidate[0] in _STRATEGIES
+            and isinstance(candidate[1], str)
+        )
+
+    @classmethod
+    def compile(cls, locator):
+        """Return the shared Locator for a (by, value) tuple; AnyOf passes through"""
+        if isinstance(locator, (cls, AnyOf)):
+            return locator
+        key = (locator[0], locator[1])
+        compiled = cls._registry.get(key)
+        if compiled is None:
+            compiled = cls._registry[key] = cls(*key)
+        return compiled
+
+    def __repr__(self):
+        return f"Locator({self[0]!r}, {self[1]!r})"
+
+
+def compile_class_locators(cls):
+    """Replace every locator tuple defined on cls with its compiled Locator"""
+    for name, value in list(vars(cls).items()):
+        if name.isupper() and Locator.is_locator(value):
+            setattr(cls, name, Locator.compile(value))
+    return cls
+
+
+# Evaluates every candidate in one script and returns [index, element] for the
+# first candidate (in the given priority order) that currently matches.
+ANY_OF_SCRIPT = LOCATE_ALL_JS + """
+const candidates = arguments[0], displayedOnly = arguments[1];
+const isShown = el => {
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+};
+for (let i = 0; i < candidates.length; i++) {
+    const matches = locateAll(candidates[i][0], candidates[i][1]);
+    const hit = displayedOnly ? matches.find(isShown) : matches[0];
+    if (hit) return [i, hit];
+}
+return null;
+"""
+
+
+class AnyOf:
+    """First-match-of-many locator.
+
+    All candidates are checked in a single in-page script, always in their
+    declared order, so a strict candidate wins over a broad fallback
+    whenever both match.
+    """
+
+    def __init__(self, *candidates, name=None):
+        self.candidates = tuple(Locator.compile(c) for c in candidates)
+        self.name = name
+
+    def __set_name__(self, owner, name):
+        if self.name is None:
+            self.name = f"{owner.__name__}.{name}"
+
+    @property
+    def value(self):
+        """Label used in wait records and error messages"""
+        return self.name or ' | '.join(c.value for c in self.candidates)
+
+    def locate(self, driver, displayed_only=False):
+        """Return (candidate, element) for the first matching candidate, or None"""
+        hit = driver.execute_script(ANY_OF_SCRIPT, [list(c) for c in self.candidates], displayed_only)
+        if not hit:
+            return None
+        return self.candidates[hit[0]], hit[1]
+
+    def presence(self):
+        """Expected condition: the matching element, or False while nothing matches"""
+        def _condition(driver):
+            hit = self.locate(driver)
+            return hit[1] if hit else False
+        return _condition
+
+    def __repr__(self):
+        return f"AnyOf({', '.join(repr(c) for c in self.candidates)})"
@@ -0,0 +1,209 @@
+"""Navigation macros: a chain of clicks run as one in-browser script
+
+A macro is a list of MacroStep objects. run() sends them to the browser in a
+single execute_async_script call which, for each step, waits for the element,
+scrolls it into view and clicks it with a full pointer/mouse event sequence.
+A click is verified by the next step's element appearing; a final 'wait'
+step verifies where the chain ends up. If the script fails, the remaining
+steps run through their page-object fallbacks from the step that failed;
+only if that step's element never shows up is the previous click redone.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from selenium.common.exceptions import TimeoutException
+from utils.device_config import DeviceConfig
+from utils.driver_hooks import CommandCounter
+from utils.wait_engine import script_timeout
+from .element_snapshot import LOCATE_ALL_JS
+from .locators import AnyOf, Locator
+
+MACRO_SCRIPT = LOCATE_ALL_JS + """
+const steps = arguments[0], timeoutMs = arguments[1], pollMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+
+function visible(el) {
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+function first(candidates) {
+    for (const [by, value] of candidates) {
+        const el = locateAll(by, value).find(visible);
+        if (el) return el;
+    }
+    return null;
+}
+function press(el) {
+    el.scrollIntoView({behavior: 'instant', block: 'center'});
+    const opts = {bubbles: true, cancelable: true, composed: true, button: 0, buttons: 1,
+                  pointerId: 1, pointerType: 'mouse', isPrimary: true, view: window};
+    // Menu triggers (e.g. Radix) open on pointerdown, plain buttons on click
+    el.dispatchEvent(new PointerEvent('pointerdown', opts));
+    el.dispatchEvent(new MouseEvent('mousedown', opts));
+    el.dispatchEvent(new PointerEvent('pointerup', Object.assign({}, opts, {buttons: 0})));
+    el.dispatchEvent(new MouseEvent('mouseup', Object.assign({}, opts, {buttons: 0})));
+    el.click();
+}
+
+const timings = [];
+let index = 0, stepStart = performance.now();
+function tick() {
+    if (index >= steps.length) {
+        done({ok: true, completed: index, timings: timings, total: performance.now() - started});
+        return;
+    }
+    const step = steps[index];
+    try {
+        if (step.unless && first(step.unless)) {
+            timings.push({label: step.label, ms: performance.now() - stepStart, skipped: true});
+        } else {
+            const el = first(step.candidates);
+            if (!el || (step.action === 'click' && el.disabled)) {
+                if (performance.now() - stepStart > timeoutMs) {
+                    done({ok: false, failed_step: index, reason: 'missing', timings: timings,
+                          total: performance.now() - started});
+                    return;
+                }
+                setTimeout(tick, pollMs);
+                return;
+            }
+            if (step.action === 'click') press(el);
+            timings.push({label: step.label, ms: performance.now() - stepStart, skipped: false});
+        }
+    } catch (e) {
+        done({ok: false, failed_step: index, reason: 'error', error: String(e), timings: timings,
+              total: performance.now() - started});
+        return;
+    }
+    index += 1;
+    stepStart = performance.now();
+    tick();
+}
+tick();
+"""
+
+
+class MacroStep:
+    """One click (or final wait) in a macro, with the page-object method that does it step by step"""
+    __slots__ = ('label', 'locator', 'action', 'fallback', 'unless', 'only_on')
+
+    def __init__(self, label, locator, fallback, action='click', unless=None, only_on=None):
+        self.label = label
+        self.locator = locator
+        self.action = action
+        self.fallback = fallback
+        self.unless = unless
+        # Breakpoints (DeviceConfig.BREAKPOINTS names) the step applies to; None means all
+        self.only_on = tuple(only_on) if only_on is not None else None
+
+    def applies_to(self, breakpoint):
+        return self.only_on is None or breakpoint in self.only_on
+
+    @staticmethod
+    def _candidates(locator):
+        if isinstance(locator, AnyOf):
+            return [list(c) for c in locator.candidates]
+        return [list(Locator.compile(locator))]
+
+    def to_script(self):
+        return {
+            'label': self.label,
+            'action': self.action,
+            'candidates': self._candidates(self.locator),
+            'unless': self._candidates(self.unless) if self.unless is not None else None,
+        }
+
+
+class NavigationMacro:
+    """A named chain of MacroSteps; every run is timed and recorded"""
+
+    # Shared across macros so a whole session can be exported at once; only the
+    # most recent MACRO_RECORDS_MAX runs are kept
+    records = deque(maxlen=int(os.getenv('MACRO_RECORDS_MAX', '10000')))
+
+    def __init__(self, name, steps, poll_ms=50):
+        self.name = name
+        self.steps = list(steps)
+        self.poll_ms = poll_ms
+
+    def run(self, page, timeout=None):
+        """Run the chain on page; falls back to step-by-step on failure. Returns the last fallback's result"""
+        # Steps for other layouts would only wait out their timeout
+        steps = [s for s in self.steps if s.applies_to(DeviceConfig.get_breakpoint(page.device_config.width))]
+        timeout = timeout if timeout is not None else page.waits.timeouts['default']
+        counter = CommandCounter.for_driver(page.driver)
+        commands_before = counter.count
+        start = time.perf_counter()
+        try:
+            # Each step may wait up to timeout, so the whole chain needs that much per step
+            with script_timeout(page.driver, len(steps) * timeout + 5):
+                result = page.driver.execute_async_script(
+                    MACRO_SCRIPT, [s.to_script() for s in steps], int(timeout * 1000), self.poll_ms
+                )
+        except Exception as e:
+            result = {'ok': False, 'failed_step': 0, 'reason': 'error', 'error': str(e), 'timings': []}
+        scripted = time.perf_counter() - start
+
+        outcome = None
+        resume_at = None
+        if not result.get('ok'):
+            resume_at = result.get('failed_step', 0)
+            print(f"Macro '{self.name}' failed at step '{steps[resume_at].label}' "
+                  f"({result.get('reason')}{': ' + result['error'] if result.get('error') else ''}), "
+                  f"falling back from there")
+            # Clicks may have changed the DOM behind the page's element cache
+            page.invalidate_element_cache()
+            try:
+                outcome = self._fall_back(page, steps[resume_at:])
+            except (AssertionError, TimeoutException):
+                # A missing element can mean the previous click had no effect; redo that click
+                # natively, but only now, since re-clicking a toggle that did work would undo it
+                if result.get('reason') != 'missing' or resume_at == 0:
+                    raise
+                resume_at -= 1
+                print(f"Macro '{self.name}': retrying from '{steps[resume_at].label}'")
+                page.invalidate_element_cache()
+                outcome = self._fall_back(page, steps[resume_at:])
+
+        self.records.append({
+            'macro': self.name,
+            'mode': 'script' if result.get('ok') else 'fallback',
+            'duration': round(time.perf_counter() - start, 4),
+            'script_duration': round(scripted, 4),
+            'commands': counter.count - commands_before,
+            'fallback_from': steps[resume_at].label if resume_at is not None else None,
+            'steps': result.get('timings', []),
+        })
+        return outcome
+
+    @staticmethod
+    def _fall_back(page, steps):
+        """Run the page-object fallbacks of steps in order; returns the last result"""
+        outcome = None
+        for step in steps:
+            outcome = step.fallback(page)
+        return outcome
+
+    @classmethod
+    def summary(cls):
+        """Mean duration and command count per macro and mode"""
+        groups = {}
+        for rec in cls.records:
+            groups.setdefault(f"{rec['macro']}:{rec['mode']}", []).append(rec)
+        return {
+            key: {
+                'runs': len(recs),
+                'mean_duration': round(sum(r['duration'] for r in recs) / len(recs), 4),
+                'mean_commands': round(sum(r['commands'] for r in recs) / len(recs), 1),
+            }
+            for key, recs in groups.items()
+        }
+
+    @classmethod
+    def export(cls, path):
+        with open(path, 'w') as f:
+            json.dump({'summary': cls.summary(), 'records': list(cls.records)}, f, indent=2)
+        return path
@@ -0,0 +1,26 @@
+"""Network-level access to the streamed chat response for chat pages"""
+
+from utils.network_capture import NetworkCapture
+
+
+class NetworkResponseMixin:
+    """Adds iter_response_tokens() to chat pages whose driver has CDP capture enabled"""
+
+    response_capture = None
+
+    def _arm_response_capture(self):
+        """Start watching for the chat request; call right before submitting"""
+        self.response_capture = None
+        if NetworkCapture.is_enabled(self.driver):
+            self.response_capture = NetworkCapture(self.driver).arm()
+
+    def iter_response_tokens(self, timeout=60):
+        """Yield (token, cdp_timestamp) for the submitted prompt's reply as bytes arrive.
+
+        Unlike wait_for_response this sees the raw stream, so code blocks and
+        lists are included verbatim. Requires a driver created with
+        capture_network=True.
+        """
+        assert self.response_capture is not None, \
+            "Network capture not enabled - create the driver with capture_network=True (CAPTURE_NETWORK=true)"
+        return self.response_capture.tokens(timeout)
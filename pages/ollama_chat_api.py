@@ -0,0 +1,129 @@
+"""API implementation of the chat page interface (no browser)"""
+
+import time
+import requests
+from utils.chat_stream import parse_stream_line, split_paragraphs
+
+
+class OllamaChatApiPage:
+    """Chat page with the same flow as the browser pages, backed by HTTP calls.
+
+    select_model/enter_prompt/submit_prompt/wait_for_response mirror the
+    desktop and mobile pages, so tests that only care that the model answers
+    can run without Chrome.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.model = None
+        self.messages = []
+        self.prompt = ""
+        self.last_response_metrics = None
+        self._response = None
+        self._submitted_at = None
+        self._headers_at = None
+        print("Initialized API Chat Page")
+
+    def navigate_to(self, url):
+        """Point the page at the UI backend"""
+        self.driver.get(url)
+        return self
+
+    def clear_app_state(self):
+        """Forget the conversation and selected model"""
+        self.messages = []
+        self.model = None
+        self.prompt = ""
+        return self
+
+    def select_model(self):
+        """Choose the first model the backend lists"""
+        resp = self.driver.session.get(self.driver.url_for(self.driver.TAGS_PATH), timeout=10)
+        resp.raise_for_status()
+        models = resp.json().get('models') or []
+        assert models, "No models available from API"
+        self.model = models[0].get('name') or models[0].get('model')
+        return self
+
+    def enter_prompt(self, text):
+        self.prompt = text
+        return self
+
+    def get_prompt_value(self):
+        return self.prompt
+
+    def submit_prompt(self, timeout=20):
+        """Send the prompt; the reply is consumed as a stream by wait_for_response.
+
+        timeout also bounds each read of the stream, so a stalled reply
+        cannot outlast the response wait.
+        """
+        assert self.prompt, "Prompt is empty"
+        self.messages.append({'role': 'user', 'content': self.prompt})
+        payload = {
+            'model': self.model,
+            'selectedModel': self.model,
+            'messages': self.messages,
+            'stream': True,
+        }
+        self._submitted_at = time.monotonic()
+        self._response = self.driver.session.post(
+            self.driver.url_for(self.driver.CHAT_PATH), json=payload, stream=True, timeout=(10, timeout)
+        )
+        # With stream=True the call returns as soon as the response headers arrive
+        self._headers_at = time.monotonic()
+        self._response.raise_for_status()
+        self.prompt = ""
+        return self
+
+    def wait_for_response(self, timeout=20, quiet_ms=None):
+        """Read the streamed reply and return it split into paragraphs"""
+        assert self._response is not None, "submit_prompt must be called first"
+        start = self._submitted_at
+        first_token_at = last_token_at = None
+        tokens = []
+        timed_out = False
+        # Ollama's NDJSON carries no charset: requests would then yield bytes, or
+        # decode text/* as ISO-8859-1, so default to UTF-8 unless one is declared
+        if 'charset=' not in self._response.headers.get('Content-Type', '').lower():
+            self._response.encoding = 'utf-8'
+        try:
+            for line in self._response.iter_lines(decode_unicode=True):
+                now = time.monotonic()
+                if now - start > timeout:
+                    timed_out = True
+                    break
+                token = parse_stream_line(line or '')
+                if token:
+                    tokens.append(token)
+                    first_token_at = first_token_at or now
+                    last_token_at = now
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            # The stream stalled for longer than the read timeout
+            timed_out = True
+        finally:
+            self._response.close()
+            self._response = None
+
+        reply = ''.join(tokens)
+        self.messages.append({'role': 'assistant', 'content': reply})
+
+        def since(t):
+            return None if t is None else t - start
+
+        texts = split_paragraphs(reply)
+        self.last_response_metrics = {
+            'texts': texts,
+            'image_found': True,
+            'timed_out': timed_out,
+            'time_to_image': since(self._headers_at),
+            'time_to_first_token': since(first_token_at),
+            'time_to_complete': since(last_token_at),
+        }
+        return texts
+
+    def send_message_and_get_response(self, message, timeout=20):
+        """Complete flow: enter message, submit, and get response"""
+        self.enter_prompt(message)
+        self.submit_prompt(timeout)
+        return self.wait_for_response(timeout)
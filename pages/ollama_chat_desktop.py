@@ -1,13 +1,17 @@
 """Desktop-specific implementation of Ollama Chat Page"""
 
+import os
+import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
-from time import sleep
+from utils.browser_state import CLEAR_STORAGE_SCRIPT
 from .base_page import BasePage
+from .layout_check import LayoutCheck
+from .response_waiter import wait_for_stable_response
+from .network_response import NetworkResponseMixin
 
-class OllamaChatDesktopPage(BasePage):
+class OllamaChatDesktopPage(BasePage, NetworkResponseMixin):
     """Desktop-specific chat page with desktop UI patterns"""
     
     # Desktop-specific locators
@@ -31,14 +35,24 @@ class OllamaChatDesktopPage(BasePage):
     MAIN_CONTENT = (By.CSS_SELECTOR, '.main-content, .chat-area, .conversation-area')
     SETTINGS_BUTTON = (By.CSS_SELECTOR, '.settings, [aria-label="Settings"]')
     
+    LAYOUT_CHECKS = (
+        LayoutCheck('prompt_input', PROMPT_INPUT),
+        LayoutCheck('submit', SUBMIT_BUTTON),
+        LayoutCheck('sidebar', SIDEBAR, visible_on=('tablet', 'desktop')),
+    )
+    
     def __init__(self, driver):
         super().__init__(driver)
+        self.last_response_metrics = None
+        self.last_upload_timing = None
+        self.last_upload_name_field = None
         print("Initialized Desktop Chat Page")
     
     def navigate_to(self, url):
         """Navigate to the Ollama chat page"""
         print(f"🖥️ DESKTOP: Navigating to {url}")
         self.driver.get(url)
+        self.invalidate_element_cache()
         
         # Assert page loaded successfully
         current_url = self.driver.current_url
@@ -59,9 +73,9 @@ class OllamaChatDesktopPage(BasePage):
         if not file_inputs:
             # Click add image button to reveal input
             assert self.is_element_present(self.ADD_IMAGE_BUTTON), "Add image button not found"
-            add_btn = self.wait.until(EC.presence_of_element_located(self.ADD_IMAGE_BUTTON))
+            add_btn = self.find_element(self.ADD_IMAGE_BUTTON)
             try:
-                self.wait.until(EC.element_to_be_clickable(self.ADD_IMAGE_BUTTON))
+                self.wait.until(EC.element_to_be_clickable(add_btn))
                 self.driver.execute_script(
                     "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
                     add_btn,
@@ -72,13 +86,16 @@ class OllamaChatDesktopPage(BasePage):
             file_inputs = self.driver.find_elements(*self.FILE_INPUT_ANY)
 
         assert len(file_inputs) > 0, "No file input found for image upload"
+        start = time.monotonic()
         file_inputs[0].send_keys(image_path)
+        sent = time.monotonic()
 
         # Enter name (wait for animated field to appear)
         try:
             name_field = self.wait.until(EC.presence_of_element_located(self.CHAT_IMAGE_NAME_INPUT))
         except Exception:
             assert False, "Name input for image/chat not found"
+        named = time.monotonic()
         name_field.click()
         name_field.clear()
         name_field.send_keys(name_text)
@@ -86,6 +103,14 @@ class OllamaChatDesktopPage(BasePage):
         # Submit
         assert self.is_element_present(self.SUBMIT_BUTTON), "Submit button not found"
         self.click_element(self.SUBMIT_BUTTON)
+        # Benchmarks time the submit by waiting for this field to go away
+        self.last_upload_name_field = name_field
+        self.last_upload_timing = {
+            'bytes': os.path.getsize(image_path),
+            'send_keys': sent - start,
+            'name_field': named - start,
+            'started_at': start,
+        }
         return self
     
     def clear_app_state(self):
@@ -93,17 +118,14 @@ class OllamaChatDesktopPage(BasePage):
         print("🖥️ DESKTOP: Clearing application state")
         
         try:
-            self.driver.execute_script(
-                "try { localStorage.clear(); } catch (e) { console.log('localStorage not available'); }"
-                "try { sessionStorage.clear(); } catch (e) { console.log('sessionStorage not available'); }"
-                "try { indexedDB.databases().then(dbs => dbs.forEach(db => indexedDB.deleteDatabase(db.name))); } catch (e) { console.log('indexedDB not available'); }"
-            )
+            self.driver.execute_script(CLEAR_STORAGE_SCRIPT)
             print("✅ DESKTOP: Browser storage cleared successfully")
         except Exception as e:
             print(f"⚠️ DESKTOP: Warning - Could not clear browser storage: {e}")
         
         print("🖥️ DESKTOP: Refreshing page")
         self.driver.refresh()
+        self.invalidate_element_cache()
         
         # Wait for page to be fully loaded
         self.wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
@@ -167,94 +189,59 @@ class OllamaChatDesktopPage(BasePage):
     
     def get_prompt_value(self):
         """Get the current value of the prompt input"""
-        element = self.wait.until(EC.presence_of_element_located(self.PROMPT_INPUT))
-        return element.get_attribute("value")
+        return self._with_element(self.PROMPT_INPUT, lambda el: el.get_attribute("value"))
     
     def submit_prompt(self):
         """Submit prompt with desktop-optimized interaction"""
+        self._arm_response_capture()
         print("🖥️ DESKTOP: Submitting prompt")
         
         # Assert submit button exists
         assert self.is_element_present(self.SUBMIT_BUTTON), "Submit button not found on desktop"
         print("✅ DESKTOP: Submit button found")
         
-        submit_button = self.wait.until(EC.presence_of_element_located(self.SUBMIT_BUTTON))
-        
         # Wait for button to be enabled
-        self.wait.until(lambda d: submit_button.is_enabled())
-        assert submit_button.is_enabled(), "Submit button is not enabled on desktop"
+        self.wait.until(lambda d: self._with_element(self.SUBMIT_BUTTON, lambda el: el.is_enabled()))
         print("✅ DESKTOP: Submit button is enabled")
         
         # Desktop can use instant scrolling
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-            submit_button
-        )
+        self._with_element(self.SUBMIT_BUTTON, lambda el: self.driver.execute_script(
+            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", el
+        ))
         print("✅ DESKTOP: Scrolled to submit button")
         
         # Wait for button to be clickable after scrolling
-        self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON)).click()
+        self.click_element(self.SUBMIT_BUTTON)
         print("✅ DESKTOP: Prompt submitted successfully")
         
         return self
     
-    def wait_for_response(self, timeout=20):
+    def wait_for_response(self, timeout=20, quiet_ms=750):
         """Wait for AI response on desktop"""
         print("🖥️ DESKTOP: Waiting for AI response")
-        response_wait = WebDriverWait(self.driver, timeout)
-        
-        # Wait for ollama.png image to appear
-        try:
-            ollama_img = response_wait.until(
-                EC.presence_of_element_located(self.OLLAMA_IMG)
-            )
-            print("✅ DESKTOP: Found ollama.png image - response started")
-        except Exception as e:
-            assert False, f"Ollama response image not found on desktop within {timeout}s: {e}"
-        
-        # Desktop-specific response detection
-        response_xpath = "//img[@src='/ollama.png']/ancestor::div[1]//p | //img[@src='/ollama.png']/following-sibling::*/descendant-or-self::p"
         
-        # Wait for response text to stabilize
-        print("🖥️ DESKTOP: Waiting for response text to stabilize")
-        last_text = ""
-        stable_count = 0
-        max_attempts = 20
+        # Single in-page wait: resolves once the response DOM has been quiet for quiet_ms
+        result = wait_for_stable_response(self.driver, timeout, quiet_ms)
+        self.last_response_metrics = result
         
-        while stable_count < 3 and max_attempts > 0:
-            try:
-                response_paragraphs = self.driver.find_elements(By.XPATH, response_xpath)
-                current_text = "\n".join([p.text.strip() for p in response_paragraphs if p.text.strip()])
-                
-                if current_text and current_text == last_text:
-                    stable_count += 1
-                elif current_text:
-                    stable_count = 0
-                    last_text = current_text
-                
-            except Exception as e:
-                print(f"⚠️ DESKTOP: Error finding response: {e}")
-            
-            max_attempts -= 1
-            sleep(0.5)
+        assert result['image_found'], f"Ollama response image not found on desktop within {timeout}s"
+        print("✅ DESKTOP: Found ollama.png image - response started")
         
-        # Get final response
-        try:
-            response_paragraphs = self.driver.find_elements(By.XPATH, response_xpath)
-            response_texts = [p.text.strip() for p in response_paragraphs if p.text.strip()]
-            
-            # Assert we got a response
-            assert len(response_texts) > 0, "No response text found on desktop"
-            assert any(len(text) > 0 for text in response_texts), "Response text is empty on desktop"
-            
-            print(f"✅ DESKTOP: Response received successfully - {len(response_texts)} paragraph(s)")
-            
-        except Exception as e:
-            print(f"❌ DESKTOP: Error getting final response: {e}")
-            response_texts = []
+        response_texts = result['texts']
+        if not response_texts:
+            print("❌ DESKTOP: Error getting final response: No response text found on desktop")
+            return response_texts
         
+        print(f"✅ DESKTOP: Response received successfully - {len(response_texts)} paragraph(s) "
+              f"(first token {result['time_to_first_token']:.2f}s, complete {result['time_to_complete']:.2f}s)")
         return response_texts
     
+    def send_message_and_get_response(self, message, timeout=20):
+        """Complete flow: enter message, submit, and get response"""
+        self.enter_prompt(message)
+        self.submit_prompt()
+        return self.wait_for_response(timeout)
+    
     def access_settings(self):
         """Access settings menu (desktop-specific)"""
         try:
@@ -266,4 +253,4 @@ class OllamaChatDesktopPage(BasePage):
     
     def check_sidebar_presence(self):
         """Check if sidebar is present (desktop layout indicator)"""
-        return self.is_element_present(self.SIDEBAR)
+        return self.is_element_present(self.SIDEBAR, optional=True)
@@ -1,22 +1,41 @@
 """Mobile-specific implementation of Ollama Chat Page"""
 
+import os
+import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
 from time import sleep
+from utils.browser_state import CLEAR_STORAGE_SCRIPT
 from .base_page import BasePage
+from .layout_check import LayoutCheck
+from .locators import AnyOf
+from .response_waiter import wait_for_stable_response
+from .network_response import NetworkResponseMixin
 
-class OllamaChatMobilePage(BasePage):
+class OllamaChatMobilePage(BasePage, NetworkResponseMixin):
     """Mobile-specific chat page with mobile UI patterns"""
     
     # Mobile-specific locators
-    MENU_BUTTON = (By.CSS_SELECTOR, '[aria-label="Menu"], .hamburger, .mobile-menu-btn')
+    MENU_BUTTON = AnyOf(
+        (By.CSS_SELECTOR, '[aria-label="Menu"]'),
+        (By.CSS_SELECTOR, '.hamburger'),
+        (By.CSS_SELECTOR, '.mobile-menu-btn'),
+    )
     SELECT_MODEL_BUTTON = (By.XPATH, "//button[contains(text(), 'Select model')] | //button[contains(@class, 'model-select')]")
     MODEL_DIALOG = (By.XPATH, '//div[@role="dialog"] | //div[contains(@class, "modal")] | //div[contains(@class, "sheet")]')
     FIRST_MODEL_BUTTON = (By.XPATH, '//div[@role="dialog"]//button | //div[contains(@class, "modal")]//button | //div[contains(@class, "sheet")]//button')
-    PROMPT_INPUT = (By.CSS_SELECTOR, '[placeholder="Enter your prompt here"], textarea, input[type="text"], .message-input')
-    SUBMIT_BUTTON = (By.CSS_SELECTOR, 'button[type="submit"], .send-button, [aria-label*="send"], [aria-label*="Send"]')
+    # Candidates are tried together in one script, most specific first
+    PROMPT_INPUT = AnyOf(
+        (By.CSS_SELECTOR, '[placeholder="Enter your prompt here"]'),
+        (By.CSS_SELECTOR, '.message-input'),
+        (By.CSS_SELECTOR, 'textarea'),
+        (By.CSS_SELECTOR, 'input[type="text"]'),
+    )
+    SUBMIT_BUTTON = AnyOf(
+        (By.CSS_SELECTOR, 'button[type="submit"]'),
+        (By.CSS_SELECTOR, '.send-button'),
+        (By.CSS_SELECTOR, '[aria-label*="send"], [aria-label*="Send"]'),
+    )
     OLLAMA_IMG = (By.XPATH, "//img[@src='/ollama.png']")
     # Image upload related
     ADD_IMAGE_BUTTON = (By.XPATH, "//svg[contains(@class,'lucide-image') and contains(@class,'w-5') and contains(@class,'h-5')]/ancestor::button[1]")
@@ -31,14 +50,23 @@ class OllamaChatMobilePage(BasePage):
     CHAT_CONTAINER = (By.CSS_SELECTOR, '.chat-container, .messages, .conversation')
     MOBILE_HEADER = (By.CSS_SELECTOR, '.mobile-header, .chat-header')
     
+    LAYOUT_CHECKS = (
+        LayoutCheck('prompt_input', PROMPT_INPUT),
+        LayoutCheck('submit', SUBMIT_BUTTON),
+    )
+    
     def __init__(self, driver):
         super().__init__(driver)
+        self.last_response_metrics = None
+        self.last_upload_timing = None
+        self.last_upload_name_field = None
         print("Initialized Mobile Chat Page")
     
     def navigate_to(self, url):
         """Navigate to the Ollama chat page"""
         print(f"📱 MOBILE: Navigating to {url}")
         self.driver.get(url)
+        self.invalidate_element_cache()
         
         # Wait for mobile-specific elements to load
         self.wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
@@ -60,17 +88,14 @@ class OllamaChatMobilePage(BasePage):
         print("📱 MOBILE: Clearing application state")
         
         try:
-            self.driver.execute_script(
-                "try { localStorage.clear(); } catch (e) { console.log('localStorage not available'); }"
-                "try { sessionStorage.clear(); } catch (e) { console.log('sessionStorage not available'); }"
-                "try { indexedDB.databases().then(dbs => dbs.forEach(db => indexedDB.deleteDatabase(db.name))); } catch (e) { console.log('indexedDB not available'); }"
-            )
+            self.driver.execute_script(CLEAR_STORAGE_SCRIPT)
             print("✅ MOBILE: Browser storage cleared successfully")
         except Exception as e:
             print(f"⚠️ MOBILE: Warning - Could not clear browser storage: {e}")
         
         print("📱 MOBILE: Refreshing page")
         self.driver.refresh()
+        self.invalidate_element_cache()
         
         # Wait for page to be fully loaded
         self.wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
@@ -110,13 +135,16 @@ class OllamaChatMobilePage(BasePage):
             file_inputs = self.driver.find_elements(*self.FILE_INPUT_ANY)
 
         assert len(file_inputs) > 0, "No file input available for image upload (mobile)"
+        start = time.monotonic()
         file_inputs[0].send_keys(image_path)
+        sent = time.monotonic()
 
         # Enter provided name (may require focus due to virtual keyboard)
         try:
             name_field = self.wait.until(EC.presence_of_element_located(self.CHAT_IMAGE_NAME_INPUT))
         except Exception:
             assert False, "Name input for image/chat not found (mobile)"
+        named = time.monotonic()
         name_field.click()
         name_field.clear()
         name_field.send_keys(name_text)
@@ -124,13 +152,21 @@ class OllamaChatMobilePage(BasePage):
         # Submit
         assert self.is_element_present(self.SUBMIT_BUTTON), "Submit button not found (mobile)"
         self.click_element(self.SUBMIT_BUTTON)
+        # Benchmarks time the submit by waiting for this field to go away
+        self.last_upload_name_field = name_field
+        self.last_upload_timing = {
+            'bytes': os.path.getsize(image_path),
+            'send_keys': sent - start,
+            'name_field': named - start,
+            'started_at': start,
+        }
         return self
     
     def open_model_selection(self):
         """Open model selection - might require opening menu first on mobile"""
         try:
             # Try to find and click menu button first (mobile pattern)
-            if self.is_element_present(self.MENU_BUTTON):
+            if self.is_element_present(self.MENU_BUTTON, optional=True):
                 self.click_element(self.MENU_BUTTON)
                 sleep(0.5)  # Brief wait for menu animation
         except:
@@ -173,15 +209,15 @@ class OllamaChatMobilePage(BasePage):
         print("✅ MOBILE: Prompt input field found")
         
         # Mobile inputs might need different handling
-        prompt_element = self.wait.until(EC.presence_of_element_located(self.PROMPT_INPUT))
-        
-        # Focus the input (important on mobile)
-        prompt_element.click()
-        prompt_element.clear()
-        prompt_element.send_keys(text)
+        def _type(prompt_element):
+            # Focus the input (important on mobile)
+            prompt_element.click()
+            prompt_element.clear()
+            prompt_element.send_keys(text)
+        self._with_element(self.PROMPT_INPUT, _type)
         
         # Assert text was entered correctly
-        entered_text = prompt_element.get_attribute("value") or prompt_element.text
+        entered_text = self.get_prompt_value()
         assert text in entered_text, f"Text not entered correctly. Expected: '{text}', Found: '{entered_text}'"
         print(f"✅ MOBILE: Text entered successfully: '{entered_text}'")
         
@@ -189,89 +225,54 @@ class OllamaChatMobilePage(BasePage):
     
     def get_prompt_value(self):
         """Get the current value of the prompt input"""
-        element = self.wait.until(EC.presence_of_element_located(self.PROMPT_INPUT))
-        return element.get_attribute("value") or element.text
+        return self._with_element(self.PROMPT_INPUT, lambda el: el.get_attribute("value") or el.text)
     
     def submit_prompt(self):
         """Submit prompt with mobile-optimized interaction"""
+        self._arm_response_capture()
         print("📱 MOBILE: Submitting prompt")
         
         # Assert submit button exists
         assert self.is_element_present(self.SUBMIT_BUTTON), "Submit button not found on mobile"
         print("✅ MOBILE: Submit button found")
         
-        submit_button = self.wait.until(EC.presence_of_element_located(self.SUBMIT_BUTTON))
-        
         # Scroll to submit button (mobile needs this)
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", 
-            submit_button
-        )
+        self._with_element(self.SUBMIT_BUTTON, lambda el: self.driver.execute_script(
+            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", el
+        ))
         print("✅ MOBILE: Scrolled to submit button")
         
         # Wait for button to be enabled and clickable
-        self.wait.until(lambda d: submit_button.is_enabled())
-        assert submit_button.is_enabled(), "Submit button is not enabled on mobile"
+        self.wait.until(lambda d: self._with_element(self.SUBMIT_BUTTON, lambda el: el.is_enabled()))
         print("✅ MOBILE: Submit button is enabled")
         
-        self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON)).click()
+        self.click_element(self.SUBMIT_BUTTON)
         print("✅ MOBILE: Prompt submitted successfully")
         
         return self
     
-    def wait_for_response(self, timeout=20):
+    def wait_for_response(self, timeout=20, quiet_ms=750):
         """Wait for AI response on mobile"""
         print("📱 MOBILE: Waiting for AI response")
-        response_wait = WebDriverWait(self.driver, timeout)
         
-        # Wait for ollama.png image to appear
-        try:
-            ollama_img = response_wait.until(
-                EC.presence_of_element_located(self.OLLAMA_IMG)
-            )
-            print("✅ MOBILE: Found ollama.png image - response started")
-        except Exception as e:
-            assert False, f"Ollama response image not found on mobile within {timeout}s: {e}"
-        
-        # Mobile-specific response detection
-        response_xpath = "//img[@src='/ollama.png']/ancestor::div[1]//p | //img[@src='/ollama.png']/following-sibling::*/descendant-or-self::p"
-        
-        # Wait for response text to stabilize
-        print("📱 MOBILE: Waiting for response text to stabilize")
-        last_text = ""
-        stable_count = 0
-        max_attempts = 20
+        # Single in-page wait: resolves once the response DOM has been quiet for quiet_ms
+        result = wait_for_stable_response(self.driver, timeout, quiet_ms)
+        self.last_response_metrics = result
         
-        while stable_count < 3 and max_attempts > 0:
-            try:
-                response_paragraphs = self.driver.find_elements(By.XPATH, response_xpath)
-                current_text = "\n".join([p.text.strip() for p in response_paragraphs if p.text.strip()])
-                
-                if current_text and current_text == last_text:
-                    stable_count += 1
-                elif current_text:
-                    stable_count = 0
-                    last_text = current_text
-                
-            except Exception as e:
-                print(f"⚠️ MOBILE: Error finding response: {e}")
-            
-            max_attempts -= 1
-            sleep(0.5)
+        assert result['image_found'], f"Ollama response image not found on mobile within {timeout}s"
+        print("✅ MOBILE: Found ollama.png image - response started")
         
-        # Get final response
-        try:
-            response_paragraphs = self.driver.find_elements(By.XPATH, response_xpath)
-            response_texts = [p.text.strip() for p in response_paragraphs if p.text.strip()]
-            
-            # Assert we got a response
-            assert len(response_texts) > 0, "No response text found on mobile"
-            assert any(len(text) > 0 for text in response_texts), "Response text is empty on mobile"
-            
-            print(f"✅ MOBILE: Response received successfully - {len(response_texts)} paragraph(s)")
-            
-        except Exception as e:
-            print(f"❌ MOBILE: Error getting final response: {e}")
-            response_texts = []
+        response_texts = result['texts']
+        if not response_texts:
+            print("❌ MOBILE: Error getting final response: No response text found on mobile")
+            return response_texts
         
+        print(f"✅ MOBILE: Response received successfully - {len(response_texts)} paragraph(s) "
+              f"(first token {result['time_to_first_token']:.2f}s, complete {result['time_to_complete']:.2f}s)")
         return response_texts
+    
+    def send_message_and_get_response(self, message, timeout=20):
+        """Complete flow: enter message, submit, and get response"""
+        self.enter_prompt(message)
+        self.submit_prompt()
+        return self.wait_for_response(timeout)
@@ -1,11 +1,10 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException
-from time import sleep
+from utils.browser_state import CLEAR_STORAGE_SCRIPT
 from .base_page import BasePage
+from .response_waiter import wait_for_stable_response
+from .network_response import NetworkResponseMixin
 
-class OllamaChatPage(BasePage):
+class OllamaChatPage(BasePage, NetworkResponseMixin):
     # Locators
     SELECT_MODEL_BUTTON = (By.XPATH, "//button[normalize-space(text())='Select model']")
     MODEL_DIALOG = (By.XPATH, '//div[@role="dialog"]')
@@ -16,24 +15,23 @@ class OllamaChatPage(BasePage):
     
     def __init__(self, driver):
         super().__init__(driver)
+        self.last_response_metrics = None
     
     def navigate_to(self, url):
         """Navigate to the Ollama chat page"""
         self.driver.get(url)
+        self.invalidate_element_cache()
         return self
     
     def clear_app_state(self):
         """Clear browser storage and refresh page"""
         try:
-            self.driver.execute_script(
-                "try { localStorage.clear(); } catch (e) { console.log('localStorage not available'); }"
-                "try { sessionStorage.clear(); } catch (e) { console.log('sessionStorage not available'); }"
-                "try { indexedDB.databases().then(dbs => dbs.forEach(db => indexedDB.deleteDatabase(db.name))); } catch (e) { console.log('indexedDB not available'); }"
-            )
+            self.driver.execute_script(CLEAR_STORAGE_SCRIPT)
         except Exception as e:
             print(f"Warning: Could not clear browser storage: {e}")
         
         self.driver.refresh()
+        self.invalidate_element_cache()
         # Wait for page to be fully loaded
         self.wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
         return self
@@ -54,75 +52,34 @@ class OllamaChatPage(BasePage):
     
     def get_prompt_value(self):
         """Get the current value of the prompt input"""
-        element = self.wait.until(EC.presence_of_element_located(self.PROMPT_INPUT))
-        return element.get_attribute("value")
+        return self._with_element(self.PROMPT_INPUT, lambda el: el.get_attribute("value"))
     
     def submit_prompt(self):
         """Click the submit button to send the prompt"""
-        submit_button = self.wait.until(EC.presence_of_element_located(self.SUBMIT_BUTTON))
-        
+        self._arm_response_capture()
         # Wait for button to be enabled
-        self.wait.until(lambda d: submit_button.is_enabled())
+        self.wait.until(lambda d: self._with_element(self.SUBMIT_BUTTON, lambda el: el.is_enabled()))
         
         # Scroll to button and click
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", 
-            submit_button
-        )
+        self._with_element(self.SUBMIT_BUTTON, lambda el: self.driver.execute_script(
+            "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});", el
+        ))
         
         # Wait for button to be clickable after scrolling
-        self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON)).click()
+        self.click_element(self.SUBMIT_BUTTON)
         return self
     
-    def wait_for_response(self, timeout=20):
+    def wait_for_response(self, timeout=20, quiet_ms=750):
         """Wait for AI response to appear next to ollama.png and return response text"""
-        # Create a longer wait for response timeout
-        response_wait = WebDriverWait(self.driver, timeout)
-        
-        # Wait for ollama.png image to appear (indicates response started)
-        ollama_img = response_wait.until(
-            EC.presence_of_element_located((By.XPATH, "//img[@src='/ollama.png']"))
-        )
-        print("Found ollama.png image")
-        
-        # Find the container that has the ollama image and look for p tags nearby
-        # Look for p tags that are siblings or descendants of the same container
-        response_xpath = "//img[@src='/ollama.png']/ancestor::div[1]//p | //img[@src='/ollama.png']/following-sibling::*/descendant-or-self::p"
-        
-        # Wait for response text to stabilize (no new text being added)
-        last_text = ""
-        stable_count = 0
-        max_attempts = 20
-        
-        while stable_count < 3 and max_attempts > 0:
-            try:
-                response_paragraphs = self.driver.find_elements(By.XPATH, response_xpath)
-                current_text = "\n".join([p.text.strip() for p in response_paragraphs if p.text.strip()])
-                
-                if current_text and current_text == last_text:
-                    stable_count += 1
-                elif current_text:
-                    stable_count = 0
-                    last_text = current_text
-                
-            except Exception as e:
-                print(f"Error finding response: {e}")
-            
-            max_attempts -= 1
-            sleep(0.5)  # Short sleep to check for changes
-        
-        # Get final response
-        try:
-            response_paragraphs = self.driver.find_elements(By.XPATH, response_xpath)
-            response_texts = [p.text.strip() for p in response_paragraphs if p.text.strip()]
-        except Exception as e:
-            print(f"Error getting final response: {e}")
-            response_texts = []
-        
-        return response_texts
+        # Resolves in-page once the response DOM has been quiet for quiet_ms
+        result = wait_for_stable_response(self.driver, timeout, quiet_ms)
+        self.last_response_metrics = result
+        if result['image_found']:
+            print("Found ollama.png image")
+        return result['texts']
     
-    def send_message_and_get_response(self, message):
+    def send_message_and_get_response(self, message, timeout=20):
         """Complete flow: enter message, submit, and get response"""
         self.enter_prompt(message)
         self.submit_prompt()
-        return self.wait_for_response()
+        return self.wait_for_response(timeout)
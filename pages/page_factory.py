@@ -1,14 +1,8 @@
 """Page Factory to create appropriate page objects based on device type"""
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from utils.device_config import DeviceConfig
-from .ollama_chat_mobile import OllamaChatMobilePage
-from .ollama_chat_desktop import OllamaChatDesktopPage
-from .sidebar_page import SidebarPage
-from .settings_page import SettingsPage
+
+# Page modules are imported on first use so importing the factory stays cheap
 
 class PageFactory:
     """Factory class to create device-appropriate page objects"""
@@ -16,27 +10,30 @@ class PageFactory:
     @staticmethod
     def create_chat_page(driver):
         """Create appropriate chat page based on driver's device type"""
-        # Detect device type from window size
-        try:
-            size = driver.get_window_size()
-            width = size['width']
-            breakpoint = DeviceConfig.get_breakpoint(width)
-            device_config = DeviceConfig.get_device_config(breakpoint)
-            
-            print(f"Creating chat page for {device_config['name']} device (width: {width}px)")
-            
-            if DeviceConfig.is_mobile_device(device_config):
-                return OllamaChatMobilePage(driver)
-            else:
-                return OllamaChatDesktopPage(driver)
-                
-        except Exception as e:
-            print(f"Error detecting device type: {e}, defaulting to desktop")
-            return OllamaChatDesktopPage(driver)
+        from utils.api_driver import ApiDriver
+        # Browser-free fast path
+        if isinstance(driver, ApiDriver):
+            from .ollama_chat_api import OllamaChatApiPage
+            return OllamaChatApiPage(driver)
+        # Device is detected once per driver and shared with the pages
+        from utils.driver_context import DriverContext
+        device_config = DriverContext.for_driver(driver).device
+        print(f"Creating chat page for {device_config.name} device (width: {device_config.width}px)")
+        return PageFactory.chat_page_class(device_config)(driver)
+
+    @staticmethod
+    def chat_page_class(device_config):
+        """Chat page class used for a device (mobile layout below the desktop breakpoint)"""
+        from .ollama_chat_desktop import OllamaChatDesktopPage
+        from .ollama_chat_mobile import OllamaChatMobilePage
+        if DeviceConfig.is_mobile_device(device_config):
+            return OllamaChatMobilePage
+        return OllamaChatDesktopPage
 
     @staticmethod
     def create_sidebar_page(driver):
         """Create SidebarPage (single implementation handles mobile differences)."""
+        from .sidebar_page import SidebarPage
         return SidebarPage(driver)
     
     @staticmethod
@@ -44,23 +41,52 @@ class PageFactory:
         """Create chat page for specific device type"""
         device_config = DeviceConfig.get_device_config(device_name)
         
-        print(f"Creating chat page for {device_config['name']} device")
-        
-        if DeviceConfig.is_mobile_device(device_config):
-            return OllamaChatMobilePage(driver)
-        else:
-            return OllamaChatDesktopPage(driver)
+        print(f"Creating chat page for {device_config.name} device")
+        return PageFactory.chat_page_class(device_config)(driver)
 
     @staticmethod
     def create_sidebar_page_for_device(driver, device_name):
         """Create SidebarPage for specific device type (API parity)."""
+        from .sidebar_page import SidebarPage
         return SidebarPage(driver)
 
     @staticmethod
     def create_settings_page(driver):
         """Return a SettingsPage instance."""
+        from .settings_page import SettingsPage
         return SettingsPage(driver)
     
+    @staticmethod
+    def open_chat(driver, base_url, state=None):
+        """Load the chat screen with seeded client state (empty state = clean app) in one navigation"""
+        from utils.api_driver import ApiDriver
+        from utils.app_state import AppState, seed_state
+        if isinstance(driver, ApiDriver):
+            driver.get(base_url)
+        else:
+            seed_state(driver, base_url, state or AppState())
+        return PageFactory.create_chat_page(driver)
+
+    @staticmethod
+    def open_conversation(driver, base_url, conversation_id, state=None):
+        """Deep-link into a stored conversation, seeding state first"""
+        from utils.api_driver import ApiDriver
+        from utils.app_state import AppRoutes, AppState, seed_state
+        if isinstance(driver, ApiDriver):
+            raise ValueError("Conversation deep links need a browser driver (DRIVER_MODE=browser)")
+        seed_state(driver, AppRoutes.conversation(base_url, conversation_id), state or AppState())
+        return PageFactory.create_chat_page(driver)
+
+    @staticmethod
+    def open_settings(driver, base_url, state=None):
+        """Deep-link to Settings, seeding state first; returns the loaded SettingsPage"""
+        from utils.api_driver import ApiDriver
+        from utils.app_state import AppRoutes, AppState, seed_state
+        if isinstance(driver, ApiDriver):
+            raise ValueError("Settings need a browser driver (DRIVER_MODE=browser)")
+        seed_state(driver, AppRoutes.settings(base_url), state or AppState())
+        return PageFactory.create_settings_page(driver).wait_for_load()
+
     @staticmethod
     def get_supported_devices():
         """Get list of supported device types"""
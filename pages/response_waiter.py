@@ -0,0 +1,78 @@
+"""Event-driven detection of a completed AI response using a MutationObserver"""
+
+from utils.wait_engine import script_timeout
+
+OLLAMA_IMG_XPATH = "//img[@src='/ollama.png']"
+RESPONSE_XPATH = "//img[@src='/ollama.png']/ancestor::div[1]//p | //img[@src='/ollama.png']/following-sibling::*/descendant-or-self::p"
+
+# Resolves once response text exists and the DOM has been quiet for quietMs,
+# or when timeoutMs elapses. Returns every paragraph text in one round-trip.
+RESPONSE_WAIT_SCRIPT = """
+const imgXPath = arguments[0], responseXPath = arguments[1];
+const quietMs = arguments[2], timeoutMs = arguments[3];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+let firstTokenAt = null, lastChangeAt = null, imageAt = null, lastText = '';
+let observer = null, quietTimer = null, timeoutTimer = null;
+
+function readTexts() {
+    const snap = document.evaluate(responseXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const texts = [];
+    for (let i = 0; i < snap.snapshotLength; i++) {
+        const text = (snap.snapshotItem(i).innerText || '').trim();
+        if (text) texts.push(text);
+    }
+    return texts;
+}
+
+function finish(timedOut) {
+    if (observer) observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(timeoutTimer);
+    const ms = (t) => t === null ? null : (t - start) / 1000;
+    done({
+        texts: readTexts(),
+        image_found: imageAt !== null,
+        timed_out: timedOut,
+        time_to_image: ms(imageAt),
+        time_to_first_token: ms(firstTokenAt),
+        time_to_complete: ms(lastChangeAt),
+    });
+}
+
+function check() {
+    const now = performance.now();
+    if (imageAt === null) {
+        const img = document.evaluate(imgXPath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (!img) return;
+        imageAt = now;
+    }
+    const text = readTexts().join('\\n');
+    if (text !== lastText) {
+        lastText = text;
+        lastChangeAt = now;
+        if (text && firstTokenAt === null) firstTokenAt = now;
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(() => finish(false), quietMs);
+    }
+}
+
+observer = new MutationObserver(check);
+observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+timeoutTimer = setTimeout(() => finish(true), timeoutMs);
+check();
+"""
+
+
+def wait_for_stable_response(driver, timeout=20, quiet_ms=750):
+    """Block until the response under /ollama.png stops changing.
+
+    Returns a dict with the paragraph ``texts`` plus ``image_found``,
+    ``timed_out`` and the ``time_to_image``, ``time_to_first_token`` and
+    ``time_to_complete`` timings in seconds (measured from the call).
+    """
+    # Leave headroom so the in-page timeout always wins over the WebDriver one
+    with script_timeout(driver, timeout + 5):
+        return driver.execute_async_script(
+            RESPONSE_WAIT_SCRIPT, OLLAMA_IMG_XPATH, RESPONSE_XPATH, quiet_ms, int(timeout * 1000)
+        )
@@ -1,5 +1,4 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
 
@@ -10,16 +9,17 @@ class SettingsPage(BasePage):
     THEME_LIGHT_BUTTON = (By.XPATH, "//button[.//p[normalize-space()='Light']]")
 
     def wait_for_load(self):
-        self.wait.until(EC.presence_of_element_located(self.NAME_INPUT))
-        assert self.is_element_present(self.NAME_INPUT), "Name input not present on Settings page"
+        try:
+            self.find_element(self.NAME_INPUT)
+        except TimeoutException:
+            assert False, "Name input not present on Settings page"
         return self
 
     def enter_name(self, name: str):
         assert name, "Name must be a non-empty string"
         self.enter_text(self.NAME_INPUT, name)
         # Verify text entered
-        element = self.wait.until(EC.presence_of_element_located(self.NAME_INPUT))
-        value = element.get_attribute("value") or element.text
+        value = self._with_element(self.NAME_INPUT, lambda el: el.get_attribute("value") or el.text)
         assert name in (value or ""), f"Expected name '{name}' to be entered, got '{value}'"
         return self
 
@@ -1,14 +1,15 @@
 """Unified Sidebar Page with a shared API for all devices"""
 
-import sys
-import os
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from utils.wait_engine import script_timeout
 
 from .base_page import BasePage
+from .layout_check import LayoutCheck
+from .locators import AnyOf
+from .navigation_macro import MacroStep, NavigationMacro
+from .virtual_list import SCAN_TIMEOUT, VIRTUAL_LIST_SCRIPT
 
 
 class SidebarPage(BasePage):
@@ -16,7 +17,12 @@ class SidebarPage(BasePage):
 
     # Common locators (kept broad to be resilient)
     HAMBURGER_BUTTON = (By.CSS_SELECTOR, "[data-testid='hamburger-button'], button[aria-haspopup='dialog'][data-state]")
-    SIDEBAR = (By.CSS_SELECTOR, "[role='dialog'], .sidebar, .side-panel, .drawer, .sheet, [data-testid='sidebar']")
+    SIDEBAR = AnyOf(
+        (By.CSS_SELECTOR, "[data-testid='sidebar']"),
+        (By.CSS_SELECTOR, "[role='dialog']"),
+        (By.CSS_SELECTOR, ".sidebar, .side-panel"),
+        (By.CSS_SELECTOR, ".drawer, .sheet"),
+    )
     NEW_CHAT_BUTTON = (By.CSS_SELECTOR, "button:has(svg[aria-label='New']), .new-chat, [aria-label='New chat']")
     SETTINGS_BUTTON = (By.CSS_SELECTOR, ".settings, [aria-label='Settings'], button[title*='Settings']")
     COLLAPSE_TOGGLE = (By.CSS_SELECTOR, "[aria-label*='Collapse'], [aria-label*='Expand']")
@@ -24,13 +30,24 @@ class SidebarPage(BasePage):
     CLOSE_BUTTON = (By.XPATH, "//button[.//span[contains(@class,'sr-only') and normalize-space()='Close']]")
     # New reliable test IDs from app
     USER_MENU_BUTTON_STRICT = (By.XPATH, "//button[@data-testid='user-menu-button']")
-    USER_MENU_BUTTON = (
+    USER_MENU_BUTTON_FALLBACK = (
         By.XPATH,
         "//body//*[contains(@class,'antialiased') and contains(@class,'tracking-tight') and contains(@class,'__className_')]//button[@aria-haspopup='menu']",
     )
+    USER_MENU_BUTTON = AnyOf(USER_MENU_BUTTON_STRICT, USER_MENU_BUTTON_FALLBACK)
     MENU_PULL_MODEL = (By.CSS_SELECTOR, "[data-testid='menu-pull-model']")
     MENU_SETTINGS = (By.CSS_SELECTOR, "[data-testid='menu-settings']")
 
+    # Closed-drawer layout below the tablet breakpoint, docked sidebar above it
+    LAYOUT_CHECKS = (
+        LayoutCheck('hamburger', HAMBURGER_BUTTON, visible_on=('mobile',)),
+        LayoutCheck('sidebar', SIDEBAR, visible_on=('tablet', 'desktop')),
+        LayoutCheck('new_chat', NEW_CHAT_BUTTON, visible_on=('tablet', 'desktop')),
+    )
+
+    # Built on first use: it needs SettingsPage, which is imported lazily
+    _settings_macro = None
+
     def __init__(self, driver):
         super().__init__(driver)
         print("Initialized Unified Sidebar Page")
@@ -38,7 +55,7 @@ class SidebarPage(BasePage):
     def open_sidebar_if_needed(self):
         """If on mobile and sidebar is closed, tap the hamburger to open it."""
         try:
-            if self.is_mobile() and not self.is_element_present(self.SIDEBAR):
+            if self.is_mobile() and not self.is_element_present(self.SIDEBAR, optional=True):
                 assert self.is_element_present(self.HAMBURGER_BUTTON), "Hamburger button not found on mobile"
                 self.click_hamburger()
                 # Wait for either sidebar present OR button state open
@@ -49,9 +66,9 @@ class SidebarPage(BasePage):
 
     def click_hamburger(self):
         """Explicitly click the hamburger button with robust interaction and fallback."""
-        element = self.wait.until(EC.presence_of_element_located(self.HAMBURGER_BUTTON))
+        element = self.find_element(self.HAMBURGER_BUTTON)
         try:
-            self.wait.until(EC.element_to_be_clickable(self.HAMBURGER_BUTTON))
+            self.wait.until(EC.element_to_be_clickable(element))
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
                 element,
@@ -69,7 +86,7 @@ class SidebarPage(BasePage):
         """Wait until either the sidebar container appears or the button shows open state."""
         end_time = self.wait._timeout if hasattr(self.wait, "_timeout") else timeout
         try:
-            self.wait.until(EC.presence_of_element_located(self.SIDEBAR))
+            self.find_element(self.SIDEBAR)
             return True
         except Exception:
             pass
@@ -87,7 +104,7 @@ class SidebarPage(BasePage):
         """Wait for the sidebar to be present (open first on mobile)."""
         self.open_sidebar_if_needed()
         try:
-            self.wait.until(EC.presence_of_element_located(self.SIDEBAR))
+            self.find_element(self.SIDEBAR)
         except TimeoutException:
             assert False, "Sidebar did not load within timeout"
         # Assert visible for debugging
@@ -102,8 +119,7 @@ class SidebarPage(BasePage):
     def is_visible(self) -> bool:
         """Check if sidebar is present and displayed."""
         try:
-            element = self.wait.until(EC.presence_of_element_located(self.SIDEBAR))
-            return element.is_displayed()
+            return self._with_element(self.SIDEBAR, lambda el: el.is_displayed())
         except TimeoutException:
             return False
 
@@ -143,13 +159,13 @@ class SidebarPage(BasePage):
     def open_user_menu(self):
         """Open the user menu using the reliable test id selector."""
         self.open_sidebar_if_needed()
-        # Prefer strict data-testid selector if present
-        locator = self.USER_MENU_BUTTON_STRICT if self.is_element_present(self.USER_MENU_BUTTON_STRICT) else self.USER_MENU_BUTTON
+        # Strict data-testid and the broad fallback are checked in one round-trip
+        locator = self.USER_MENU_BUTTON
         assert self.is_element_present(locator), "User menu button not found"
         # Robust click similar to hamburger
-        element = self.wait.until(EC.presence_of_element_located(locator))
+        element = self.find_element(locator)
         try:
-            self.wait.until(EC.element_to_be_clickable(locator))
+            self.wait.until(EC.element_to_be_clickable(element))
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
                 element,
@@ -174,29 +190,102 @@ class SidebarPage(BasePage):
         self.click_element(self.MENU_SETTINGS)
         return SettingsPage(self.driver)
 
+    @classmethod
+    def settings_macro(cls):
+        """Sidebar -> user menu -> Settings, as one in-browser navigation macro"""
+        if cls._settings_macro is None:
+            from .settings_page import SettingsPage
+            cls._settings_macro = NavigationMacro('open_settings', [
+                # The hamburger only exists in the closed-drawer layout (see LAYOUT_CHECKS)
+                MacroStep('open sidebar', cls.HAMBURGER_BUTTON, lambda page: page.open_sidebar_if_needed(),
+                          unless=cls.SIDEBAR, only_on=('mobile',)),
+                MacroStep('user menu', cls.USER_MENU_BUTTON, lambda page: page.open_user_menu()),
+                MacroStep('menu settings', cls.MENU_SETTINGS, lambda page: page.open_settings_from_menu()),
+                MacroStep('settings loaded', SettingsPage.NAME_INPUT,
+                          lambda page: SettingsPage(page.driver).wait_for_load(), action='wait'),
+            ])
+        return cls._settings_macro
+
+    def open_settings_fast(self):
+        """Reach a loaded SettingsPage in one round-trip, falling back to the step-by-step path"""
+        from .settings_page import SettingsPage
+        return self.settings_macro().run(self) or SettingsPage(self.driver)
+
+    def _scan_conversations(self, mode, needle='', offset=0, limit=None, timeout=None):
+        """Run the in-page virtual list scan over the conversation rows"""
+        self.open_sidebar_if_needed()
+        # Rows render after the app loads; an empty history is allowed
+        self.is_element_present(self.CONVERSATION_ITEM_TITLES, optional=True)
+        by, value = self.CONVERSATION_ITEM_TITLES
+        timeout = timeout or SCAN_TIMEOUT
+        # Headroom so the in-page deadline always ends the scan before WebDriver does
+        with script_timeout(self.driver, timeout + 5):
+            result = self.driver.execute_async_script(
+                VIRTUAL_LIST_SCRIPT, by, value, mode, needle.lower(), offset, limit, int(timeout * 1000),
+            )
+        assert 'error' not in result, f"Conversation list scan failed: {result['error']}"
+        return result
+
+    def find_conversation(self, title_substring: str, timeout=None):
+        """Return the row element of the first conversation whose title contains title_substring, or None.
+
+        The browser scrolls the (virtualized) list itself, so the cost is one
+        round-trip regardless of how many conversations there are.
+        """
+        result = self._scan_conversations('find', title_substring, timeout=timeout)
+        if result.get('timedOut'):
+            print(f"Conversation search for '{title_substring}' stopped before the end of the list")
+        return result.get('element')
+
     def select_conversation(self, title_substring: str):
         """Select a conversation by partial title match."""
-        self.open_sidebar_if_needed()
-        items = self.driver.find_elements(*self.CONVERSATION_ITEM_TITLES)
-        for item in items:
-            try:
-                text = (item.text or "").strip()
-                if title_substring.lower() in text.lower():
-                    item.click()
-                    return self
-            except Exception:
-                continue
-        assert False, f"Conversation containing '{title_substring}' not found"
+        element = self.find_conversation(title_substring)
+        assert element is not None, f"Conversation containing '{title_substring}' not found"
+        try:
+            element.click()
+        except StaleElementReferenceException:
+            # The list re-rendered between the lookup and the click
+            element = self.find_conversation(title_substring)
+            assert element is not None, f"Conversation containing '{title_substring}' not found"
+            element.click()
+        return self
+
+    def list_conversation_titles(self, offset: int = 0, limit=None, timeout=None):
+        """Titles of conversations offset .. offset+limit in sidebar order (all remaining when limit is None)"""
+        result = self._scan_conversations('list', offset=offset, limit=limit, timeout=timeout)
+        if self._truncated(result, limit):
+            print(f"Conversation listing from {offset} stopped at its deadline; "
+                  f"returning {len(result['titles'])} titles")
+        return result['titles']
+
+    @staticmethod
+    def _truncated(result, limit):
+        """True when a listing came back short because the scan ran out of time, not because the list ended"""
+        return not result['complete'] and (limit is None or len(result['titles']) < limit)
+
+    def iter_conversation_titles(self, page_size: int = 100, timeout=None):
+        """Yield every conversation title, fetching page_size titles per round-trip"""
+        offset = 0
+        while True:
+            result = self._scan_conversations('list', offset=offset, limit=page_size, timeout=timeout)
+            assert not self._truncated(result, page_size), (
+                f"Conversation listing stopped at its deadline after {offset + len(result['titles'])} titles"
+            )
+            page = result['titles']
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
 
     def close_sidebar(self, wait_until_hidden: bool = True, timeout: int = 10):
         """Click the sidebar close button (if present) and optionally wait until it hides."""
-        if self.is_element_present(self.CLOSE_BUTTON):
+        if self.is_element_present(self.CLOSE_BUTTON, optional=True):
             self.click_element(self.CLOSE_BUTTON)
             if wait_until_hidden:
                 try:
-                    self.wait.until(EC.invisibility_of_element_located(self.SIDEBAR))
+                    self.wait.until(lambda d: self.SIDEBAR.locate(d, displayed_only=True) is None)
                     # Assert hidden
-                    assert not self.is_element_present(self.SIDEBAR), "Sidebar still present after close"
+                    assert not self.is_element_present(self.SIDEBAR, optional=True), "Sidebar still present after close"
                 except TimeoutException:
                     print("Sidebar did not hide after clicking close")
         else:
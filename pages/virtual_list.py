@@ -0,0 +1,130 @@
+"""In-page search and listing over (possibly virtualized) scrolling lists
+
+A virtualized list only keeps the rows near its viewport in the DOM, so
+find_elements cannot see most of it. VIRTUAL_LIST_SCRIPT scrolls the list's
+container inside the browser, reading rows as they are rendered, and keeps
+an index of every row it has seen (text and scroll offset) on the page.
+Later searches on the same list jump straight to an indexed row; the index
+is rebuilt whenever the list's scroll height changes.
+"""
+
+from .element_snapshot import LOCATE_ALL_JS
+
+# Default scan budget; stays under WebDriver's default 30s script timeout
+SCAN_TIMEOUT = 25
+
+# Arguments: by, value, mode ('find' | 'list'), needle, offset, limit, timeoutMs, callback.
+# find resolves to {element, index, title} or {element: null}; list to
+# {titles, total, complete}, where total is only known once the end was reached.
+VIRTUAL_LIST_SCRIPT = LOCATE_ALL_JS + """
+const [by, value, mode, needle, offset, limit, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const deadline = performance.now() + timeoutMs;
+
+function scrollParent(el) {
+    for (let node = el && el.parentElement; node; node = node.parentElement) {
+        const overflow = getComputedStyle(node).overflowY;
+        if ((overflow === 'auto' || overflow === 'scroll') && node.scrollHeight > node.clientHeight) return node;
+    }
+    return null;
+}
+// Two frames let scroll handlers re-render; the timeout covers throttled background tabs
+function settle() {
+    return new Promise(resolve => {
+        const timer = setTimeout(resolve, 100);
+        requestAnimationFrame(() => requestAnimationFrame(() => { clearTimeout(timer); resolve(); }));
+    });
+}
+function rows(container) {
+    const base = container ? container.getBoundingClientRect().top - container.scrollTop : 0;
+    return locateAll(by, value).map(el => ({
+        el: el,
+        // Offset inside the scrolled content identifies a row across re-renders
+        top: Math.round(el.getBoundingClientRect().top - base),
+        title: (el.innerText || el.textContent || '').trim(),
+    }));
+}
+
+(async () => {
+    const first = locateAll(by, value)[0];
+    const container = scrollParent(first);
+    const matches = title => title.toLowerCase().includes(needle);
+    const key = by + '|' + value;
+    const cache = window.__virtualListIndex || (window.__virtualListIndex = {});
+    let index = cache[key];
+    if (!index || !container || index.height !== container.scrollHeight) {
+        index = cache[key] = {height: container ? container.scrollHeight : 0, entries: new Map(), complete: false, scannedTo: -1};
+    }
+    const record = found => found.forEach(r => index.entries.set(r.top, r.title));
+    const agrees = found => found.every(r => !index.entries.has(r.top) || index.entries.get(r.top) === r.title);
+    const ordered = () => Array.from(index.entries.entries()).sort((a, b) => a[0] - b[0]);
+    const scannedPrefix = () => ordered().filter(([top]) => top < index.scannedTo + container.clientHeight);
+    const hit = async found => {
+        const row = found.find(r => matches(r.title));
+        if (!row) return null;
+        // Scrolling makes a virtualized list re-render its rows, so look the row up again once it settles
+        row.el.scrollIntoView({block: 'center'});
+        await settle();
+        const fresh = rows(container).find(r => r.title === row.title && (!container || r.top === row.top));
+        if (!fresh) return null;
+        const position = ordered().findIndex(([top]) => top === fresh.top);
+        return {element: fresh.el, index: position, title: fresh.title};
+    };
+
+    let found = rows(container);
+    if (!agrees(found)) {
+        // Same height but different titles: the list changed under the index
+        index = cache[key] = {height: index.height, entries: new Map(), complete: false, scannedTo: -1};
+    }
+    record(found);
+    if (mode === 'find') {
+        const direct = await hit(found);
+        if (direct) return direct;
+        // Jump to a row an earlier scan already indexed
+        const known = ordered().find(([, title]) => matches(title));
+        if (known && container) {
+            container.scrollTop = Math.max(0, known[0] - container.clientHeight / 2);
+            await settle();
+            const jumped = await hit(rows(container));
+            if (jumped) return jumped;
+        }
+    } else if (index.complete || !container) {
+        const titles = ordered().map(([, title]) => title);
+        return {titles: titles.slice(offset, limit === null ? undefined : offset + limit),
+                total: titles.length, complete: true};
+    } else if (limit !== null && index.scannedTo >= 0) {
+        // Rows an earlier page already scanned contiguously from the top
+        const prefix = scannedPrefix();
+        if (prefix.length >= offset + limit) {
+            return {titles: prefix.slice(offset, offset + limit).map(([, title]) => title), total: null, complete: false};
+        }
+    }
+    if (!container) return {element: null};
+
+    // Listing continues where a contiguous scan from the top stopped; searches start at the top
+    container.scrollTop = mode === 'list' && index.scannedTo > 0 ? index.scannedTo : 0;
+    await settle();
+    for (;;) {
+        found = rows(container);
+        record(found);
+        index.scannedTo = container.scrollTop;
+        if (mode === 'find') {
+            const row = await hit(found);
+            if (row) return row;
+        } else if (limit !== null && scannedPrefix().length >= offset + limit) {
+            break;
+        }
+        if (container.scrollTop + container.clientHeight >= container.scrollHeight - 1) {
+            index.complete = true;
+            break;
+        }
+        if (performance.now() > deadline) break;
+        container.scrollTop += Math.max(1, Math.floor(container.clientHeight * 0.9));
+        await settle();
+    }
+    if (mode === 'find') return {element: null, timedOut: !index.complete};
+    const titles = (index.complete ? ordered() : scannedPrefix()).map(([, title]) => title);
+    return {titles: titles.slice(offset, limit === null ? undefined : offset + limit),
+            total: index.complete ? titles.length : null, complete: index.complete};
+})().then(done, e => done({error: String(e)}));
+"""
@@ -29,6 +29,7 @@ class TestChangeTheme(unittest.TestCase):
         link=("https://dev.example.com/", "Website"),
         issue=lambda: os.getenv('ALLURE_ISSUE', 'UI-CHANGE-THEME'),
         testcase=lambda: os.getenv('ALLURE_TMS', 'TMS-CHANGE-THEME'),
+        step_timing=True,
     )
     def test_select_light_theme_and_assert(self):
         """Open app, navigate to settings, choose Light theme, then assert color-scheme."""
@@ -43,6 +44,27 @@ class TestChangeTheme(unittest.TestCase):
                 .assert_html_color_scheme("light")
         )
 
+    @allure_matrix(
+        title=lambda: "Change theme to Light via navigation macro",
+        description=lambda: "Reach settings through the one-round-trip macro, set theme to Light, assert color-scheme.",
+        severity=severity_level.NORMAL,
+        owner="UI Team",
+        link=("https://dev.example.com/", "Website"),
+        issue=lambda: os.getenv('ALLURE_ISSUE', 'UI-CHANGE-THEME'),
+        testcase=lambda: os.getenv('ALLURE_TMS', 'TMS-CHANGE-THEME'),
+        step_timing=True,
+    )
+    def test_select_light_theme_via_settings_macro(self):
+        """Open app, reach settings with open_settings_fast, choose Light theme, then assert color-scheme."""
+        self.driver.get(self.base_url)
+        (
+            PageFactory.create_sidebar_page(self.driver)
+                .wait_for_app_ready()
+                .open_settings_fast()
+                .select_light_theme()
+                .assert_html_color_scheme("light")
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,28 @@
+import os
+import sys
+import pytest
+
+# Ensure project root for direct runs
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from pages.page_factory import PageFactory
+
+# Chat page only, so it also runs under DRIVER_MODE=api
+pytestmark = pytest.mark.api
+
+
+def test_select_model_and_get_response(driver, base_url):
+    driver.get(base_url)
+
+    chat_page = PageFactory.create_chat_page(driver)
+    chat_page.select_model()
+
+    chat_page.enter_prompt("Say hello")
+    chat_page.submit_prompt()
+    response = chat_page.wait_for_response()
+
+    assert response, "Expected a non-empty response"
+    metrics = chat_page.last_response_metrics
+    assert metrics['time_to_first_token'] is not None
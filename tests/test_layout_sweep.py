@@ -0,0 +1,22 @@
+import os
+import sys
+import pytest
+
+# Ensure project root for direct runs
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from utils.layout_sweep import LayoutSweep
+
+# SidebarPage.LAYOUT_CHECKS encode the stub's drawer breakpoint
+pytestmark = pytest.mark.stub_only
+
+
+def test_layout_matches_breakpoints_across_widths(driver, base_url):
+    step = int(os.getenv('LAYOUT_SWEEP_STEP', '160'))
+    result = LayoutSweep(driver).run(base_url, 320, 2560, step)
+
+    for flip in result['flips']:
+        print(f"{flip['check']} {'shown' if flip['visible'] else 'hidden'} from {flip['width']}px")
+    assert not result['failures'], f"Layout differs from the page objects' breakpoints: {result['failures']}"
@@ -0,0 +1,44 @@
+import os
+import sys
+import pytest
+
+# Ensure project root for direct runs
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from pages.page_factory import PageFactory
+from utils.app_state import AppState
+
+# Seeded keys and /c/<id> routes follow the stub app's storage scheme
+pytestmark = pytest.mark.stub_only
+
+
+def test_settings_deep_link_shows_seeded_state(driver, base_url):
+    state = AppState(selected_model="stub-model", user_name="Ada", theme="light")
+
+    settings_page = PageFactory.open_settings(driver, base_url, state)
+
+    name_value = settings_page.find_element(settings_page.NAME_INPUT).get_attribute("value")
+    assert name_value == "Ada", f"Expected seeded user name, got '{name_value}'"
+    settings_page.assert_html_color_scheme("light")
+
+
+def test_conversation_deep_link_shows_seeded_messages(driver, base_url):
+    state = AppState(
+        selected_model="stub-model",
+        conversations=[AppState.conversation("Greeting", [("user", "Hi"), ("assistant", "Hello from the seed")], "greeting")],
+    )
+
+    chat_page = PageFactory.open_conversation(driver, base_url, "greeting", state)
+
+    response = chat_page.wait_for_response(timeout=5)
+    assert "Hello from the seed" in " ".join(response), f"Seeded conversation not shown: {response}"
+
+
+def test_select_conversation_from_warm_snapshot(driver, warm_conversations):
+    sidebar = PageFactory.create_sidebar_page(driver)
+
+    sidebar.select_conversation("Saved chat 25")
+
+    assert "/c/" in driver.current_url, f"Expected a conversation URL, got {driver.current_url}"
@@ -1,7 +1,5 @@
 import os
 import sys
-import tempfile
-from PIL import Image
 import pytest
 
 # Ensure project root for direct runs
@@ -12,27 +10,13 @@ if PROJECT_ROOT not in sys.path:
 from pages.page_factory import PageFactory
 
 
-def _create_temp_png() -> str:
-    fd, path = tempfile.mkstemp(suffix=".png")
-    os.close(fd)
-    img = Image.new("RGB", (16, 16), color=(255, 0, 0))
-    img.save(path, "PNG")
-    return path
-
-
-def test_upload_image_and_type_then_submit(driver, base_url):
+def test_upload_image_and_type_then_submit(driver, base_url, image_cache):
     driver.get(base_url)
 
     chat_page = PageFactory.create_chat_page(driver)
 
-    image_path = _create_temp_png()
-    try:
-        chat_page.upload_image_and_submit(image_path, "messi")
-    finally:
-        if os.path.exists(image_path):
-            os.remove(image_path)
+    image_path = image_cache.get('tiny')
+    chat_page.upload_image_and_submit(image_path, "messi")
 
     # End test gracefully
     assert True
-
-
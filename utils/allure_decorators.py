@@ -1,5 +1,6 @@
 import os
 import functools
+from .step_timing import StepTimer
 
 try:
     import allure
@@ -14,11 +15,13 @@ except Exception:  # Allure may not be installed in some contexts
         TRIVIAL = 'trivial'
 
 
-def allure_matrix(title=None, description=None, severity=_severity_level.NORMAL, owner=None, link=None, issue=None, testcase=None):
+def allure_matrix(title=None, description=None, severity=_severity_level.NORMAL, owner=None, link=None, issue=None, testcase=None, step_timing=False):
     """Decorator to add Allure metadata dynamically from CI env and supplied args.
 
     Args accept literals or callables returning strings at runtime.
     link can be a string URL or a tuple (url, name).
+    step_timing=True records every page-object call made by the test as a
+    timed Allure step (duration, WebDriver command count, wait time).
     """
     def _resolve(val):
         try:
@@ -57,17 +60,27 @@ def allure_matrix(title=None, description=None, severity=_severity_level.NORMAL,
 
                     # Dynamic matrix parameters from env (GitHub Actions matrix)
                     browser = os.getenv('BROWSER', 'chrome')
+                    device = os.getenv('DEVICE', '')
                     width = os.getenv('SCREEN_WIDTH', '')
                     height = os.getenv('SCREEN_HEIGHT', '')
                     res_name = os.getenv('TEST_NAME', f"{browser}-{width}x{height}")
                     allure.dynamic.parameter('browser', browser)
+                    if device:
+                        allure.dynamic.parameter('device', device)
                     if width and height:
                         allure.dynamic.parameter('resolution', f"{width}x{height}")
                     allure.dynamic.parameter('test_name', res_name)
                 except Exception:
                     # Do not fail the test if allure API raises
                     pass
-            return func(*args, **kwargs)
+            if not step_timing:
+                return func(*args, **kwargs)
+            previous = StepTimer.enabled
+            StepTimer.enabled = True
+            try:
+                return func(*args, **kwargs)
+            finally:
+                StepTimer.enabled = previous
         return wrapper
     return decorator
 
@@ -0,0 +1,61 @@
+"""Browser-free driver that talks to the Ollama UI backend over HTTP"""
+
+import os
+import threading
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ApiDriver:
+    """Stand-in for a WebDriver when a check only needs the model to answer.
+
+    It keeps the handful of WebDriver calls tests make before building a
+    page (``get``, ``current_url``, ``quit``) so PageFactory can hand out
+    the API chat page instead of a browser one. All instances share one
+    keep-alive connection pool.
+    """
+
+    TAGS_PATH = os.getenv('API_TAGS_PATH', '/api/tags')
+    CHAT_PATH = os.getenv('API_CHAT_PATH', '/api/chat')
+
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, base_url=None, pool_size=10):
+        self.base_url = base_url
+        self.session = self.shared_session(pool_size)
+
+    @classmethod
+    def shared_session(cls, pool_size=10):
+        """Return the process-wide pooled session"""
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._session = session
+            return cls._session
+
+    @classmethod
+    def close_shared_session(cls):
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    def get(self, url):
+        """Remember the UI base URL (mirrors driver.get)"""
+        self.base_url = url
+
+    @property
+    def current_url(self):
+        return self.base_url
+
+    def url_for(self, path):
+        return urljoin(self.base_url, path)
+
+    def quit(self):
+        # The pooled session outlives individual drivers
+        pass
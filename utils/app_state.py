@@ -0,0 +1,211 @@
+"""Seed the UI's client-side state before the first page load, and deep-link into it
+
+    state = AppState(selected_model='llama3', user_name='Ada', theme='light',
+                     conversations=[AppState.conversation('Hello', [('user', 'Hi'), ('assistant', 'Hello!')])])
+    open_seeded(driver, AppRoutes.conversation(base_url, 0), state)
+
+On Chrome, cookies and web storage are written by a script registered with
+Page.addScriptToEvaluateOnNewDocument, so they are in place before the app's
+own scripts run and setup costs exactly one navigation. IndexedDB writes are
+asynchronous and could race the app's own indexedDB.open, so state with
+IndexedDB data, like state on other browsers, is seeded after loading the
+app once and then navigating to the target (two navigations). That path
+also deletes every IndexedDB database already on the origin, so
+seed_state(..., clean=True) starts from nothing even in a reused profile.
+"""
+
+import json
+import os
+from urllib.parse import urljoin, urlsplit
+
+
+class AppRoutes:
+    """Direct URLs into the app (override the paths with ROUTE_SETTINGS / ROUTE_CONVERSATION)"""
+
+    SETTINGS = os.getenv('ROUTE_SETTINGS', '/settings')
+    CONVERSATION = os.getenv('ROUTE_CONVERSATION', '/c/{id}')
+
+    @classmethod
+    def settings(cls, base_url):
+        return urljoin(base_url, cls.SETTINGS)
+
+    @classmethod
+    def conversation(cls, base_url, conversation_id):
+        return urljoin(base_url, cls.CONVERSATION.format(id=conversation_id))
+
+
+class AppState:
+    """Client-side state of the UI: localStorage keys plus optional sessionStorage and IndexedDB"""
+
+    SELECTED_MODEL_KEY = 'selectedModel'
+    USER_NAME_KEY = 'ollama_user'
+    THEME_KEY = 'theme'
+    CHATS_KEY = 'chats'
+
+    def __init__(self, selected_model=None, user_name=None, theme=None, conversations=(),
+                 local_storage=None, session_storage=None, indexed_db=None, cookies=()):
+        self.selected_model = selected_model
+        self.user_name = user_name
+        self.theme = theme
+        self.conversations = list(conversations)
+        # Raw values (already strings) for keys the named fields do not cover
+        self.local_storage = dict(local_storage or {})
+        self.session_storage = dict(session_storage or {})
+        # {database: {object_store: [records]}} creates autoIncrement stores; a store given as
+        # {'keyPath', 'autoIncrement', 'indexes', 'records': [[key, value], ...]} (the
+        # StateSnapshot format) is recreated with its schema and keys; an optional
+        # '__version__' entry sets the database version
+        self.indexed_db = dict(indexed_db or {})
+        # Cookie dicts as returned by driver.get_cookies()
+        self.cookies = list(cookies)
+
+    @staticmethod
+    def conversation(title, messages=(), conversation_id=None):
+        """A stored conversation; messages are (role, content) pairs or message dicts"""
+        chat = {
+            'title': title,
+            'messages': [m if isinstance(m, dict) else {'role': m[0], 'content': m[1]} for m in messages],
+        }
+        if conversation_id is not None:
+            chat['id'] = str(conversation_id)
+        return chat
+
+    def local_storage_items(self):
+        """localStorage as key -> string value, JSON-encoded the way the app stores it"""
+        items = {}
+        if self.selected_model is not None:
+            items[self.SELECTED_MODEL_KEY] = json.dumps(self.selected_model)
+        if self.user_name is not None:
+            items[self.USER_NAME_KEY] = json.dumps(self.user_name)
+        if self.theme is not None:
+            items[self.THEME_KEY] = json.dumps(self.theme)
+        if self.conversations:
+            items[self.CHATS_KEY] = json.dumps(self.conversations)
+        items.update(self.local_storage)
+        return items
+
+    def to_payload(self):
+        return {
+            'local': self.local_storage_items(),
+            'session': dict(self.session_storage),
+            'indexedDB': self.indexed_db,
+        }
+
+
+# Replaces the origin's storage with the payload. Runs either before the
+# document (CDP) or in a loaded page, where the last argument is the async callback.
+_WRITE_STATE_JS = """
+function writeState(payload) {
+    localStorage.clear();
+    sessionStorage.clear();
+    Object.entries(payload.local).forEach(([k, v]) => localStorage.setItem(k, v));
+    Object.entries(payload.session).forEach(([k, v]) => sessionStorage.setItem(k, v));
+    return Promise.all(Object.entries(payload.indexedDB).map(([dbName, stores]) => new Promise((resolve, reject) => {
+        const specs = {};
+        let version = 1;
+        Object.entries(stores).forEach(([name, spec]) => {
+            if (name === '__version__') { version = spec; return; }
+            specs[name] = Array.isArray(spec)
+                ? {keyPath: null, autoIncrement: true, indexes: [], records: spec.map(v => [null, v])}
+                : spec;
+        });
+        indexedDB.deleteDatabase(dbName);
+        const request = indexedDB.open(dbName, version);
+        request.onupgradeneeded = () => {
+            Object.entries(specs).forEach(([name, spec]) => {
+                const store = request.result.createObjectStore(name, {
+                    keyPath: spec.keyPath ?? undefined, autoIncrement: !!spec.autoIncrement});
+                (spec.indexes || []).forEach(i => store.createIndex(i.name, i.keyPath,
+                    {unique: !!i.unique, multiEntry: !!i.multiEntry}));
+            });
+        };
+        request.onerror = () => reject(request.error);
+        request.onsuccess = () => {
+            const db = request.result;
+            const names = Object.keys(specs);
+            if (!names.length) { db.close(); resolve(); return; }
+            const tx = db.transaction(names, 'readwrite');
+            names.forEach(s => specs[s].records.forEach(([key, value]) => {
+                // In-line keys (keyPath) must not be passed separately
+                if (key === null || specs[s].keyPath !== null) tx.objectStore(s).add(value);
+                else tx.objectStore(s).add(value, key);
+            }));
+            tx.oncomplete = () => { db.close(); resolve(); };
+            tx.onerror = () => reject(tx.error);
+        };
+    })));
+}
+"""
+
+# Databases left by earlier tests are removed first, waiting for every delete to finish
+SEED_ASYNC_SCRIPT = _WRITE_STATE_JS + """
+const done = arguments[arguments.length - 1];
+const deleteDatabase = name => new Promise(resolve => {
+    const request = indexedDB.deleteDatabase(name);
+    request.onsuccess = request.onerror = request.onblocked = () => resolve();
+});
+Promise.resolve()
+    .then(() => indexedDB.databases ? indexedDB.databases() : [])
+    .then(dbs => Promise.all(dbs.map(db => deleteDatabase(db.name))))
+    .then(() => writeState(arguments[0]))
+    .then(() => done(null), e => done(String(e)));
+"""
+
+
+def _preload_script(origin, payload):
+    return _WRITE_STATE_JS + (
+        f"if (location.origin === {json.dumps(origin)}) {{ writeState({json.dumps(payload)}); }}"
+    )
+
+
+def _cdp_cookie(cookie, url):
+    """WebDriver cookie dict -> CDP Network.CookieParam"""
+    param = {'name': cookie['name'], 'value': cookie['value'], 'path': cookie.get('path', '/')}
+    if cookie.get('domain'):
+        param['domain'] = cookie['domain']
+    else:
+        param['url'] = url
+    for source, target in (('secure', 'secure'), ('httpOnly', 'httpOnly'), ('sameSite', 'sameSite'),
+                           ('expiry', 'expires')):
+        if cookie.get(source) is not None:
+            param[target] = cookie[source]
+    return param
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def seed_state(driver, url, state, clean=False):
+    """Write state for url's origin and load url; returns the number of navigations used.
+
+    clean also deletes IndexedDB databases the state does not name, which
+    needs the after-load path.
+    """
+    payload = state.to_payload()
+    if hasattr(driver, 'execute_cdp_cmd') and not state.indexed_db and not clean:
+        try:
+            if state.cookies:
+                driver.execute_cdp_cmd('Network.setCookies', {'cookies': [_cdp_cookie(c, url) for c in state.cookies]})
+            script_id = driver.execute_cdp_cmd(
+                'Page.addScriptToEvaluateOnNewDocument', {'source': _preload_script(_origin(url), payload)}
+            )['identifier']
+        except Exception as e:
+            print(f"Warning: Could not register state preload script, seeding after load: {e}")
+        else:
+            try:
+                driver.get(url)
+            finally:
+                # Only the first document gets the seed; reloads must keep what the test changed
+                driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': script_id})
+            return 1
+    # Storage is per-origin, so it can only be written from a page on the app's origin
+    driver.get(_origin(url) + '/')
+    for cookie in state.cookies:
+        driver.add_cookie(cookie)
+    error = driver.execute_async_script(SEED_ASYNC_SCRIPT, payload)
+    if error:
+        print(f"Warning: Could not seed IndexedDB: {error}")
+    driver.get(url)
+    return 2
@@ -0,0 +1,60 @@
+"""Isolated browser contexts (incognito-like profiles) inside one shared Chrome"""
+
+from selenium.common.exceptions import WebDriverException
+from .network_capture import NetworkCapture
+
+
+class BrowserContext:
+    """One CDP browser context with its own tab, opened in an existing Chrome session.
+
+    Cookies, storage, cache and service workers are private to the context,
+    so tests sharing a browser process cannot see each other's state.
+    While open, the driver is switched to the context's tab; close()
+    switches back to the host tab and disposes the context together with
+    every window the test opened in it.
+    """
+
+    def __init__(self, driver, context_id, target_id, home_handle):
+        self.driver = driver
+        self.context_id = context_id
+        self.target_id = target_id
+        self.home_handle = home_handle
+
+    @classmethod
+    def open(cls, driver, width=None, height=None, url='about:blank'):
+        """Create a context and a tab in it, and switch the driver to that tab"""
+        home_handle = driver.current_window_handle
+        context_id = driver.execute_cdp_cmd('Target.createBrowserContext', {})['browserContextId']
+        params = {'url': url, 'browserContextId': context_id}
+        if width and height:
+            params.update(width=width, height=height)
+        try:
+            target_id = driver.execute_cdp_cmd('Target.createTarget', params)['targetId']
+            # ChromeDriver uses the target id as the window handle
+            driver.switch_to.window(target_id)
+            if width and height:
+                driver.set_window_size(width, height)
+            # CDP domains are enabled per tab, so network capture must be re-armed here
+            if NetworkCapture.is_enabled(driver):
+                NetworkCapture.enable(driver)
+        except WebDriverException:
+            driver.switch_to.window(home_handle)
+            driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context_id})
+            raise
+        return cls(driver, context_id, target_id, home_handle)
+
+    def close(self):
+        """Dispose the context; return False if the browser could not be cleaned up"""
+        try:
+            self.driver.switch_to.window(self.home_handle)
+            self.driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': self.context_id})
+            return True
+        except WebDriverException as e:
+            print(f"Warning: Could not dispose browser context {self.context_id}: {e}")
+            return False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,67 @@
+"""Pre-built browser profile templates copied for each new driver"""
+
+import os
+import shutil
+import tempfile
+import weakref
+from .driver_cache import CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are not serialized across workers
+    fcntl = None
+
+
+class ProfileTemplate:
+    """A browser profile that has already been through first-run setup.
+
+    The template is created once (by launching the browser against an empty
+    profile directory and quitting) and then copied for each driver, so new
+    browsers skip first-run work such as creating the profile databases.
+    """
+
+    def __init__(self, browser, root=None):
+        self.browser = browser.lower()
+        self.path = os.path.join(root or CACHE_DIR, 'profiles', self.browser)
+
+    @property
+    def ready(self):
+        return os.path.isdir(self.path) and os.path.exists(os.path.join(self.path, '.template-ready'))
+
+    def build(self, launch):
+        """Populate the template by calling launch(profile_dir) and quitting the driver"""
+        if self.ready:
+            return self.path
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + '.lock', 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            # Another worker may have built it while we waited for the lock
+            if self.ready:
+                return self.path
+            shutil.rmtree(self.path, ignore_errors=True)
+            os.makedirs(self.path, exist_ok=True)
+            driver = launch(self.path)
+            try:
+                driver.get('about:blank')
+            finally:
+                driver.quit()
+            # Lock files from the template run must not leak into copies
+            for name in ('SingletonLock', 'SingletonCookie', 'SingletonSocket', 'lock', '.parentlock'):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+            open(os.path.join(self.path, '.template-ready'), 'w').close()
+        return self.path
+
+    def copy(self):
+        """Return a private copy of the template for one driver"""
+        target = tempfile.mkdtemp(prefix=f'{self.browser}-profile-')
+        shutil.copytree(self.path, target, dirs_exist_ok=True)
+        return target
+
+    @staticmethod
+    def cleanup_with(driver, profile_dir):
+        """Delete profile_dir once driver is garbage collected"""
+        weakref.finalize(driver, shutil.rmtree, profile_dir, True)
@@ -0,0 +1,25 @@
+"""Shared in-browser scripts for resetting client-side application state"""
+
+# Clears Web Storage and deletes every IndexedDB database on the current origin.
+CLEAR_STORAGE_SCRIPT = (
+    "try { localStorage.clear(); } catch (e) { console.log('localStorage not available'); }"
+    "try { sessionStorage.clear(); } catch (e) { console.log('sessionStorage not available'); }"
+    "try { indexedDB.databases().then(dbs => dbs.forEach(db => indexedDB.deleteDatabase(db.name))); } catch (e) { console.log('indexedDB not available'); }"
+)
+
+# Same as CLEAR_STORAGE_SCRIPT for execute_async_script: calls back only once
+# every IndexedDB delete request has finished (or is blocked by an open
+# connection, which the next navigation closes), so nothing carries over.
+CLEAR_STORAGE_ASYNC_SCRIPT = """
+const done = arguments[arguments.length - 1];
+try { localStorage.clear(); } catch (e) {}
+try { sessionStorage.clear(); } catch (e) {}
+const deleteDatabase = name => new Promise(resolve => {
+    const request = indexedDB.deleteDatabase(name);
+    request.onsuccess = request.onerror = request.onblocked = () => resolve();
+});
+Promise.resolve()
+    .then(() => indexedDB.databases())
+    .then(dbs => Promise.all(dbs.map(db => deleteDatabase(db.name))))
+    .then(() => done(null), e => done(String(e)));
+"""
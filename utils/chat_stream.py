@@ -0,0 +1,44 @@
+"""Decoding of the streamed chat response formats the UI backends emit"""
+
+import json
+
+
+def parse_stream_line(line):
+    """Return the text token carried by one stream line, or None.
+
+    Understands the AI SDK data stream (``0:"text"``), Ollama NDJSON
+    (``{"message": {"content": ...}}`` / ``{"response": ...}``) and
+    OpenAI-style server-sent events (``data: {"choices": [{"delta": ...}]}``).
+    """
+    line = line.strip()
+    if not line:
+        return None
+    if line.startswith('0:'):
+        try:
+            return json.loads(line[2:])
+        except ValueError:
+            return None
+    if line.startswith('data:'):
+        line = line[5:].strip()
+        if line == '[DONE]':
+            return None
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if isinstance(payload.get('message'), dict):
+        return payload['message'].get('content') or None
+    if 'response' in payload:
+        return payload.get('response') or None
+    choices = payload.get('choices')
+    if choices:
+        delta = choices[0].get('delta') or choices[0].get('message') or {}
+        return delta.get('content') or None
+    return None
+
+
+def split_paragraphs(text):
+    """Split a full reply into the paragraphs the UI renders as <p> tags"""
+    return [p.strip() for p in text.split('\n\n') if p.strip()]
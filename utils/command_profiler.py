@@ -0,0 +1,132 @@
+"""WebDriver command profiler: counts, times and attributes every protocol command
+
+Enable with PROFILE_COMMANDS=true (DriverFactory attaches the profiler to
+each driver it creates) or explicitly:
+
+    profiler = CommandProfiler.attach(driver)
+    ...
+    print(profiler.top_table())
+    profiler.write_collapsed('profile.folded')   # flamegraph.pl / speedscope input
+"""
+
+import json
+import os
+import sys
+import threading
+from .driver_hooks import add_command_listener, remove_command_listener
+
+# Frames from these modules are the "who called WebDriver" part of a stack
+_ATTRIBUTED_DIRS = ('pages', 'tests', 'benchmarks', 'utils')
+_SKIP_FILES = ('driver_hooks.py', 'command_profiler.py', 'step_timing.py')
+
+
+class CommandProfiler:
+    """Listener that aggregates WebDriver commands by calling page-object stack"""
+
+    _profilers = []
+    _lock = threading.Lock()
+
+    def __init__(self, project_root=None):
+        self.project_root = project_root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        # (stack tuple, command) -> [count, total seconds]
+        self.samples = {}
+
+    @classmethod
+    def attach(cls, driver):
+        """Profile every command driver sends from now on"""
+        profiler = cls()
+        add_command_listener(driver, profiler)
+        driver._command_profiler = profiler
+        with cls._lock:
+            cls._profilers.append(profiler)
+        return profiler
+
+    def detach(self, driver):
+        remove_command_listener(driver, self)
+
+    def __call__(self, command, params, duration, error):
+        key = (self._caller_stack(), command)
+        with self._lock:
+            entry = self.samples.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += duration
+
+    def _caller_stack(self):
+        """Project frames (outermost first) as 'Class.method' or 'module.function'"""
+        frames = []
+        frame = sys._getframe(2)
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename.startswith(self.project_root) and not filename.endswith(_SKIP_FILES):
+                relative = os.path.relpath(filename, self.project_root)
+                if relative.split(os.sep)[0] in _ATTRIBUTED_DIRS:
+                    owner = frame.f_locals.get('self')
+                    if owner is not None:
+                        frames.append(f"{type(owner).__name__}.{frame.f_code.co_name}")
+                    else:
+                        module = os.path.splitext(os.path.basename(filename))[0]
+                        frames.append(f"{module}.{frame.f_code.co_name}")
+            frame = frame.f_back
+        return tuple(reversed(frames)) or ('<unattributed>',)
+
+    @classmethod
+    def merged(cls):
+        """One profiler holding the samples of every attached profiler"""
+        total = cls()
+        with cls._lock:
+            for profiler in cls._profilers:
+                for key, (count, seconds) in profiler.samples.items():
+                    entry = total.samples.setdefault(key, [0, 0.0])
+                    entry[0] += count
+                    entry[1] += seconds
+        return total
+
+    def collapsed(self, weight='time'):
+        """Collapsed-stack lines ('a;b;command value') for flame graph tools.
+
+        weight='time' uses microseconds, weight='count' uses command counts.
+        """
+        lines = []
+        for (stack, command), (count, seconds) in sorted(self.samples.items()):
+            value = count if weight == 'count' else int(seconds * 1_000_000)
+            lines.append(f"{';'.join(stack + (command,))} {value}")
+        return lines
+
+    def write_collapsed(self, path, weight='time'):
+        with open(path, 'w') as f:
+            f.write('\n'.join(self.collapsed(weight)) + '\n')
+        return path
+
+    def hotspots(self):
+        """Aggregate by (innermost page-object method, command)"""
+        spots = {}
+        for (stack, command), (count, seconds) in self.samples.items():
+            key = (stack[-1], command)
+            entry = spots.setdefault(key, [0, 0.0])
+            entry[0] += count
+            entry[1] += seconds
+        return [
+            {'caller': caller, 'command': command, 'count': count, 'total': seconds, 'mean': seconds / count}
+            for (caller, command), (count, seconds) in spots.items()
+        ]
+
+    def top_table(self, n=20, sort_by='total'):
+        """Text table of the top-n hot spots by total time or count"""
+        rows = sorted(self.hotspots(), key=lambda r: r[sort_by], reverse=True)[:n]
+        lines = [f"{'caller':50s} {'command':28s} {'count':>6s} {'total s':>9s} {'mean ms':>9s}"]
+        for r in rows:
+            lines.append(
+                f"{r['caller'][:50]:50s} {r['command'][:28]:28s} {r['count']:6d} {r['total']:9.3f} {r['mean'] * 1000:9.1f}"
+            )
+        return '\n'.join(lines)
+
+    def export_json(self, path):
+        with open(path, 'w') as f:
+            json.dump({
+                'hotspots': sorted(self.hotspots(), key=lambda r: r['total'], reverse=True),
+                'stacks': [
+                    {'stack': list(stack), 'command': command, 'count': count, 'total': seconds}
+                    for (stack, command), (count, seconds) in self.samples.items()
+                ],
+            }, f, indent=2)
+        return path
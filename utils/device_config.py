@@ -1,39 +1,55 @@
 """Device configuration for responsive testing"""
 
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True, slots=True)
+class Device:
+    """Immutable description of one emulated device"""
+    name: str
+    width: int
+    height: int
+    user_agent: str = None
+    is_mobile: bool = False
+
+
 class DeviceConfig:
     """Configuration for different device types"""
     
-    MOBILE = {
-        'name': 'mobile',
-        'width': 375,
-        'height': 812,
-        'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15',
-        'is_mobile': True
-    }
-    
-    TABLET = {
-        'name': 'tablet',
-        'width': 768,
-        'height': 1024,
-        'user_agent': 'Mozilla/5.0 (iPad; CPU OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15',
-        'is_mobile': True
-    }
-    
-    DESKTOP = {
-        'name': 'desktop',
-        'width': 1920,
-        'height': 1080,
-        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'is_mobile': False
-    }
-    
-    DESKTOP_SMALL = {
-        'name': 'desktop_small',
-        'width': 1366,
-        'height': 768,
-        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-        'is_mobile': False
-    }
+    # (breakpoint, minimum window width) from narrowest to widest
+    BREAKPOINTS = (('mobile', 0), ('tablet', 768), ('desktop', 1024))
+    
+    MOBILE = Device(
+        name='mobile',
+        width=375,
+        height=812,
+        user_agent='Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15',
+        is_mobile=True
+    )
+    
+    TABLET = Device(
+        name='tablet',
+        width=768,
+        height=1024,
+        user_agent='Mozilla/5.0 (iPad; CPU OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15',
+        is_mobile=True
+    )
+    
+    DESKTOP = Device(
+        name='desktop',
+        width=1920,
+        height=1080,
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        is_mobile=False
+    )
+    
+    DESKTOP_SMALL = Device(
+        name='desktop_small',
+        width=1366,
+        height=768,
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        is_mobile=False
+    )
     
     @classmethod
     def get_device_config(cls, device_name):
@@ -46,17 +62,26 @@ class DeviceConfig:
         }
         return configs.get(device_name.lower(), cls.DESKTOP)
     
+    @classmethod
+    def for_width(cls, width):
+        """Device configuration for the breakpoint a window width falls into"""
+        return cls.get_device_config(cls.get_breakpoint(width))
+    
+    @classmethod
+    def custom(cls, width, height):
+        """Device of any viewport size, behaving like the breakpoint its width falls into"""
+        return replace(cls.for_width(width), width=width, height=height)
+    
     @classmethod
     def is_mobile_device(cls, device_config):
         """Check if device is mobile"""
-        return device_config.get('is_mobile', False)
+        return device_config.is_mobile
     
     @classmethod
     def get_breakpoint(cls, width):
         """Get breakpoint category based on width"""
-        if width < 768:
-            return 'mobile'
-        elif width < 1024:
-            return 'tablet'
-        else:
-            return 'desktop'
+        category = cls.BREAKPOINTS[0][0]
+        for name, min_width in cls.BREAKPOINTS:
+            if width >= min_width:
+                category = name
+        return category
@@ -0,0 +1,88 @@
+"""On-disk cache of driver/browser binaries resolved by Selenium Manager"""
+
+import json
+import os
+import time
+
+CACHE_DIR = os.getenv('DRIVER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'ollama-ui-tests'))
+CACHE_TTL = float(os.getenv('DRIVER_CACHE_TTL_HOURS', '24')) * 3600
+
+
+class DriverBinaryCache:
+    """Remembers where Selenium Manager found chromedriver/geckodriver and the browser.
+
+    Selenium Manager otherwise runs (and may hit the network) on every driver
+    launch. Entries expire after DRIVER_CACHE_TTL_HOURS or as soon as a cached
+    file disappears; DriverFactory invalidates an entry whose driver can no
+    longer start a session (e.g. after a browser update).
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_DIR, 'drivers.json')
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, data):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, browser):
+        entry = self._load().get(browser)
+        if not entry or time.time() - entry.get('resolved_at', 0) > CACHE_TTL:
+            return None
+        paths = [entry.get('driver_path'), entry.get('browser_path')]
+        if not all(p is None or os.path.exists(p) for p in paths) or not entry.get('driver_path'):
+            return None
+        return entry
+
+    def invalidate(self, browser):
+        """Drop the cached entry so the next resolve() asks Selenium Manager again"""
+        data = self._load()
+        if data.pop(browser, None) is None:
+            return
+        try:
+            self._save(data)
+        except OSError as e:
+            print(f"Warning: Could not write driver cache: {e}")
+
+    def resolve(self, browser):
+        """Return {'driver_path', 'browser_path'} for browser, asking Selenium Manager on a miss"""
+        entry = self.get(browser)
+        if entry:
+            return entry
+        try:
+            entry = _selenium_manager_paths(browser)
+        except Exception as e:
+            print(f"Warning: Could not resolve {browser} driver via Selenium Manager: {e}")
+            return None
+        entry['resolved_at'] = time.time()
+        data = self._load()
+        data[browser] = entry
+        try:
+            self._save(data)
+        except OSError as e:
+            print(f"Warning: Could not write driver cache: {e}")
+        return entry
+
+
+def _selenium_manager_paths(browser):
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+    manager = SeleniumManager()
+    if hasattr(manager, 'binary_paths'):
+        # Selenium >= 4.20
+        paths = manager.binary_paths(['--browser', browser])
+        return {'driver_path': paths.get('driver_path'), 'browser_path': paths.get('browser_path') or None}
+    # Older Selenium 4.x only reports the driver location
+    if browser == 'chrome':
+        from selenium.webdriver.chrome.options import Options
+    else:
+        from selenium.webdriver.firefox.options import Options
+    return {'driver_path': manager.driver_location(Options()), 'browser_path': None}
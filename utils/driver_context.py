@@ -0,0 +1,63 @@
+"""Per-driver state that page objects share instead of re-querying the browser"""
+
+import weakref
+from .device_config import DeviceConfig
+from .wait_engine import WaitEngine
+
+
+class DriverContext:
+    """Device and wait configuration bound to one driver.
+
+    DriverFactory seeds the device it launched, so building page objects
+    costs no WebDriver round-trips. For drivers created elsewhere the
+    device is detected from the window size once, on first use. Anything
+    that changes the window size must go through resize() or call
+    invalidate() so the next read detects it again.
+    """
+
+    _contexts = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, device=None):
+        self.driver = driver
+        self._device = device
+        self.waits = WaitEngine.for_driver(driver)
+
+    @classmethod
+    def for_driver(cls, driver, device=None):
+        """Return the context bound to driver, creating it on first use"""
+        context = cls._contexts.get(driver)
+        if context is None:
+            context = cls._contexts[driver] = cls(driver, device)
+        elif device is not None:
+            context._device = device
+        return context
+
+    @classmethod
+    def drivers(cls):
+        """Every driver that currently has a context"""
+        return list(cls._contexts.keys())
+
+    @property
+    def device(self):
+        if self._device is None:
+            self._device = self._detect()
+        return self._device
+
+    def _detect(self):
+        """Detect device configuration from the current window size"""
+        try:
+            size = self.driver.get_window_size()
+            return DeviceConfig.custom(size['width'], size['height'])
+        except Exception as e:
+            print(f"Warning: Could not detect device from window size: {e}, defaulting to desktop")
+            return DeviceConfig.DESKTOP
+
+    def invalidate(self):
+        """Forget the cached device; the next read asks the browser again"""
+        self._device = None
+
+    def resize(self, width, height):
+        """Resize the window and record the device for the new width"""
+        self.driver.set_window_size(width, height)
+        self._device = DeviceConfig.custom(width, height)
+        return self._device
@@ -2,34 +2,105 @@ import os
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.common.exceptions import SessionNotCreatedException
+from .browser_context import BrowserContext
+from .browser_profile import ProfileTemplate
+from .driver_cache import DriverBinaryCache
 from .device_config import DeviceConfig
+from .driver_context import DriverContext
+from .network_capture import NetworkCapture
+from .command_profiler import CommandProfiler
 
 class DriverFactory:
+    binary_cache = DriverBinaryCache()
+    
+    @staticmethod
+    def _service(browser, options):
+        """Service for the cached driver binary (DRIVER_CACHE=false lets Selenium Manager resolve it)"""
+        service_cls = ChromeService if browser == 'chrome' else FirefoxService
+        if os.getenv('DRIVER_CACHE', 'true').lower() != 'true':
+            return service_cls()
+        paths = DriverFactory.binary_cache.resolve(browser)
+        if not paths:
+            return service_cls()
+        if paths.get('browser_path') and not options.binary_location:
+            options.binary_location = paths['browser_path']
+        return service_cls(executable_path=paths['driver_path'])
+    
     @staticmethod
-    def create_driver(browser='chrome', headless=True, width=1920, height=1080, device_config=None):
-        """Create driver with optional device configuration"""
+    def _start(browser, options, driver_cls):
+        """Start driver_cls on the cached binaries, resolving them afresh once if no session can start"""
+        binary_location = options.binary_location
+        try:
+            return driver_cls(options=options, service=DriverFactory._service(browser, options))
+        except SessionNotCreatedException as e:
+            if os.getenv('DRIVER_CACHE', 'true').lower() != 'true':
+                raise
+            # A browser update within the cache TTL leaves a driver that no longer matches it
+            print(f"Warning: Cached {browser} driver could not start a session, resolving it again: {e.msg}")
+            DriverFactory.binary_cache.invalidate(browser)
+            options.binary_location = binary_location
+            return driver_cls(options=options, service=DriverFactory._service(browser, options))
+    
+    @staticmethod
+    def _use_profile_template():
+        return os.getenv('PROFILE_TEMPLATE', 'false').lower() == 'true'
+    
+    @staticmethod
+    def create_driver(browser='chrome', headless=True, width=1920, height=1080, device_config=None, capture_network=None):
+        """Create driver with optional device configuration.
+
+        capture_network enables CDP network capture of streamed responses
+        (Chrome only); defaults to the CAPTURE_NETWORK env var.
+        """
+        if capture_network is None:
+            capture_network = os.getenv('CAPTURE_NETWORK', 'false').lower() == 'true'
         if device_config:
-            width = device_config['width']
-            height = device_config['height']
-            user_agent = device_config.get('user_agent')
+            width = device_config.width
+            height = device_config.height
+            user_agent = device_config.user_agent
         else:
             user_agent = None
             
         if browser.lower() == 'chrome':
-            return DriverFactory._create_chrome_driver(headless, width, height, user_agent)
+            driver = DriverFactory._create_chrome_driver(headless, width, height, user_agent, capture_network)
         elif browser.lower() == 'firefox':
-            return DriverFactory._create_firefox_driver(headless, width, height, user_agent)
+            driver = DriverFactory._create_firefox_driver(headless, width, height, user_agent)
         else:
             raise ValueError(f"Unsupported browser: {browser}")
+        
+        # The window size is known here, so pages never have to ask for it; a named
+        # preset (e.g. desktop_small) is kept as is so it is reported under its own name
+        DriverContext.for_driver(driver, device_config or DeviceConfig.custom(width, height))
+        if os.getenv('PROFILE_COMMANDS', 'false').lower() == 'true':
+            CommandProfiler.attach(driver)
+        return driver
     
     @staticmethod
-    def create_driver_for_device(browser='chrome', headless=True, device_name='desktop'):
+    def create_driver_for_device(browser='chrome', headless=True, device_name='desktop', capture_network=None):
         """Create driver for specific device type"""
         device_config = DeviceConfig.get_device_config(device_name)
-        return DriverFactory.create_driver(browser, headless, device_config=device_config)
+        return DriverFactory.create_driver(browser, headless, device_config=device_config, capture_network=capture_network)
     
     @staticmethod
-    def _create_chrome_driver(headless, width, height, user_agent=None):
+    def open_browser_context(driver, width=None, height=None):
+        """Give the caller an isolated browser context inside an existing Chrome driver.
+
+        The driver is switched to a fresh tab in a new context, sized like the
+        current window unless width/height are given; close the returned
+        BrowserContext to dispose it.
+        """
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            raise ValueError("Browser contexts need a Chrome driver (CDP)")
+        if not (width and height):
+            size = driver.get_window_size()
+            width, height = size['width'], size['height']
+        return BrowserContext.open(driver, width, height)
+    
+    @staticmethod
+    def _create_chrome_driver(headless, width, height, user_agent=None, capture_network=False):
         options = ChromeOptions()
         if headless:
             options.add_argument('--headless')
@@ -41,12 +112,39 @@ class DriverFactory:
             options.add_argument(f'--user-agent={user_agent}')
         
         # Mobile-specific options
-        if width < 768:  # Mobile breakpoint
+        if DeviceConfig.get_breakpoint(width) == 'mobile':
             options.add_argument('--disable-web-security')
             options.add_argument('--disable-features=VizDisplayCompositor')
         
-        driver = webdriver.Chrome(options=options)
+        if capture_network:
+            # Network.* events are read back from the performance log
+            options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        options.add_argument('--no-first-run')
+        options.add_argument('--no-default-browser-check')
+        
+        profile_dir = None
+        if DriverFactory._use_profile_template():
+            template = ProfileTemplate('chrome')
+            
+            def _launch(path):
+                template_options = ChromeOptions()
+                template_options.binary_location = options.binary_location
+                for arg in options.arguments:
+                    template_options.add_argument(arg)
+                template_options.add_argument(f'--user-data-dir={path}')
+                return DriverFactory._start('chrome', template_options, webdriver.Chrome)
+            
+            template.build(_launch)
+            profile_dir = template.copy()
+            options.add_argument(f'--user-data-dir={profile_dir}')
+        
+        driver = DriverFactory._start('chrome', options, webdriver.Chrome)
+        if profile_dir:
+            ProfileTemplate.cleanup_with(driver, profile_dir)
         driver.set_window_size(width, height)
+        if capture_network:
+            NetworkCapture.enable(driver)
         return driver
     
     @staticmethod
@@ -58,6 +156,21 @@ class DriverFactory:
         if user_agent:
             options.set_preference("general.useragent.override", user_agent)
         
-        driver = webdriver.Firefox(options=options)
+        if DriverFactory._use_profile_template():
+            template = ProfileTemplate('firefox')
+            
+            def _launch(path):
+                template_options = FirefoxOptions()
+                template_options.binary_location = options.binary_location
+                if headless:
+                    template_options.add_argument('--headless')
+                template_options.add_argument('-profile')
+                template_options.add_argument(path)
+                return DriverFactory._start('firefox', template_options, webdriver.Firefox)
+            
+            # geckodriver copies the profile it is given, so the template can be used directly
+            options.profile = template.build(_launch)
+        
+        driver = DriverFactory._start('firefox', options, webdriver.Firefox)
         driver.set_window_size(width, height)
         return driver
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""Observe every WebDriver protocol command a driver sends"""
+
+import time
+
+
+def add_command_listener(driver, listener):
+    """Call listener(command, params, duration, error) after each driver.execute.
+
+    driver.execute is wrapped once per driver instance; further listeners
+    share the same wrapper.
+    """
+    listeners = getattr(driver, '_command_listeners', None)
+    if listeners is None:
+        listeners = driver._command_listeners = []
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            error = None
+            try:
+                return original_execute(driver_command, params)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                duration = time.perf_counter() - start
+                for callback in list(listeners):
+                    callback(driver_command, params, duration, error)
+
+        driver.execute = execute
+    if listener not in listeners:
+        listeners.append(listener)
+    return listener
+
+
+def remove_command_listener(driver, listener):
+    listeners = getattr(driver, '_command_listeners', None)
+    if listeners and listener in listeners:
+        listeners.remove(listener)
+
+
+class CommandCounter:
+    """Running count and total time of commands sent by one driver"""
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+
+    def __call__(self, command, params, duration, error):
+        self.count += 1
+        self.time += duration
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Return the counter attached to driver, attaching one on first use"""
+        counter = getattr(driver, '_command_counter', None)
+        if counter is None:
+            counter = driver._command_counter = cls()
+            add_command_listener(driver, counter)
+        return counter
@@ -0,0 +1,208 @@
+"""Pool of warm WebDriver sessions that are reset and reused between tests"""
+
+import os
+from selenium.common.exceptions import WebDriverException
+from .browser_state import CLEAR_STORAGE_ASYNC_SCRIPT
+from .device_config import DeviceConfig
+from .driver_context import DriverContext
+from .driver_factory import DriverFactory
+from .resource_monitor import quit_driver
+
+
+class PooledDriver:
+    """A pooled WebDriver together with its bookkeeping"""
+
+    def __init__(self, key, driver):
+        self.key = key
+        self.driver = driver
+        self.uses = 0
+        # The device the factory launched, restored on every reset
+        self.device = DriverContext.for_driver(driver).device
+
+
+class DriverPool:
+    """Hands out warm browsers keyed by (browser, headless, device) and resets them on release.
+
+    A browser is recycled (quit and replaced on next acquire) after ``max_uses``
+    tests, or as soon as it stops responding.
+    """
+
+    def __init__(self, max_uses=20):
+        self.max_uses = max_uses
+        self._idle = {}
+        self._created = 0
+        self._recycled = 0
+
+    @staticmethod
+    def make_key(browser='chrome', headless=True, device_name=None, width=1920, height=1080):
+        """Build the pool key; custom sizes are keyed by their dimensions"""
+        if device_name and device_name != 'custom':
+            return (browser.lower(), headless, device_name.lower())
+        return (browser.lower(), headless, (width, height))
+
+    def acquire(self, browser='chrome', headless=True, device_name=None, width=1920, height=1080):
+        """Return a healthy driver for the key, launching a new browser only when none is idle"""
+        key = self.make_key(browser, headless, device_name, width, height)
+        idle = self._idle.setdefault(key, [])
+        while idle:
+            entry = idle.pop()
+            if self._is_alive(entry.driver):
+                entry.uses += 1
+                return entry
+            self._discard(entry)
+
+        if isinstance(key[2], str):
+            driver = DriverFactory.create_driver_for_device(
+                browser=browser,
+                headless=headless,
+                device_name=device_name
+            )
+        else:
+            driver = DriverFactory.create_driver(
+                browser=browser,
+                headless=headless,
+                width=width,
+                height=height
+            )
+        self._created += 1
+        entry = PooledDriver(key, driver)
+        entry.uses = 1
+        return entry
+
+    def release(self, entry, failed=False):
+        """Reset the driver and return it to the pool, or recycle it if worn out or broken"""
+        if failed or entry.uses >= self.max_uses or not self._reset(entry):
+            self._discard(entry)
+            return
+        self._idle.setdefault(entry.key, []).append(entry)
+
+    def close(self):
+        """Quit every idle browser"""
+        for entries in self._idle.values():
+            for entry in entries:
+                self._quit(entry.driver)
+        self._idle.clear()
+
+    def stats(self):
+        """Return counters describing pool effectiveness"""
+        return {
+            'created': self._created,
+            'recycled': self._recycled,
+            'idle': sum(len(entries) for entries in self._idle.values()),
+        }
+
+    def _discard(self, entry):
+        self._recycled += 1
+        self._quit(entry.driver)
+
+    @staticmethod
+    def _quit(driver):
+        # Kills the browser processes if quit() fails to stop them
+        quit_driver(driver)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _reset(entry):
+        """Bring the browser back to a clean state; return False if it is unusable"""
+        driver = entry.driver
+        try:
+            # Close any extra tabs/windows the test opened
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per-origin, so clear it while still on the app page
+            try:
+                error = driver.execute_async_script(CLEAR_STORAGE_ASYNC_SCRIPT)
+                if error:
+                    print(f"Warning: Could not clear IndexedDB of pooled driver: {error}")
+            except WebDriverException:
+                pass
+            driver.delete_all_cookies()
+
+            if hasattr(driver, 'execute_cdp_cmd'):
+                driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+
+            driver.get('about:blank')
+            # Undo resizes and device overrides so the next test sees the configured device
+            driver.set_window_size(entry.device.width, entry.device.height)
+            DriverContext.for_driver(driver, entry.device)
+            return True
+        except WebDriverException as e:
+            print(f"Warning: Could not reset pooled driver, recycling it: {e}")
+            return False
+
+    @classmethod
+    def from_env(cls):
+        """Create a pool configured from environment variables"""
+        return cls(max_uses=int(os.getenv('DRIVER_POOL_MAX_USES', '20')))
+
+
+class ContextHost:
+    """One Chrome per worker that gives every test its own browser context.
+
+    Contexts share the browser process (and its memory) but not cookies,
+    storage or cache, so far more tests fit in the same RAM than with a
+    browser per test. The host browser is launched on first acquire and
+    relaunched if it dies.
+    """
+
+    def __init__(self, browser='chrome', headless=True, device_name=None, width=1920, height=1080):
+        if browser.lower() != 'chrome':
+            raise ValueError(f"Browser contexts are only supported on Chrome, not {browser}")
+        self.headless = headless
+        self.device_name = device_name if device_name and device_name != 'custom' else None
+        if self.device_name:
+            device = DeviceConfig.get_device_config(self.device_name)
+            width, height = device.width, device.height
+        self.width = width
+        self.height = height
+        self.driver = None
+        self._launched = 0
+        self._opened = 0
+
+    def _ensure_driver(self):
+        if self.driver is not None and DriverPool._is_alive(self.driver):
+            return self.driver
+        if self.driver is not None:
+            DriverPool._quit(self.driver)
+        if self.device_name:
+            self.driver = DriverFactory.create_driver_for_device(
+                browser='chrome', headless=self.headless, device_name=self.device_name
+            )
+        else:
+            self.driver = DriverFactory.create_driver(
+                browser='chrome', headless=self.headless, width=self.width, height=self.height
+            )
+        self._launched += 1
+        return self.driver
+
+    def acquire(self):
+        """Open a fresh isolated context; the host driver is switched to its tab"""
+        context = DriverFactory.open_browser_context(self._ensure_driver(), self.width, self.height)
+        self._opened += 1
+        return context
+
+    def release(self, context):
+        """Dispose the context; a host that cannot clean up is replaced on next acquire"""
+        if not context.close():
+            DriverPool._quit(self.driver)
+            self.driver = None
+
+    def close(self):
+        if self.driver is not None:
+            DriverPool._quit(self.driver)
+            self.driver = None
+
+    def stats(self):
+        return {'launched': self._launched, 'contexts': self._opened}
@@ -0,0 +1,211 @@
+"""Deterministic test images, generated in memory and cached by content hash
+
+    cache = ImageCache()
+    path = cache.get(ImageSpec(1024, 768, 'JPEG', 'noise'))
+
+Images are generated once per spec, written to a tmpfs-backed directory
+(/dev/shm where available, overridable with IMAGE_CACHE_DIR) under the
+SHA-256 of their bytes, and reused by every later test, worker and run.
+tmpfs is RAM, so the directory is capped at IMAGE_CACHE_MAX_MB (default
+256); the least recently used images are evicted beyond that.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+from dataclasses import dataclass
+from PIL import Image
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are not serialized across workers
+    fcntl = None
+
+EXTENSIONS = {'PNG': 'png', 'JPEG': 'jpg', 'WEBP': 'webp'}
+COMPLEXITIES = ('solid', 'gradient', 'noise')
+
+
+@dataclass(frozen=True, slots=True)
+class ImageSpec:
+    """What to generate.
+
+    complexity controls how well the image compresses: 'solid' is a single
+    colour (tiny files), 'gradient' is smooth, 'noise' is random pixels and
+    gives the largest file a format produces for those dimensions.
+    """
+    width: int
+    height: int
+    format: str = 'PNG'
+    complexity: str = 'solid'
+    seed: int = 0
+
+    @property
+    def key(self):
+        return f"{self.width}x{self.height}-{self.complexity}-{self.seed}.{EXTENSIONS[self.format]}"
+
+
+# Named variants, from the image the upload test has always used up to large attachments
+PRESETS = {
+    'tiny': ImageSpec(16, 16),
+    'small': ImageSpec(256, 256, complexity='gradient'),
+    'medium': ImageSpec(1024, 768, complexity='gradient'),
+    'large': ImageSpec(2048, 1536, complexity='noise'),
+    'xlarge': ImageSpec(4096, 3072, complexity='noise'),
+}
+
+
+def default_cache_dir():
+    shm = '/dev/shm'
+    base = shm if os.path.isdir(shm) and os.access(shm, os.W_OK) else tempfile.gettempdir()
+    return os.path.join(base, 'ollama-ui-images')
+
+
+def render(spec):
+    """Encode the image described by spec and return its bytes"""
+    if spec.format not in EXTENSIONS:
+        raise ValueError(f"Unsupported image format: {spec.format}")
+    if spec.complexity == 'solid':
+        # Seed 0 is the plain red square the upload test has always sent
+        color = (255, 0, 0) if spec.seed == 0 else tuple(random.Random(spec.seed).randbytes(3))
+        image = Image.new('RGB', (spec.width, spec.height), color=color)
+    elif spec.complexity == 'gradient':
+        ramp = Image.linear_gradient('L')
+        red = ramp.resize((spec.width, spec.height))
+        green = ramp.rotate(90).resize((spec.width, spec.height))
+        blue = Image.new('L', (spec.width, spec.height), color=spec.seed % 256)
+        image = Image.merge('RGB', (red, green, blue))
+    elif spec.complexity == 'noise':
+        pixels = random.Random(spec.seed).randbytes(spec.width * spec.height * 3)
+        image = Image.frombytes('RGB', (spec.width, spec.height), pixels)
+    else:
+        raise ValueError(f"Unknown image complexity: {spec.complexity} (expected one of {COMPLEXITIES})")
+    buffer = io.BytesIO()
+    image.save(buffer, spec.format)
+    return buffer.getvalue()
+
+
+class ImageCache:
+    """Content-addressed store of generated images shared by all tests"""
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = directory or os.getenv('IMAGE_CACHE_DIR') or default_cache_dir()
+        os.makedirs(self.directory, exist_ok=True)
+        self.index_path = os.path.join(self.directory, 'index.json')
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('IMAGE_CACHE_MAX_MB', '256')) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self._index = self._load_index()
+        self._lock = threading.Lock()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Serialize index updates and eviction across threads and workers"""
+        with self._lock, open(self.index_path + '.lock', 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _save_index(self):
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def _path(self, digest, spec):
+        return os.path.join(self.directory, f"{digest}.{EXTENSIONS[spec.format]}")
+
+    def _images(self):
+        """(mtime, size, path) of every cached image, oldest first"""
+        images = []
+        for name in os.listdir(self.directory):
+            if name.rsplit('.', 1)[-1] not in EXTENSIONS.values():
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            images.append((stat.st_mtime, stat.st_size, path))
+        return sorted(images)
+
+    def _evict(self, keep):
+        """Remove least recently used images until the cache fits in max_bytes"""
+        images = self._images()
+        total = sum(size for _, size, _ in images)
+        removed = set()
+        for _, size, path in images:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed.add(os.path.basename(path).split('.')[0])
+        if removed:
+            self._index = {key: digest for key, digest in self._index.items() if digest not in removed}
+
+    def get(self, spec):
+        """Path to the image for spec (an ImageSpec or a PRESETS name), generating it on a miss"""
+        if isinstance(spec, str):
+            spec = PRESETS[spec]
+        for index in (self._index, self._load_index()):
+            # The second look picks up images other workers added since the index was loaded
+            digest = index.get(spec.key)
+            if digest:
+                path = self._path(digest, spec)
+                try:
+                    # mtime is the LRU clock; this also fails if the image was evicted
+                    os.utime(path)
+                except OSError:
+                    continue
+                self._index[spec.key] = digest
+                return path
+        data = render(spec)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest, spec)
+        with self._locked():
+            if not os.path.exists(path):
+                # Atomic so parallel workers never read a half-written image
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            # Merge with what other workers saved since this one loaded the index
+            self._index = dict(self._load_index(), **{spec.key: digest})
+            self._evict(keep=path)
+            self._save_index()
+        return path
+
+    def variants(self, sizes, formats=('PNG',), complexity='noise'):
+        """Paths for every (width, height) x format combination, keyed by (size, format)"""
+        return {
+            ((w, h), fmt): self.get(ImageSpec(w, h, fmt, complexity))
+            for (w, h) in sizes for fmt in formats
+        }
+
+    def clear(self):
+        """Delete every cached image"""
+        with self._locked():
+            for name in os.listdir(self.directory):
+                if name.endswith('.lock'):
+                    continue
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+            self._index = {}
@@ -0,0 +1,219 @@
+"""Responsive layout sweep: one live driver resized through a range of widths
+
+Usage:
+    python -m utils.layout_sweep --url stub --min-width 320 --max-width 2560 --step 80
+
+Instead of a browser per device, the window of a single driver is resized
+(through DriverContext.resize) from min_width to max_width. At each width
+one script reports which LAYOUT_CHECKS of SidebarPage and the chat pages
+are visible. Wherever two neighbouring widths disagree the range is
+bisected down to the pixel, so every flip is reported at its exact width.
+A check fails at a width when its page is in use there (the chat page
+depends on the breakpoint) and visibility differs from what it expects.
+Both are judged by the measured viewport (innerWidth), which is narrower
+than the window by any scrollbar or browser chrome.
+
+Widths on both sides of every DeviceConfig breakpoint are always probed;
+a flip that happens and reverts within one step elsewhere can be missed.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from pages.element_snapshot import LOCATE_ALL_JS
+from utils.device_config import DeviceConfig
+from utils.driver_context import DriverContext
+
+# Measures after two animation frames so resize handlers and reflow have run
+LAYOUT_PROBE_SCRIPT = LOCATE_ALL_JS + """
+const checks = arguments[0], done = arguments[arguments.length - 1];
+const isShown = el => {
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+};
+let measured = false;
+function measure() {
+    if (measured) return;
+    measured = true;
+    const visible = {};
+    for (const [name, candidates] of checks) {
+        visible[name] = candidates.some(([by, value]) => locateAll(by, value).some(isShown));
+    }
+    done({viewport: window.innerWidth, visible: visible});
+}
+requestAnimationFrame(() => requestAnimationFrame(measure));
+// Frames can be throttled for background windows
+setTimeout(measure, 250);
+"""
+
+
+def default_pages():
+    from pages.ollama_chat_desktop import OllamaChatDesktopPage
+    from pages.ollama_chat_mobile import OllamaChatMobilePage
+    from pages.sidebar_page import SidebarPage
+    return [SidebarPage, OllamaChatDesktopPage, OllamaChatMobilePage]
+
+
+def pages_in_use(width):
+    """Page classes a test would use at this width"""
+    from pages.page_factory import PageFactory
+    from pages.sidebar_page import SidebarPage
+    return (SidebarPage, PageFactory.chat_page_class(DeviceConfig.for_width(width)))
+
+
+class LayoutSweep:
+    """Resizes one driver through a width range and records where layout checks flip"""
+
+    def __init__(self, driver, pages=None, height=900):
+        self.driver = driver
+        self.context = DriverContext.for_driver(driver)
+        self.height = height
+        self.checks = {
+            f"{page.__name__}.{check.name}": (page, check)
+            for page in (pages or default_pages())
+            for check in page.LAYOUT_CHECKS
+        }
+        self._script_checks = [[name, check.candidates()] for name, (_, check) in self.checks.items()]
+        # width -> {'viewport': innerWidth, 'visible': {check: bool}}
+        self.samples = {}
+
+    def probe(self, width):
+        """Visibility of every check at a window width (cached per sweep)"""
+        sample = self.samples.get(width)
+        if sample is None:
+            self.context.resize(width, self.height)
+            sample = self.samples[width] = self.driver.execute_async_script(LAYOUT_PROBE_SCRIPT, self._script_checks)
+        return sample
+
+    def _bisect(self, low, high):
+        """Probe between two widths until every change is pinned to adjacent pixels"""
+        if high - low <= 1 or self.probe(low)['visible'] == self.probe(high)['visible']:
+            return
+        middle = (low + high) // 2
+        self.probe(middle)
+        self._bisect(low, middle)
+        self._bisect(middle, high)
+
+    @staticmethod
+    def widths(min_width, max_width, step):
+        """Stepped widths plus both sides of every breakpoint in range"""
+        widths = set(range(min_width, max_width + 1, step)) | {max_width}
+        for _, boundary in DeviceConfig.BREAKPOINTS:
+            widths |= {w for w in (boundary - 1, boundary) if min_width <= w <= max_width}
+        return sorted(widths)
+
+    def run(self, url, min_width=320, max_width=2560, step=80):
+        """Sweep the page at url and return flips and failures; the window size is restored afterwards"""
+        original = self.driver.get_window_size()
+        start = time.monotonic()
+        try:
+            self.context.resize(min_width, self.height)
+            self.driver.get(url)
+            coarse = self.widths(min_width, max_width, step)
+            for width in coarse:
+                self.probe(width)
+            for low, high in zip(coarse, coarse[1:]):
+                self._bisect(low, high)
+        finally:
+            self.context.resize(original['width'], original['height'])
+        return self.report(min_width, max_width, step, time.monotonic() - start)
+
+    def flips(self):
+        """Every width where a check changes visibility, as the first width of the new state"""
+        ordered = sorted(self.samples)
+        flips = []
+        for low, high in zip(ordered, ordered[1:]):
+            before, after = self.samples[low]['visible'], self.samples[high]['visible']
+            for name in self.checks:
+                if before[name] != after[name]:
+                    flips.append({
+                        'check': name,
+                        'width': high,
+                        'viewport': self.samples[high]['viewport'],
+                        'visible': after[name],
+                        'exact': high - low == 1,
+                    })
+        return flips
+
+    def failures(self):
+        """Width ranges where a check of a page in use disagrees with its expectation"""
+        failures = []
+        open_ranges = {}
+        for width in sorted(self.samples):
+            sample = self.samples[width]
+            # Media queries see the viewport, not the window width
+            active = pages_in_use(sample['viewport'])
+            for name, (page, check) in self.checks.items():
+                observed = sample['visible'][name]
+                failing = page in active and observed != check.expected(sample['viewport'])
+                current = open_ranges.get(name)
+                if failing and current is None:
+                    open_ranges[name] = current = {'check': name, 'from_width': width, 'to_width': width,
+                                                   'visible': observed}
+                    failures.append(current)
+                elif failing:
+                    current['to_width'] = width
+                else:
+                    open_ranges.pop(name, None)
+        return failures
+
+    def report(self, min_width, max_width, step, duration):
+        return {
+            'config': {'min_width': min_width, 'max_width': max_width, 'step': step, 'height': self.height},
+            'breakpoints': dict(DeviceConfig.BREAKPOINTS),
+            'duration': round(duration, 2),
+            'probes': len(self.samples),
+            'flips': self.flips(),
+            'failures': self.failures(),
+            'samples': [dict(self.samples[w], width=w) for w in sorted(self.samples)],
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=os.getenv('OLLAMA_URL', 'stub'), help="App URL, or 'stub' for the local stub")
+    parser.add_argument('--min-width', type=int, default=320)
+    parser.add_argument('--max-width', type=int, default=2560)
+    parser.add_argument('--step', type=int, default=80)
+    parser.add_argument('--height', type=int, default=900)
+    parser.add_argument('--browser', default=os.getenv('BROWSER', 'chrome'))
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('--output', default='layout-sweep/layout_sweep.json')
+    args = parser.parse_args(argv)
+
+    from utils.driver_factory import DriverFactory
+    from utils.resource_monitor import quit_driver
+    from utils.stub_server import StubOllamaServer
+
+    server = StubOllamaServer().start() if args.url == 'stub' else None
+    driver = DriverFactory.create_driver(args.browser, not args.headed, args.min_width, args.height)
+    try:
+        result = LayoutSweep(driver, height=args.height).run(
+            server.url if server else args.url, args.min_width, args.max_width, args.step
+        )
+    finally:
+        quit_driver(driver)
+        if server:
+            server.stop()
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    print(f"{result['probes']} widths probed in {result['duration']}s")
+    for flip in result['flips']:
+        state = 'shown' if flip['visible'] else 'hidden'
+        print(f"  {flip['check']:40s} {state} from {flip['width']}px (viewport {flip['viewport']}px)")
+    for failure in result['failures']:
+        print(f"FAIL {failure['check']} visible={failure['visible']} at {failure['from_width']}-{failure['to_width']}px")
+    return 1 if result['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
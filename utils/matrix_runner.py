@@ -0,0 +1,214 @@
+"""Run the device x browser matrix in parallel worker processes
+
+Usage:
+    python -m utils.matrix_runner --browsers chrome firefox -- -m smoke
+
+Each matrix combination runs as its own pytest process with the same
+BROWSER/DEVICE environment variables the CI matrix sets. Combinations are
+scheduled longest-first over a process pool sized to the available cores
+and memory, using durations recorded by previous runs. All combinations
+write into one Allure results directory, their JUnit XML files are
+merged into a single file, and an index page links every pytest-html report.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+from pages.page_factory import PageFactory
+
+DEFAULT_DURATION = 60.0
+DEFAULT_BROWSER_MEMORY_MB = 700
+
+
+def available_memory_mb():
+    """Return available system memory in MB, or None if it cannot be determined"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_worker_count(browser_memory_mb=DEFAULT_BROWSER_MEMORY_MB):
+    """Size the pool by whichever of CPU or RAM runs out first"""
+    cpu_workers = os.cpu_count() or 1
+    memory = available_memory_mb()
+    if memory is None:
+        return cpu_workers
+    return max(1, min(cpu_workers, memory // browser_memory_mb))
+
+
+def expand_matrix(browsers, devices=None):
+    """Expand browsers x devices into a list of combinations"""
+    devices = devices or PageFactory.get_supported_devices()
+    return [{'browser': b, 'device': d, 'name': f"{b}-{d}"} for b in browsers for d in devices]
+
+
+def load_durations(path):
+    """Load historical per-combination durations (seconds)"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(path, durations):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def schedule(combinations, durations):
+    """Order combinations longest-first so the slowest ones never start last"""
+    return sorted(combinations, key=lambda c: durations.get(c['name'], DEFAULT_DURATION), reverse=True)
+
+
+def run_combination(combination, pytest_args, alluredir, junit_dir, html_dir, headless=True):
+    """Run pytest for a single combination and return its result summary"""
+    env = dict(os.environ)
+    env['BROWSER'] = combination['browser']
+    env['DEVICE'] = combination['device']
+    env['HEADLESS'] = 'true' if headless else 'false'
+    env['TEST_NAME'] = combination['name']
+
+    junit_path = os.path.join(junit_dir, f"{combination['name']}.xml")
+    html_path = os.path.join(html_dir, f"{combination['name']}.html")
+    cmd = [
+        sys.executable, '-m', 'pytest',
+        f'--alluredir={alluredir}',
+        f'--junitxml={junit_path}',
+        '-o', f"junit_suite_name={combination['name']}",
+        f'--html={html_path}',
+        '--self-contained-html',
+        *pytest_args,
+    ]
+    start = time.monotonic()
+    proc = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    return {
+        'name': combination['name'],
+        'returncode': proc.returncode,
+        'duration': time.monotonic() - start,
+        'junit': junit_path,
+        'html': html_path,
+        'output': proc.stdout + proc.stderr,
+    }
+
+
+def merge_junit(paths, output_path):
+    """Merge per-combination JUnit XML files into one <testsuites> document"""
+    merged = ET.Element('testsuites')
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == 'testsuite' else list(root)
+        merged.extend(suites)
+    ET.ElementTree(merged).write(output_path, encoding='utf-8', xml_declaration=True)
+    return output_path
+
+
+def run_matrix(browsers, devices=None, workers=None, pytest_args=(), output_dir='matrix-results',
+               durations_path='.matrix_durations.json', headless=True):
+    """Run every combination and return the list of results"""
+    # Combinations run with cwd=PROJECT_ROOT, so hand them paths that do not depend on the cwd
+    output_dir = os.path.abspath(output_dir)
+    durations_path = os.path.abspath(durations_path)
+    alluredir = os.path.join(output_dir, 'allure-results')
+    junit_dir = os.path.join(output_dir, 'junit')
+    html_dir = os.path.join(output_dir, 'html')
+    for path in (alluredir, junit_dir, html_dir):
+        os.makedirs(path, exist_ok=True)
+
+    durations = load_durations(durations_path)
+    combinations = schedule(expand_matrix(browsers, devices), durations)
+    workers = workers or default_worker_count()
+    print(f"Running {len(combinations)} combinations on {workers} worker(s)")
+
+    results = []
+    # Each combination is its own pytest process, so threads are enough to drive them
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_combination, c, list(pytest_args), alluredir, junit_dir, html_dir, headless)
+            for c in combinations
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = 'PASS' if result['returncode'] == 0 else 'FAIL'
+            print(f"{status} {result['name']} ({result['duration']:.1f}s)")
+            if result['returncode'] != 0:
+                print(result['output'])
+            durations[result['name']] = round(result['duration'], 2)
+            results.append(result)
+
+    save_durations(durations_path, durations)
+    merge_junit([r['junit'] for r in results], os.path.join(output_dir, 'junit.xml'))
+    write_html_index(results, os.path.join(output_dir, 'index.html'))
+    return results
+
+
+def write_html_index(results, output_path):
+    """Write one HTML page summarising every combination and linking its pytest-html report"""
+    rows = []
+    for r in sorted(results, key=lambda r: r['name']):
+        status = 'passed' if r['returncode'] == 0 else 'failed'
+        link = os.path.relpath(r['html'], os.path.dirname(output_path))
+        rows.append(
+            f"<tr class='{status}'><td><a href='{link}'>{r['name']}</a></td>"
+            f"<td>{status}</td><td>{r['duration']:.1f}s</td></tr>"
+        )
+    with open(output_path, 'w') as f:
+        f.write(
+            "<html><head><title>Matrix report</title><style>"
+            ".passed{color:green}.failed{color:red}td{padding:4px 12px}"
+            "</style></head><body><h1>Matrix report</h1><table>"
+            "<tr><th>Combination</th><th>Status</th><th>Duration</th></tr>"
+            + "".join(rows) +
+            "</table></body></html>"
+        )
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--browsers', nargs='+', default=[os.getenv('BROWSER', 'chrome')])
+    parser.add_argument('--devices', nargs='+', default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output-dir', default='matrix-results')
+    parser.add_argument('--durations', default='.matrix_durations.json')
+    parser.add_argument('--headed', action='store_true')
+    parser.add_argument('pytest_args', nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+
+    pytest_args = [a for a in args.pytest_args if a != '--']
+    results = run_matrix(
+        browsers=args.browsers,
+        devices=args.devices,
+        workers=args.workers,
+        pytest_args=pytest_args,
+        output_dir=args.output_dir,
+        durations_path=args.durations,
+        headless=not args.headed,
+    )
+    return 0 if all(r['returncode'] == 0 for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
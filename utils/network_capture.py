@@ -0,0 +1,123 @@
+"""Capture streamed chat responses at the network level via Chrome DevTools Protocol"""
+
+import base64
+import json
+import time
+import weakref
+from .chat_stream import parse_stream_line
+
+
+class StreamChunk:
+    """Bytes received for the captured request, with the CDP timestamp (seconds)"""
+    __slots__ = ('data', 'timestamp')
+
+    def __init__(self, data, timestamp):
+        self.data = data
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"StreamChunk({len(self.data)} bytes @ {self.timestamp:.6f})"
+
+
+class NetworkCapture:
+    """Follows one streaming request (by default POST /api/chat) through CDP events.
+
+    Requires a Chrome driver created with performance logging enabled
+    (DriverFactory does this when capture_network=True). Call arm() before
+    triggering the request so earlier traffic is ignored, then iterate
+    chunks() or tokens().
+    """
+
+    _enabled = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, url_pattern='/api/chat', method='POST'):
+        self.driver = driver
+        self.url_pattern = url_pattern
+        self.method = method
+        self.request_id = None
+        self.request_timestamp = None
+        self.response_timestamp = None
+
+    @classmethod
+    def enable(cls, driver):
+        """Turn on CDP network events for driver"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        cls._enabled[driver] = True
+
+    @classmethod
+    def is_enabled(cls, driver):
+        return cls._enabled.get(driver, False)
+
+    def _events(self):
+        for entry in self.driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            yield message.get('method'), message.get('params', {})
+
+    def arm(self):
+        """Discard buffered events so only requests made from now on are captured"""
+        self.driver.get_log('performance')
+        self.request_id = None
+        return self
+
+    def chunks(self, timeout=60, poll_interval=0.05):
+        """Yield StreamChunk objects as the response body arrives"""
+        deadline = time.monotonic() + timeout
+        streaming = False
+        while time.monotonic() < deadline:
+            for method, params in self._events():
+                if self.request_id is None:
+                    request = params.get('request', {})
+                    if (method == 'Network.requestWillBeSent'
+                            and self.url_pattern in request.get('url', '')
+                            and request.get('method') == self.method):
+                        self.request_id = params['requestId']
+                        self.request_timestamp = params.get('timestamp')
+                    continue
+                if params.get('requestId') != self.request_id:
+                    continue
+                if method == 'Network.responseReceived':
+                    self.response_timestamp = params.get('timestamp')
+                    buffered = self._start_streaming()
+                    streaming = buffered is not None
+                    if buffered:
+                        yield StreamChunk(buffered, params.get('timestamp'))
+                elif method == 'Network.dataReceived' and streaming and params.get('data'):
+                    yield StreamChunk(base64.b64decode(params['data']), params.get('timestamp'))
+                elif method == 'Network.loadingFinished':
+                    if not streaming:
+                        # Finished before streaming could start: fall back to the full body
+                        yield StreamChunk(self._response_body(), params.get('timestamp'))
+                    return
+                elif method == 'Network.loadingFailed':
+                    raise RuntimeError(f"Captured request failed: {params.get('errorText')}")
+            time.sleep(poll_interval)
+        raise TimeoutError(f"No complete response for {self.url_pattern} within {timeout}s")
+
+    def tokens(self, timeout=60):
+        """Yield (token, timestamp) pairs decoded from the captured stream"""
+        buffer = b''
+        timestamp = None
+        for chunk in self.chunks(timeout):
+            buffer += chunk.data
+            timestamp = chunk.timestamp
+            while b'\n' in buffer:
+                line, buffer = buffer.split(b'\n', 1)
+                token = parse_stream_line(line.decode('utf-8', errors='replace'))
+                if token:
+                    yield token, chunk.timestamp
+        token = parse_stream_line(buffer.decode('utf-8', errors='replace'))
+        if token:
+            yield token, timestamp
+
+    def _start_streaming(self):
+        """Ask Chrome to forward body bytes in dataReceived; return what was already buffered"""
+        try:
+            result = self.driver.execute_cdp_cmd('Network.streamResourceContent', {'requestId': self.request_id})
+            return base64.b64decode(result.get('bufferedData', ''))
+        except Exception:
+            return None
+
+    def _response_body(self):
+        result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': self.request_id})
+        body = result.get('body', '')
+        return base64.b64decode(body) if result.get('base64Encoded') else body.encode()
@@ -0,0 +1,159 @@
+"""Memory usage of browser process trees, read from /proc (Linux only)"""
+
+import os
+import signal
+import threading
+
+SUPPORTED = os.path.isdir('/proc')
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def children(pid):
+    """Direct child pids of pid"""
+    found = []
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        stat = _read(f'/proc/{name}/stat')
+        if stat is None:
+            continue
+        # The command name is parenthesised and may contain spaces
+        fields = stat.rsplit(')', 1)[-1].split()
+        if len(fields) > 1 and int(fields[1]) == pid:
+            found.append(int(name))
+    return found
+
+
+def process_tree(pid):
+    """pid and all of its descendants"""
+    tree = [pid]
+    index = 0
+    while index < len(tree):
+        tree.extend(children(tree[index]))
+        index += 1
+    return tree
+
+
+def process_name(pid):
+    """Command name of pid ('chrome', 'chromedriver', ...), or None if it has exited"""
+    comm = _read(f'/proc/{pid}/comm')
+    return comm.strip() if comm else None
+
+
+def is_alive(pid):
+    stat = _read(f'/proc/{pid}/stat')
+    # Zombies have exited and only wait to be reaped by their parent
+    return stat is not None and stat.rsplit(')', 1)[-1].split()[0] != 'Z'
+
+
+def open_fds(pid):
+    """Number of open file descriptors of pid, or None if it cannot be read"""
+    try:
+        return len(os.listdir(f'/proc/{pid}/fd'))
+    except OSError:
+        return None
+
+
+def kill(pids):
+    """SIGKILL every pid that is still alive; return the ones that were killed"""
+    killed = []
+    for pid in pids:
+        if not is_alive(pid):
+            continue
+        try:
+            os.kill(pid, signal.SIGKILL)
+            killed.append(pid)
+        except OSError:
+            pass
+    return killed
+
+
+def memory_kb(pid):
+    """(rss, pss) of one process in kB; pss is None where smaps_rollup is unavailable"""
+    rss = pss = None
+    status = _read(f'/proc/{pid}/status')
+    for line in (status or '').splitlines():
+        if line.startswith('VmRSS:'):
+            rss = int(line.split()[1])
+    rollup = _read(f'/proc/{pid}/smaps_rollup')
+    for line in (rollup or '').splitlines():
+        if line.startswith('Pss:'):
+            pss = int(line.split()[1])
+    return rss, pss
+
+
+def tree_memory(pid):
+    """Memory of a process tree in MB.
+
+    RSS double-counts pages shared between processes (Chrome shares a lot),
+    so PSS, which splits shared pages between their users, is the fairer
+    total when comparing one browser against many.
+    """
+    rss_total = pss_total = 0
+    pss_complete = True
+    pids = process_tree(pid)
+    for member in pids:
+        rss, pss = memory_kb(member)
+        rss_total += rss or 0
+        if pss is None:
+            pss_complete = False
+        else:
+            pss_total += pss
+    return {
+        'processes': len(pids),
+        'rss_mb': round(rss_total / 1024, 1),
+        'pss_mb': round(pss_total / 1024, 1) if pss_complete else None,
+    }
+
+
+def driver_pid(driver):
+    """Pid of the chromedriver/geckodriver process behind a local WebDriver, or None"""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    return getattr(process, 'pid', None)
+
+
+class MemorySampler:
+    """Background thread recording the peak memory of a set of process trees"""
+
+    def __init__(self, pids=None, interval=0.5):
+        self.pids = list(pids or [])
+        self.interval = interval
+        self.peak = {'rss_mb': 0.0, 'pss_mb': 0.0, 'processes': 0}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        """Measure the trees now and fold the result into the peak"""
+        totals = {'rss_mb': 0.0, 'pss_mb': 0.0, 'processes': 0}
+        for pid in list(self.pids):
+            usage = tree_memory(pid)
+            totals['rss_mb'] += usage['rss_mb']
+            totals['pss_mb'] += usage['pss_mb'] or 0.0
+            totals['processes'] += usage['processes']
+        for key, value in totals.items():
+            self.peak[key] = max(self.peak[key], round(value, 1))
+        return totals
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.sample()
+        return self.peak
@@ -0,0 +1,163 @@
+"""Per-worker resource monitor: time series, per-test memory budgets and orphan cleanup
+
+Enable with RESOURCE_MONITOR=true. Every pytest worker then samples its own
+process tree (the worker, chromedriver/geckodriver and the browsers) in the
+background and appends one JSON line per sample to
+RESOURCE_SERIES_DIR/<worker>.jsonl:
+
+    {"time": ..., "worker": "gw0", "test": "tests/...::test_x", "rss_mb": ...,
+     "pss_mb": ..., "open_fds": ..., "children": ..., "browsers": ...}
+"""
+
+import json
+import os
+import threading
+import time
+from .process_stats import (
+    SUPPORTED, driver_pid, is_alive, kill, memory_kb, open_fds, process_name, process_tree,
+)
+
+# /proc/<pid>/comm is truncated to 15 characters
+BROWSER_PROCESS_NAMES = ('chrome', 'chromedriver', 'chromium', 'chromium-browse', 'headless_shell',
+                         'geckodriver', 'firefox', 'firefox-bin')
+
+
+def worker_id():
+    return os.getenv('PYTEST_XDIST_WORKER', 'main')
+
+
+def is_browser_process(pid):
+    name = process_name(pid)
+    return name is not None and name.startswith(BROWSER_PROCESS_NAMES)
+
+
+def quit_driver(driver, grace=2.0):
+    """Quit driver, then kill any of its processes still running after grace seconds.
+
+    The process tree is captured before quitting because browsers whose
+    driver dies are re-parented and can no longer be found from it.
+    Returns the pids that had to be killed.
+    """
+    pid = driver_pid(driver)
+    tree = process_tree(pid) if pid and SUPPORTED else []
+    try:
+        driver.quit()
+    except Exception as e:
+        print(f"Warning: Could not quit driver: {e}")
+    if not tree:
+        return []
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline and any(is_alive(p) for p in tree):
+        time.sleep(0.1)
+    killed = kill(tree)
+    if killed:
+        print(f"Warning: Killed {len(killed)} browser processes left behind by quit(): {killed}")
+        ResourceMonitor.orphans_killed += len(killed)
+    return killed
+
+
+class ResourceMonitor:
+    """Samples one worker's process tree and checks per-test memory growth"""
+
+    # Counted across quit_driver() calls and sweeps for the end-of-run summary
+    orphans_killed = 0
+
+    def __init__(self, path, interval=1.0, test_budget_mb=None):
+        self.pid = os.getpid()
+        self.worker = worker_id()
+        self.path = path
+        self.interval = interval
+        self.test_budget_mb = test_budget_mb
+        self.current_test = None
+        self._test_start_mb = None
+        self._test_peak_mb = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def from_env(cls):
+        directory = os.getenv('RESOURCE_SERIES_DIR', 'resource-usage')
+        budget = os.getenv('TEST_MEMORY_BUDGET_MB')
+        return cls(
+            os.path.join(directory, f'{worker_id()}.jsonl'),
+            interval=float(os.getenv('RESOURCE_SAMPLE_INTERVAL', '1.0')),
+            test_budget_mb=float(budget) if budget else None,
+        )
+
+    def sample(self):
+        """Measure the worker's process tree now and append it to the time series"""
+        pids = process_tree(self.pid)
+        rss = pss = 0
+        for pid in pids:
+            rss_kb, pss_kb = memory_kb(pid)
+            rss += rss_kb or 0
+            pss += pss_kb or 0
+        record = {
+            'time': round(time.time(), 3),
+            'worker': self.worker,
+            'test': self.current_test,
+            'rss_mb': round(rss / 1024, 1),
+            'pss_mb': round(pss / 1024, 1),
+            'open_fds': open_fds(self.pid),
+            'children': len(pids) - 1,
+            'browsers': sum(1 for pid in pids[1:] if is_browser_process(pid)),
+        }
+        with self._lock:
+            if self.current_test is not None:
+                self._test_peak_mb = max(self._test_peak_mb, record['rss_mb'])
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        return record
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def begin_test(self, nodeid):
+        with self._lock:
+            self.current_test = nodeid
+            self._test_start_mb = self._test_peak_mb = 0.0
+        record = self.sample()
+        with self._lock:
+            self._test_start_mb = self._test_peak_mb = record['rss_mb']
+
+    def end_test(self):
+        """Finish the current test; return its memory usage and whether it broke the budget"""
+        self.sample()
+        with self._lock:
+            growth = round(self._test_peak_mb - self._test_start_mb, 1)
+            result = {
+                'test': self.current_test,
+                'start_mb': self._test_start_mb,
+                'peak_mb': self._test_peak_mb,
+                'growth_mb': growth,
+                'over_budget': self.test_budget_mb is not None and growth > self.test_budget_mb,
+            }
+            self.current_test = None
+        return result
+
+    def kill_orphans(self, live_drivers=()):
+        """Kill browser processes under this worker that belong to no live driver"""
+        owned = set()
+        for driver in live_drivers:
+            pid = driver_pid(driver)
+            if pid and is_alive(pid):
+                owned.update(process_tree(pid))
+        orphans = [pid for pid in process_tree(self.pid)[1:] if pid not in owned and is_browser_process(pid)]
+        killed = kill(orphans)
+        if killed:
+            print(f"Warning: Killed {len(killed)} orphaned browser processes: {killed}")
+            ResourceMonitor.orphans_killed += len(killed)
+        return killed
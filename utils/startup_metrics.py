@@ -0,0 +1,42 @@
+"""Cold-start measurement: time from process start to the first test body"""
+
+import json
+import os
+import time
+
+
+def process_start_time():
+    """Wall-clock time the current process started (falls back to now if unknown)"""
+    try:
+        with open('/proc/self/stat') as f:
+            # Field 22 is start time in clock ticks since boot; skip past "(comm)"
+            fields = f.read().rsplit(')', 1)[1].split()
+        start_ticks = int(fields[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        boot_time = time.time() - uptime
+        return boot_time + start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+class StartupMetrics:
+    """Collects the phases that make up 'time to first test'"""
+
+    def __init__(self):
+        self.process_start = process_start_time()
+        self.marks = {}
+
+    def mark(self, name):
+        """Record the first occurrence of a phase, in seconds since process start"""
+        if name not in self.marks:
+            self.marks[name] = round(time.time() - self.process_start, 4)
+
+    @property
+    def time_to_first_test(self):
+        return self.marks.get('first_test_call')
+
+    def export(self, path):
+        with open(path, 'w') as f:
+            json.dump({'time_to_first_test': self.time_to_first_test, 'phases': self.marks}, f, indent=2)
+        return path
@@ -0,0 +1,194 @@
+"""Capture the app's client-side state after an expensive setup and restore it into any driver
+
+    cache = SnapshotCache()
+    snapshot = cache.get_or_build('conversations-50', driver, base_url, build=create_conversations)
+    snapshot.restore(driver, base_url)
+
+A snapshot holds cookies, localStorage, sessionStorage and IndexedDB of the
+app's origin. Snapshots are cached on disk per app version (APP_VERSION, or
+a hash of the page's scripts), so a heavy setup runs once per build of the
+app and every later test, worker or CI job on that build just restores it.
+IndexedDB values must survive a round-trip through JSON; Blobs, Dates and
+similar structured-clone types are not preserved.
+"""
+
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlsplit
+from .app_state import AppState, seed_state
+from .driver_cache import CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows: builds are not serialized across workers
+    fcntl = None
+
+CAPTURE_SCRIPT = """
+const done = arguments[arguments.length - 1];
+function dump(storage) {
+    const out = {};
+    for (let i = 0; i < storage.length; i++) { const k = storage.key(i); out[k] = storage.getItem(k); }
+    return out;
+}
+function request(req) {
+    return new Promise((resolve, reject) => { req.onsuccess = () => resolve(req.result); req.onerror = () => reject(req.error); });
+}
+async function dumpDatabase(name) {
+    const db = await request(indexedDB.open(name));
+    const out = {__version__: db.version};
+    for (const storeName of Array.from(db.objectStoreNames)) {
+        const store = db.transaction(storeName, 'readonly').objectStore(storeName);
+        const [keys, values] = await Promise.all([request(store.getAllKeys()), request(store.getAll())]);
+        out[storeName] = {
+            keyPath: store.keyPath,
+            autoIncrement: store.autoIncrement,
+            indexes: Array.from(store.indexNames).map(n => {
+                const index = store.index(n);
+                return {name: n, keyPath: index.keyPath, unique: index.unique, multiEntry: index.multiEntry};
+            }),
+            records: keys.map((k, i) => [k, values[i]]),
+        };
+    }
+    db.close();
+    return out;
+}
+(async () => {
+    const result = {local: dump(localStorage), session: dump(sessionStorage), indexedDB: {},
+                    scripts: Array.from(document.scripts).map(s => s.src || s.textContent)};
+    if (indexedDB.databases) {
+        for (const info of await indexedDB.databases()) result.indexedDB[info.name] = await dumpDatabase(info.name);
+    }
+    return result;
+})().then(done, e => done({error: String(e)}));
+"""
+
+SCRIPTS_SCRIPT = "return Array.from(document.scripts).map(s => s.src || s.textContent);"
+
+
+def _version_from_scripts(scripts):
+    return hashlib.sha256('\n'.join(scripts).encode()).hexdigest()[:16]
+
+
+def app_version(driver):
+    """APP_VERSION if set, otherwise a hash of the scripts of the page driver has loaded"""
+    return os.getenv('APP_VERSION') or _version_from_scripts(driver.execute_script(SCRIPTS_SCRIPT))
+
+
+class StateSnapshot:
+    """Cookies and storage of one origin at one point in time"""
+
+    def __init__(self, origin, cookies=(), local_storage=None, session_storage=None, indexed_db=None,
+                 app_version=None, created_at=None):
+        self.origin = origin
+        self.cookies = list(cookies)
+        self.local_storage = dict(local_storage or {})
+        self.session_storage = dict(session_storage or {})
+        self.indexed_db = dict(indexed_db or {})
+        self.app_version = app_version
+        self.created_at = created_at or time.time()
+
+    @classmethod
+    def capture(cls, driver):
+        """Snapshot the state of the origin driver is currently on"""
+        result = driver.execute_async_script(CAPTURE_SCRIPT)
+        if 'error' in result:
+            raise RuntimeError(f"Could not capture browser storage: {result['error']}")
+        parts = urlsplit(driver.current_url)
+        return cls(
+            f"{parts.scheme}://{parts.netloc}",
+            cookies=driver.get_cookies(),
+            local_storage=result['local'],
+            session_storage=result['session'],
+            indexed_db=result['indexedDB'],
+            app_version=os.getenv('APP_VERSION') or _version_from_scripts(result['scripts']),
+        )
+
+    def to_app_state(self):
+        return AppState(local_storage=self.local_storage, session_storage=self.session_storage,
+                        indexed_db=self.indexed_db, cookies=self.cookies)
+
+    def restore(self, driver, url=None):
+        """Load url (default: the origin's root) with this state in place"""
+        return seed_state(driver, url or self.origin + '/', self.to_app_state())
+
+    def to_dict(self):
+        return {
+            'origin': self.origin,
+            'app_version': self.app_version,
+            'created_at': self.created_at,
+            'cookies': self.cookies,
+            'local_storage': self.local_storage,
+            'session_storage': self.session_storage,
+            'indexed_db': self.indexed_db,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['origin'], data.get('cookies', ()), data.get('local_storage'), data.get('session_storage'),
+                   data.get('indexed_db'), data.get('app_version'), data.get('created_at'))
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+class SnapshotCache:
+    """On-disk snapshots keyed by name and app version (SNAPSHOT_CACHE_DIR)"""
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.getenv('SNAPSHOT_CACHE_DIR') or os.path.join(CACHE_DIR, 'snapshots')
+
+    def path(self, name, version):
+        return os.path.join(self.directory, f"{name}-{version}.json")
+
+    def get(self, name, version):
+        try:
+            return StateSnapshot.load(self.path(name, version))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def get_or_build(self, name, driver, base_url, build):
+        """Return the cached snapshot for the running app version, running build(driver) on a miss.
+
+        build starts from a clean app at base_url and leaves the driver on the
+        app's origin in the state to capture. Parallel workers wait for the
+        first one to finish building instead of repeating it.
+        """
+        version = os.getenv('APP_VERSION')
+        clean = False
+        if not version:
+            # The version comes from the app's scripts, so the app has to be loaded once anyway
+            seed_state(driver, base_url, AppState(), clean=True)
+            version = app_version(driver)
+            clean = True
+        snapshot = self.get(name, version)
+        if snapshot:
+            return snapshot
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path(name, version) + '.lock', 'w') as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            # Another worker may have built it while we waited for the lock
+            snapshot = self.get(name, version)
+            if snapshot:
+                return snapshot
+            start = time.monotonic()
+            if not clean:
+                seed_state(driver, base_url, AppState(), clean=True)
+            build(driver)
+            snapshot = StateSnapshot.capture(driver)
+            snapshot.app_version = version
+            snapshot.save(self.path(name, version))
+            print(f"Built state snapshot '{name}' for app version {version} in {time.monotonic() - start:.1f}s")
+            return snapshot
@@ -0,0 +1,106 @@
+"""Per-step timing of page-object methods, reported as Allure steps"""
+
+import functools
+import inspect
+import json
+import os
+import time
+from collections import deque
+from .driver_hooks import CommandCounter
+from .wait_engine import WaitEngine
+
+try:
+    import allure
+except Exception:  # Allure may not be installed in some contexts
+    allure = None
+
+
+class StepTimer:
+    """Collects timed steps; enabled by STEP_TIMING=true or allure_matrix(step_timing=True)"""
+
+    enabled = os.getenv('STEP_TIMING', 'false').lower() == 'true'
+    # Only the most recent STEP_RECORDS_MAX steps are kept
+    records = deque(maxlen=int(os.getenv('STEP_RECORDS_MAX', '10000')))
+    _depth = 0
+
+    @classmethod
+    def current_test(cls):
+        return (os.getenv('PYTEST_CURRENT_TEST') or '').split(' ')[0]
+
+    @classmethod
+    def export(cls, path):
+        """Write every recorded step to a JSON file for trend analysis"""
+        with open(path, 'w') as f:
+            json.dump(list(cls.records), f, indent=2)
+        return path
+
+
+def timed_step(func):
+    """Record a page-object method as a timed Allure step with command and wait counts"""
+    if getattr(func, '__timed_step__', False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not StepTimer.enabled:
+            return func(self, *args, **kwargs)
+        name = f"{type(self).__name__}.{func.__name__}"
+        driver = getattr(self, 'driver', None)
+        counter = CommandCounter.for_driver(driver) if driver is not None else None
+        commands_before = counter.count if counter else 0
+        waits_before = WaitEngine.recorded
+        depth = StepTimer._depth
+        StepTimer._depth += 1
+        step = allure.step(name) if allure else None
+        start = time.perf_counter()
+        try:
+            if step:
+                with step:
+                    result = func(self, *args, **kwargs)
+                    _attach(name, start, counter, commands_before, waits_before)
+            else:
+                result = func(self, *args, **kwargs)
+            return result
+        finally:
+            StepTimer._depth -= 1
+            StepTimer.records.append(_measure(name, start, counter, commands_before, waits_before, depth))
+
+    wrapper.__timed_step__ = True
+    return wrapper
+
+
+def _measure(name, start, counter, commands_before, waits_before, depth):
+    return {
+        'test': StepTimer.current_test(),
+        'step': name,
+        'depth': depth,
+        'duration': round(time.perf_counter() - start, 4),
+        'commands': (counter.count - commands_before) if counter else 0,
+        'wait_time': round(sum(r['duration'] for r in WaitEngine.records_since(waits_before)), 4),
+    }
+
+
+def _attach(name, start, counter, commands_before, waits_before):
+    """Attach the step's numbers inside the step so they show next to it in the report"""
+    try:
+        timing = _measure(name, start, counter, commands_before, waits_before, StepTimer._depth - 1)
+        allure.attach(
+            f"{timing['duration']:.3f}s, {timing['commands']} WebDriver command(s), {timing['wait_time']:.3f}s waiting",
+            name='timing',
+            attachment_type=allure.attachment_type.TEXT,
+        )
+    except Exception:
+        # Never fail a test because of reporting
+        pass
+
+
+def instrument_class(cls):
+    """Wrap every public method defined directly on cls with timed_step.
+
+    Generator methods are left alone: their call only creates the generator,
+    so the step would time nothing of the work done while iterating.
+    """
+    for attr, value in list(vars(cls).items()):
+        if not attr.startswith('_') and inspect.isfunction(value) and not inspect.isgeneratorfunction(value):
+            setattr(cls, attr, timed_step(value))
+    return cls
@@ -0,0 +1,184 @@
+"""Local stand-in for the Ollama web UI and its streaming chat backend
+
+Serves a small single-page app exposing the DOM the page objects target
+(/ollama.png responses, 'Select model' dialog, prompt placeholder, the
+data-testid sidebar/menu hooks and the settings page) plus the backend
+endpoints it talks to:
+
+    GET  /api/tags    model list, Ollama format
+    GET  /api/config  stub configuration for the client
+    POST /api/chat    streamed reply in the AI SDK data-stream format (0:"token")
+
+Usage:
+    python -m utils.stub_server --port 3000 --tokens 50 --token-delay-ms 5
+"""
+
+import argparse
+import base64
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stub_app')
+
+# 1x1 transparent PNG used for /ollama.png and /user.png
+PIXEL_PNG = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=='
+)
+
+
+class StubConfig:
+    """Tunable behaviour of the stub backend"""
+
+    def __init__(self, token_count=20, token_delay=0.0, models=None, conversations=0, token_text='token'):
+        self.token_count = token_count
+        self.token_delay = token_delay
+        self.models = models or ['stub-model']
+        self.conversations = conversations
+        self.token_text = token_text
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            token_count=int(os.getenv('STUB_TOKEN_COUNT', '20')),
+            token_delay=float(os.getenv('STUB_TOKEN_DELAY_MS', '0')) / 1000,
+            models=[m for m in os.getenv('STUB_MODELS', 'stub-model').split(',') if m],
+            conversations=int(os.getenv('STUB_CONVERSATIONS', '0')),
+        )
+
+    def tokens(self, prompt=''):
+        """Yield the reply tokens for a prompt"""
+        for i in range(self.token_count):
+            yield f"{self.token_text}{i} " if i < self.token_count - 1 else f"{self.token_text}{i}."
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests for the stub app; the config lives on the server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def config(self):
+        return self.server.stub_config
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path in ('/ollama.png', '/user.png'):
+            self._send(200, PIXEL_PNG, 'image/png')
+        elif path == '/api/tags':
+            self._send_json({'models': [{'name': m, 'model': m} for m in self.config.models]})
+        elif path == '/api/config':
+            self._send_json({'models': self.config.models, 'conversations': self.config.conversations})
+        elif path.startswith('/api/'):
+            self._send(404, b'Not found', 'text/plain')
+        else:
+            # Client-side routes (/, /settings, /c/<id>) all serve the app shell
+            with open(os.path.join(STATIC_DIR, 'index.html'), 'rb') as f:
+                self._send(200, f.read(), 'text/html; charset=utf-8')
+
+    def do_POST(self):
+        path = self.path.split('?', 1)[0]
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        if path != '/api/chat':
+            self._send(404, b'Not found', 'text/plain')
+            return
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            payload = {}
+        messages = payload.get('messages') or [{}]
+        prompt = messages[-1].get('content', '')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        for token in self.config.tokens(prompt):
+            self._write_chunk(f"0:{json.dumps(token)}\n".encode())
+            if self.config.token_delay:
+                time.sleep(self.config.token_delay)
+        self._write_chunk(b'd:{"finishReason":"stop"}\n')
+        self._write_chunk(b'')
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, data):
+        self._send(200, json.dumps(data).encode(), 'application/json')
+
+
+class StubOllamaServer:
+    """Runs the stub app on a background thread"""
+
+    def __init__(self, host='127.0.0.1', port=0, config=None):
+        self.config = config or StubConfig.from_env()
+        self._httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub_config = self.config
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3000)
+    parser.add_argument('--tokens', type=int, default=None)
+    parser.add_argument('--token-delay-ms', type=float, default=None)
+    parser.add_argument('--conversations', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = StubConfig.from_env()
+    if args.tokens is not None:
+        config.token_count = args.tokens
+    if args.token_delay_ms is not None:
+        config.token_delay = args.token_delay_ms / 1000
+    if args.conversations is not None:
+        config.conversations = args.conversations
+
+    server = StubOllamaServer(args.host, args.port, config)
+    print(f"Stub Ollama UI listening on {server.url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+"""Unified explicit-wait engine with per-operation timeouts and timing records"""
+
+import json
+import os
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class TimedWait(WebDriverWait):
+    """WebDriverWait that reports how long every until() call took"""
+
+    def __init__(self, engine, operation, timeout, poll_frequency):
+        super().__init__(engine.driver, timeout, poll_frequency=poll_frequency)
+        self.engine = engine
+        self.operation = operation
+
+    def until(self, method, message='', label=None):
+        start = time.monotonic()
+        try:
+            result = super().until(method, message)
+        except TimeoutException:
+            self.engine.record(self.operation, label or _describe(method), time.monotonic() - start, self._timeout, False)
+            raise
+        self.engine.record(self.operation, label or _describe(method), time.monotonic() - start, self._timeout, True)
+        return result
+
+
+class WaitEngine:
+    """Owns every wait for one driver.
+
+    Implicit waits are disabled so explicit waits never stack with them.
+    Each operation kind has its own timeout; 'optional' is the fast-fail
+    budget for elements that may legitimately be absent. Every wait is
+    recorded so timeouts can be tuned from real durations.
+    """
+
+    DEFAULT_TIMEOUTS = {
+        'default': 10,
+        'presence': 10,
+        'clickable': 10,
+        'ready': 15,
+        'optional': 2,
+    }
+    DEFAULT_POLL_FREQUENCY = 0.2
+
+    # Shared across drivers so a whole session can be exported at once; only the
+    # most recent WAIT_RECORDS_MAX waits are kept so long runs stay bounded
+    records = deque(maxlen=int(os.getenv('WAIT_RECORDS_MAX', '10000')))
+    # Waits recorded so far, including those dropped from records
+    recorded = 0
+    _engines = weakref.WeakKeyDictionary()
+
+    def __init__(self, driver, timeouts=None, poll_frequency=None):
+        self.driver = driver
+        self.timeouts = dict(self.DEFAULT_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.poll_frequency = poll_frequency or self.DEFAULT_POLL_FREQUENCY
+        try:
+            driver.implicitly_wait(0)
+        except Exception as e:
+            print(f"Warning: Could not disable implicit wait: {e}")
+
+    @classmethod
+    def for_driver(cls, driver):
+        """Return the engine bound to driver, creating it on first use"""
+        engine = cls._engines.get(driver)
+        if engine is None:
+            engine = cls._engines[driver] = cls(driver, **cls._env_config())
+        return engine
+
+    @staticmethod
+    def _env_config():
+        timeouts = {}
+        if os.getenv('WAIT_TIMEOUT'):
+            for op in ('default', 'presence', 'clickable', 'ready'):
+                timeouts[op] = float(os.getenv('WAIT_TIMEOUT'))
+        if os.getenv('OPTIONAL_WAIT_TIMEOUT'):
+            timeouts['optional'] = float(os.getenv('OPTIONAL_WAIT_TIMEOUT'))
+        poll = os.getenv('WAIT_POLL_FREQUENCY')
+        return {'timeouts': timeouts, 'poll_frequency': float(poll) if poll else None}
+
+    def wait(self, operation='default', timeout=None, poll_frequency=None):
+        """Return a recording WebDriverWait for the operation kind"""
+        return TimedWait(
+            self,
+            operation,
+            timeout if timeout is not None else self.timeouts.get(operation, self.timeouts['default']),
+            poll_frequency or self.poll_frequency,
+        )
+
+    def until(self, condition, operation='default', label=None, timeout=None, message=''):
+        return self.wait(operation, timeout).until(condition, message, label=label)
+
+    def optional(self, condition, label=None, timeout=None):
+        """Fast-fail wait: return the condition's value, or None if it does not hold in time"""
+        try:
+            return self.wait('optional', timeout).until(condition, label=label)
+        except TimeoutException:
+            return None
+
+    def record(self, operation, label, duration, timeout, success):
+        WaitEngine.recorded += 1
+        self.records.append({
+            'operation': operation,
+            'label': label,
+            'duration': round(duration, 4),
+            'timeout': timeout,
+            'success': success,
+        })
+
+    @classmethod
+    def records_since(cls, mark):
+        """Records added after recorded was mark (as many as are still kept)"""
+        count = min(cls.recorded - mark, len(cls.records))
+        return list(cls.records)[-count:] if count > 0 else []
+
+    @classmethod
+    def summary(cls):
+        """Aggregate recorded waits per operation"""
+        by_operation = {}
+        for rec in cls.records:
+            by_operation.setdefault(rec['operation'], []).append(rec)
+        result = {}
+        for operation, recs in by_operation.items():
+            durations = sorted(r['duration'] for r in recs)
+            result[operation] = {
+                'count': len(recs),
+                'timeouts': sum(1 for r in recs if not r['success']),
+                'mean': round(sum(durations) / len(durations), 4),
+                'p95': durations[min(len(durations) - 1, int(len(durations) * 0.95))],
+                'max': durations[-1],
+            }
+        return result
+
+    @classmethod
+    def export(cls, path):
+        """Write the summary and raw records to a JSON file"""
+        with open(path, 'w') as f:
+            json.dump({'summary': cls.summary(), 'records': list(cls.records)}, f, indent=2)
+        return path
+
+
+# WebDriver's default async script timeout, used when the driver cannot report its own
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+@contextmanager
+def script_timeout(driver, seconds):
+    """Raise the driver's script timeout to at least seconds for the block, then restore it"""
+    try:
+        previous = driver.timeouts.script
+    except Exception:
+        previous = None
+    if previous is None:
+        previous = DEFAULT_SCRIPT_TIMEOUT
+    if previous >= seconds:
+        yield
+        return
+    driver.set_script_timeout(seconds)
+    try:
+        yield
+    finally:
+        driver.set_script_timeout(previous)
+
+
+def _describe(method):
+    """Best-effort label for a wait condition"""
+    # EC helpers close over their locator; surface it when present
+    for cell in getattr(method, '__closure__', None) or ():
+        value = cell.cell_contents
+        if isinstance(value, tuple) and len(value) == 2:
+            return str(value[1])
+    return getattr(method, '__qualname__', repr(method))